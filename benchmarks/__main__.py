@@ -0,0 +1,29 @@
+"""
+Runs all benchmark suites offline and reports ops/sec and allocations per case.
+
+Usage: python -m benchmarks [--scale 1.0] [--repeat 3]
+"""
+
+import argparse
+
+from . import launch, pagination, serialization, signing
+from .runner import print_results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier for the number of calls per case")
+    parser.add_argument("--repeat", type=int, default=3, help="measurements per case, the best one is reported")
+    args = parser.parse_args()
+
+    def number(default: int) -> int:
+        return max(1, int(default * args.scale))
+
+    print_results("Launch", launch.get_results(number(200), args.repeat))
+    print_results("Serialization", serialization.get_results(number(20000), args.repeat))
+    print_results("Pagination", pagination.get_results(number(50), args.repeat))
+    print_results("Signing (RSA 2048)", signing.get_results(2048, number(200), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
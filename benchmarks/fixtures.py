@@ -0,0 +1,248 @@
+"""
+Offline fixtures for the benchmarks: locally generated platform keys, a stub HTTP server and
+framework-independent request/cookie/launch classes.
+"""
+
+import http.server
+import json
+import threading
+import time
+import typing as t
+import uuid
+from collections import abc
+
+from pylti1p3.cookie import CookieService
+from pylti1p3.dynamic_registration import generate_key_pair
+from pylti1p3.message_launch import MessageLaunch
+from pylti1p3.oidc_login import OIDCLogin
+from pylti1p3.redirect import Redirect
+from pylti1p3.registration import Registration
+from pylti1p3.request import Request
+from pylti1p3.session import SessionService
+from pylti1p3.signer import PrivateKeySigner
+from pylti1p3.tool_config import ToolConfDict
+
+ISS = "https://platform.example.com"
+CLIENT_ID = "bench-client"
+DEPLOYMENT_ID = "bench-deployment"
+LAUNCH_URL = "https://tool.example.com/launch/"
+
+# (status, body, headers) by (method, path)
+TRoutes = dict[tuple[str, str], tuple[int, bytes, dict[str, str]]]
+
+
+class StubServer:
+    """
+    HTTP/1.1 server with keep-alive running in a background thread, which answers with canned responses.
+    """
+
+    def __init__(self, routes: TRoutes | None = None, latency: float = 0.0):
+        """
+        :param routes: responses by (method, path)
+        :param latency: delay (sec) before every response, to simulate the network
+        """
+        self.routes: TRoutes = routes or {}
+        self.latency = latency
+        stub = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, Nagle + delayed ACK would add ~40ms per response
+            disable_nagle_algorithm = True
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                status, body, headers = stub.routes.get((self.command, self.path), (404, b"", {}))
+                if stub.latency:
+                    time.sleep(stub.latency)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = _respond
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                pass
+
+        self._server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def add_json(self, method: str, path: str, data: t.Any, headers: dict[str, str] | None = None) -> None:
+        body = json.dumps(data).encode("utf-8")
+        self.routes[(method, path)] = (200, body, dict({"Content-Type": "application/json"}, **(headers or {})))
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class BenchToolConf(ToolConfDict):
+    """
+    Tool config which may simulate the latency of a database query on every registration lookup.
+    """
+
+    query_latency: float = 0.0
+
+    def find_registration_by_issuer(self, iss: str, **kwargs: t.Any) -> Registration:
+        if self.query_latency:
+            time.sleep(self.query_latency)
+        return super().find_registration_by_issuer(iss, **kwargs)
+
+
+class Platform:
+    """
+    Platform's key pair and tool registration used to sign launches and service tokens.
+    """
+
+    def __init__(self, base_url: str, key_size: int = 2048):
+        self.private_key, self.public_key = generate_key_pair(key_size)
+        jwk = dict(Registration.get_jwk(self.public_key))
+        self.kid: str = jwk["kid"]
+        self.jwks = {"keys": [jwk]}
+        self.signer = PrivateKeySigner.from_pem(self.private_key, kid=self.kid)
+        self.tool_private_key, self.tool_public_key = generate_key_pair(key_size)
+        self.base_url = base_url
+
+    def get_tool_conf(self, query_latency: float = 0.0, static_registrations: bool = True) -> BenchToolConf:
+        tool_conf = BenchToolConf(
+            {
+                ISS: {
+                    "client_id": CLIENT_ID,
+                    "auth_login_url": self.base_url + "/authorize",
+                    "auth_token_url": self.base_url + "/token",
+                    "key_set_url": self.base_url + "/jwks",
+                    "key_set": None,
+                    "deployment_ids": [DEPLOYMENT_ID],
+                }
+            }
+        )
+        tool_conf.set_private_key(ISS, self.tool_private_key)
+        tool_conf.set_public_key(ISS, self.tool_public_key)
+        tool_conf.query_latency = query_latency
+        tool_conf.static_registrations = static_registrations
+        return tool_conf
+
+    def get_launch_body(self, nonce: str, roles: abc.Sequence[str] | None = None) -> dict[str, t.Any]:
+        now = int(time.time())
+        return {
+            "iss": ISS,
+            "aud": CLIENT_ID,
+            "sub": "user-1",
+            "iat": now,
+            "exp": now + 3600,
+            "nonce": nonce,
+            "https://purl.imsglobal.org/spec/lti/claim/message_type": "LtiResourceLinkRequest",
+            "https://purl.imsglobal.org/spec/lti/claim/version": "1.3.0",
+            "https://purl.imsglobal.org/spec/lti/claim/deployment_id": DEPLOYMENT_ID,
+            "https://purl.imsglobal.org/spec/lti/claim/target_link_uri": LAUNCH_URL,
+            "https://purl.imsglobal.org/spec/lti/claim/resource_link": {"id": "resource-link-1"},
+            "https://purl.imsglobal.org/spec/lti/claim/roles": list(
+                roles or ["http://purl.imsglobal.org/vocab/lis/v2/membership#Learner"]
+            ),
+            "https://purl.imsglobal.org/spec/lti/claim/context": {"id": "context-1", "title": "Course"},
+        }
+
+    def sign_launch(self, body: abc.Mapping[str, t.Any]) -> str:
+        return self.signer.encode_jwt(body)
+
+
+class BenchRequest(Request):
+    def __init__(self, params: dict[str, str], session: dict[str, t.Any] | None = None, cookies=None):
+        self._params = params
+        self._session = session if session is not None else {}
+        self.cookies: dict[str, str] = cookies if cookies is not None else {}
+
+    @property
+    def session(self):
+        return self._session
+
+    def is_secure(self) -> bool:
+        return True
+
+    def get_param(self, key: str) -> str:
+        return self._params.get(key)  # type: ignore
+
+
+class BenchCookieService(CookieService):
+    def __init__(self, request: BenchRequest):
+        self._request = request
+
+    def get_cookie(self, name: str) -> str | None:
+        return self._request.cookies.get(f"{self._cookie_prefix}-{name}")
+
+    def set_cookie(self, name: str, value: str | int, exp: int | None = 3600):
+        self._request.cookies[f"{self._cookie_prefix}-{name}"] = str(value)
+
+
+class BenchRedirect(Redirect[str]):
+    def __init__(self, location: str):
+        self._location = location
+
+    def do_redirect(self) -> str:
+        return self._location
+
+    def do_js_redirect(self) -> str:
+        return self._location
+
+    def set_redirect_url(self, location: str):
+        self._location = location
+
+    def get_redirect_url(self) -> str:
+        return self._location
+
+
+class BenchOIDCLogin(OIDCLogin[BenchRequest, ToolConfDict, SessionService, BenchCookieService, str]):
+    def __init__(self, request: BenchRequest, tool_config: ToolConfDict):
+        super().__init__(request, tool_config, SessionService(request), BenchCookieService(request))
+
+    def get_redirect(self, url: str) -> Redirect[str]:
+        return BenchRedirect(url)
+
+
+class BenchMessageLaunch(MessageLaunch[BenchRequest, ToolConfDict, SessionService, BenchCookieService]):
+    def __init__(
+        self,
+        request: BenchRequest,
+        tool_config: ToolConfDict,
+        session_service: SessionService | None = None,
+        cookie_service: BenchCookieService | None = None,
+        **kwargs,
+    ):
+        super().__init__(
+            request,
+            tool_config,
+            session_service or SessionService(request),
+            cookie_service or BenchCookieService(request),
+            **kwargs,
+        )
+
+    def _get_request_param(self, key: str) -> str:
+        return self._request.get_param(key)
+
+
+def get_launch_request(platform: Platform, roles: abc.Sequence[str] | None = None) -> BenchRequest:
+    """
+    Request of a launch which passed the OIDC login: the state cookie and the nonce are already stored.
+    """
+    state = "state-" + str(uuid.uuid4())
+    nonce = str(uuid.uuid4())
+    id_token = platform.sign_launch(platform.get_launch_body(nonce, roles))
+    request = BenchRequest({"state": state, "id_token": id_token})
+    request.cookies["lti1p3-" + state] = state
+    request.session["lti1p3-nonce-" + nonce] = True
+    return request
@@ -0,0 +1,166 @@
+"""
+Launch hot paths: MessageLaunch.validate() end to end, MessageLaunch.from_cache, OIDC login redirect,
+message validators and role checks. The platform's key set is served by a local stub server.
+
+Usage: python -m benchmarks.launch [--number 200] [--repeat 3]
+"""
+
+import argparse
+import json
+import typing as t
+from collections import abc
+
+import jwt
+from jwcrypto.jwk import JWK
+
+from pylti1p3.jwks_manager import JwksManager
+from pylti1p3.message_launch import MessageLaunch
+from pylti1p3.message_validators import default_validator_registry
+from pylti1p3.roles import (
+    DesignerRole,
+    ObserverRole,
+    RoleIndex,
+    StaffRole,
+    StudentRole,
+    TeacherRole,
+    TeachingAssistantRole,
+    TransientRole,
+)
+
+from .fixtures import (
+    ISS,
+    LAUNCH_URL,
+    BenchMessageLaunch,
+    BenchOIDCLogin,
+    BenchRequest,
+    Platform,
+    StubServer,
+    get_launch_request,
+)
+from .runner import TBenchmarkResult, add_arguments, print_results, run_benchmark
+
+ROLES = [
+    "http://purl.imsglobal.org/vocab/lis/v2/institution/person#Student",
+    "http://purl.imsglobal.org/vocab/lis/v2/institution/person#Instructor",
+    "http://purl.imsglobal.org/vocab/lis/v2/membership#Instructor",
+    "http://purl.imsglobal.org/vocab/lis/v2/membership/Instructor#TeachingAssistant",
+    "http://purl.imsglobal.org/vocab/lis/v2/system/person#User",
+]
+# Custom parameters of the large launch
+CUSTOM_PARAMS = 500
+ROLE_CLASSES = [StaffRole, StudentRole, TeacherRole, TeachingAssistantRole, DesignerRole, ObserverRole, TransientRole]
+
+
+def _launch_factory(platform: Platform) -> abc.Callable[[], BenchRequest]:
+    # Signing isn't measured: every launch re-uses the token, only the session is fresh
+    request = get_launch_request(platform, ROLES)
+    params = dict(request._params)  # pylint: disable=protected-access
+    session = dict(request.session)
+
+    def get_request() -> BenchRequest:
+        return BenchRequest(params, dict(session), dict(request.cookies))
+
+    return get_request
+
+
+def get_results(number: int, repeat: int) -> list[TBenchmarkResult]:
+    with StubServer() as server:
+        platform = Platform(server.base_url)
+        server.add_json("GET", "/jwks", platform.jwks, {"Cache-Control": "max-age=3600"})
+        tool_conf = platform.get_tool_conf()
+        get_request = _launch_factory(platform)
+        jwks_manager = JwksManager(background_refresh=False)
+
+        def validate_fetch_key_set() -> t.Any:
+            return BenchMessageLaunch(get_request(), tool_conf).validate()
+
+        def validate_jwks_manager() -> t.Any:
+            return BenchMessageLaunch(get_request(), tool_conf).set_jwks_manager(jwks_manager).validate()
+
+        # from_cache of follow-up requests with a tool config which queries a database (1 ms per lookup):
+        # the registration is looked up every time vs. reused from the previous restored launch
+        restored_request = get_request()
+        launch_id = BenchMessageLaunch(restored_request, tool_conf).validate().get_launch_id()
+        lookup_tool_conf = platform.get_tool_conf(query_latency=0.001, static_registrations=False)
+        static_tool_conf = platform.get_tool_conf(query_latency=0.001)
+
+        def from_cache_lookup() -> t.Any:
+            return BenchMessageLaunch.from_cache(launch_id, restored_request, lookup_tool_conf)
+
+        def from_cache_reused() -> t.Any:
+            return BenchMessageLaunch.from_cache(launch_id, restored_request, static_tool_conf)
+
+        login_request = BenchRequest(
+            {
+                "iss": ISS,
+                "login_hint": "user-1",
+                "target_link_uri": LAUNCH_URL,
+                "lti_message_hint": "resource-link-1",
+            }
+        )
+
+        def prepare_redirect_url() -> str:
+            oidc_login = BenchOIDCLogin(login_request, tool_conf)
+            return oidc_login._prepare_redirect_url(LAUNCH_URL)  # pylint: disable=protected-access
+
+        jwt_body = platform.get_launch_body("nonce", ROLES)
+
+        def validate_message() -> None:
+            message_type = jwt_body["https://purl.imsglobal.org/spec/lti/claim/message_type"]
+            validator = default_validator_registry.get_validator(message_type)
+            if validator is not None:
+                validator.validate(jwt_body)
+
+        # id_token of a launch with many custom parameters: the previous path (header and body translated by hand,
+        # then the whole token parsed again by jwt.decode) vs. MessageLaunch, which verifies the signature and claims
+        # of the segments it has already decoded
+        custom_params = {f"param_{i}": f"value {i} " * 8 for i in range(CUSTOM_PARAMS)}
+        large_id_token = platform.sign_launch(
+            dict(jwt_body, **{"https://purl.imsglobal.org/spec/lti/claim/custom": custom_params})
+        )
+        public_jwk = platform.jwks["keys"][0]
+        public_key, key_alg = JWK(**public_jwk).get_op_key("verify"), public_jwk.get("alg", "RS256")
+        large_launch = BenchMessageLaunch(BenchRequest({"id_token": large_id_token}), tool_conf)
+        large_launch.set_auto_validation(enable=False)
+
+        def decode_translate_and_verify() -> t.Any:
+            header_segment, body_segment, _ = large_id_token.split(".")
+            json.loads(MessageLaunch.urlsafe_b64decode(header_segment))
+            json.loads(MessageLaunch.urlsafe_b64decode(body_segment))
+            return jwt.decode(large_id_token, public_key, algorithms=[key_alg], options={"verify_aud": False})
+
+        def decode_message_launch() -> t.Any:
+            launch = large_launch.validate_jwt_format()
+            return launch._verify_jwt_signature(large_id_token, public_key, key_alg)  # pylint: disable=protected-access
+
+        def check_roles() -> list[bool]:
+            return [role_cls(jwt_body).check() for role_cls in ROLE_CLASSES]
+
+        def check_roles_index() -> list[bool]:
+            role_index = RoleIndex(jwt_body["https://purl.imsglobal.org/spec/lti/claim/roles"])
+            return [role_index.check(role_cls) for role_cls in ROLE_CLASSES]
+
+        cases: dict[str, abc.Callable[[], t.Any]] = {
+            "MessageLaunch.validate (fetch JWKS)": validate_fetch_key_set,
+            "MessageLaunch.validate (JwksManager)": validate_jwks_manager,
+            "MessageLaunch.from_cache (lookup)": from_cache_lookup,
+            "MessageLaunch.from_cache (reused)": from_cache_reused,
+            "OIDCLogin._prepare_redirect_url": prepare_redirect_url,
+            f"id_token decode ({CUSTOM_PARAMS} custom params, translate + jwt.decode)": decode_translate_and_verify,
+            f"id_token decode ({CUSTOM_PARAMS} custom params, MessageLaunch single pass)": decode_message_launch,
+            "validate_message": validate_message,
+            f"role checks ({len(ROLE_CLASSES)} roles)": check_roles,
+            f"role checks ({len(ROLE_CLASSES)} roles, RoleIndex)": check_roles_index,
+        }
+        return [run_benchmark(name, func, number, repeat) for name, func in cases.items()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(parser, number=200)
+    args = parser.parse_args()
+    print_results("Launch", get_results(args.number, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+ServiceConnector pagination: NRPS-like pages linked with "Link: rel=next" headers, served by a local stub server.
+
+Prefetch overlaps the next request with the processing of the current page, so here (pages aren't processed)
+it only shows its overhead. Use --latency to simulate network round trips.
+
+Usage: python -m benchmarks.pagination [--number 50] [--repeat 3] [--pages 10] [--page-size 100] [--latency 0.0]
+"""
+
+import argparse
+
+from pylti1p3.service_connector import ServiceConnector
+
+from .fixtures import ISS, Platform, StubServer
+from .runner import TBenchmarkResult, add_arguments, print_results, run_benchmark
+
+SCOPES = ["https://purl.imsglobal.org/spec/lti-nrps/scope/contextmembership.readonly"]
+ACCEPT = "application/vnd.ims.lti-nrps.v2.membershipcontainer+json"
+
+
+def add_pages(server: StubServer, pages: int, page_size: int) -> str:
+    for page in range(pages):
+        members = [
+            {
+                "status": "Active",
+                "user_id": f"user-{page * page_size + i}",
+                "name": f"User {page * page_size + i}",
+                "email": f"user-{page * page_size + i}@example.com",
+                "roles": ["http://purl.imsglobal.org/vocab/lis/v2/membership#Learner"],
+            }
+            for i in range(page_size)
+        ]
+        headers = {"Content-Type": ACCEPT}
+        if page + 1 < pages:
+            headers["Link"] = f'<{server.base_url}/members?page={page + 1}>; rel="next"'
+        server.add_json("GET", f"/members?page={page}", {"id": "context-1", "members": members}, headers)
+    return f"{server.base_url}/members?page=0"
+
+
+def get_results(
+    number: int, repeat: int, pages: int = 10, page_size: int = 100, latency: float = 0.0
+) -> list[TBenchmarkResult]:
+    with StubServer(latency=latency) as server:
+        platform = Platform(server.base_url)
+        server.add_json("POST", "/token", {"access_token": "bench-token", "expires_in": 3600})
+        url = add_pages(server, pages, page_size)
+        registration = platform.get_tool_conf().find_registration_by_issuer(ISS)
+
+        def fetch(prefetch: bool) -> int:
+            connector = ServiceConnector(registration)
+            responses = connector.get_paginated_data(SCOPES, url, accept=ACCEPT, prefetch=prefetch)
+            return sum(len(response["body"]["members"]) for response in responses)
+
+        cases = {
+            f"get_paginated_data ({pages}x{page_size})": lambda: fetch(False),
+            f"get_paginated_data prefetch ({pages}x{page_size})": lambda: fetch(True),
+        }
+        return [run_benchmark(name, func, number, repeat) for name, func in cases.items()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(parser, number=50)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0, help="delay (sec) of every stub server response")
+    args = parser.parse_args()
+    print_results("Pagination", get_results(args.number, args.repeat, args.pages, args.page_size, args.latency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Timing and allocation measurement shared by the benchmark modules.
+"""
+
+import argparse
+import gc
+import timeit
+import tracemalloc
+import typing as t
+from collections import abc
+
+
+class TBenchmarkResult(t.TypedDict):
+    name: str
+    number: int
+    ops_per_second: float
+    ms_per_op: float
+    # Allocations are measured in a separate run, tracemalloc slows down the timed one
+    retained_blocks_per_op: float
+    peak_kib: float
+
+
+def add_arguments(parser: argparse.ArgumentParser, number: int) -> None:
+    parser.add_argument("--number", type=int, default=number, help="calls per measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="measurements per case, the best one is reported")
+
+
+def run_benchmark(name: str, func: abc.Callable[[], t.Any], number: int, repeat: int = 3) -> TBenchmarkResult:
+    """
+    :param name: name of the case
+    :param func: function to measure
+    :param number: calls per measurement
+    :param repeat: number of measurements, the best one is reported
+    :return: TBenchmarkResult
+    """
+    func()  # warm up caches and lazy imports
+    seconds = min(timeit.repeat(func, number=number, repeat=repeat))
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        for _ in range(number):
+            func()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    # Blocks allocated and not yet freed by the end of the run (caches, leaks and garbage awaiting gc)
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+
+    return {
+        "name": name,
+        "number": number,
+        "ops_per_second": number / seconds,
+        "ms_per_op": seconds / number * 1000,
+        "retained_blocks_per_op": blocks / number,
+        "peak_kib": peak / 1024,
+    }
+
+
+def print_results(title: str, results: abc.Iterable[TBenchmarkResult]) -> None:
+    print(title)
+    print(f"{'case':40} {'ops/s':>12} {'ms/op':>10} {'retained/op':>11} {'peak KiB':>10}")
+    for result in results:
+        print(
+            f"{result['name']:40} {result['ops_per_second']:12.1f} {result['ms_per_op']:10.3f} "
+            f"{result['retained_blocks_per_op']:11.1f} {result['peak_kib']:10.1f}"
+        )
+    print()
@@ -0,0 +1,66 @@
+"""
+Serialization of AGS payloads: Grade.get_value() and LineItem.get_value().
+
+Usage: python -m benchmarks.serialization [--number 20000] [--repeat 3]
+"""
+
+import argparse
+import json
+
+from pylti1p3.grade import Grade
+from pylti1p3.lineitem import LineItem
+
+from .runner import TBenchmarkResult, add_arguments, print_results, run_benchmark
+
+
+def get_grade() -> Grade:
+    return (
+        Grade()
+        .set_score_given(8.5)
+        .set_score_maximum(10)
+        .set_activity_progress("Completed")
+        .set_grading_progress("FullyGraded")
+        .set_timestamp("2024-01-01T10:00:00+00:00")
+        .set_user_id("user-1")
+        .set_comment("Well done")
+        .set_extra_claims({"https://canvas.instructure.com/lti/submission": {"new_submission": True}})
+    )
+
+
+def get_lineitem() -> LineItem:
+    return (
+        LineItem()
+        .set_id("https://platform.example.com/api/lti/courses/1/line_items/1")
+        .set_label("Quiz 1")
+        .set_score_maximum(10)
+        .set_resource_id("quiz-1")
+        .set_resource_link_id("resource-link-1")
+        .set_tag("quiz")
+        .set_start_date_time("2024-01-01T00:00:00+00:00")
+        .set_end_date_time("2024-02-01T00:00:00+00:00")
+        .set_submission_review(label="Review", url="https://tool.example.com/review")
+    )
+
+
+def get_results(number: int, repeat: int) -> list[TBenchmarkResult]:
+    grade = get_grade()
+    lineitem = get_lineitem()
+    # Line item as returned by the platform
+    lineitem_data = json.loads(lineitem.get_value())
+    cases = {
+        "Grade.get_value": grade.get_value,
+        "LineItem.get_value": lineitem.get_value,
+        "LineItem(dict).get_value": lambda: LineItem(lineitem_data).get_value(),
+    }
+    return [run_benchmark(name, func, number, repeat) for name, func in cases.items()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(parser, number=20000)
+    args = parser.parse_args()
+    print_results("Serialization", get_results(args.number, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
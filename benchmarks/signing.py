@@ -0,0 +1,53 @@
+"""
+Signing throughput of client assertions: PEM parsed on every call vs. the cached PrivateKeySigner.
+
+Usage: python -m benchmarks.signing [--key-size 4096] [--number 200] [--repeat 3]
+"""
+
+import argparse
+import time
+import uuid
+
+import jwt
+
+from pylti1p3.dynamic_registration import generate_key_pair
+from pylti1p3.signer import PrivateKeySigner
+
+from .runner import TBenchmarkResult, add_arguments, print_results, run_benchmark
+
+
+def get_claims() -> dict[str, str | int]:
+    return {
+        "iss": "client-id",
+        "sub": "client-id",
+        "aud": "https://platform.example.com/token",
+        "iat": int(time.time()) - 5,
+        "exp": int(time.time()) + 60,
+        "jti": "lti-service-token-" + str(uuid.uuid4()),
+    }
+
+
+def get_results(key_size: int, number: int, repeat: int) -> list[TBenchmarkResult]:
+    private_key, _ = generate_key_pair(key_size)
+    signer = PrivateKeySigner.from_pem(private_key, kid="bench")
+
+    cases = {
+        "jwt.encode(PEM)": lambda: jwt.encode(get_claims(), private_key, algorithm="RS256", headers={"kid": "bench"}),
+        "PrivateKeySigner": lambda: signer.encode_jwt(get_claims()),
+        "PrivateKeySigner.from_pem": lambda: PrivateKeySigner.from_pem(private_key, kid="bench").encode_jwt(
+            get_claims()
+        ),
+    }
+    return [run_benchmark(name, func, number, repeat) for name, func in cases.items()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--key-size", type=int, default=4096)
+    add_arguments(parser, number=200)
+    args = parser.parse_args()
+    print_results(f"Signing (RSA {args.key_size})", get_results(args.key_size, args.number, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
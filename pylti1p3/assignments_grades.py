@@ -1,13 +1,23 @@
 """Assignment and Grades Service helpers for AGS requests."""
 
+import hashlib
+import time
 import typing as t
+import typing_extensions as te
 from collections import abc
+from concurrent.futures import ThreadPoolExecutor
 
-from .exception import LtiException
+import requests
+
+from .exception import LtiException, LtiServiceException
+from .launch_data_storage.base import DisableSessionId, LaunchDataStorage
 from .lineitem import LineItem
 from .grade import Grade
 from .lineitem import TLineItem
+from .memory_cache import MemoryCache
+from .retry_policy import RetryPolicy
 from .service_connector import ServiceConnector, TServiceConnectorResponse
+from .utils import add_param_to_url
 
 
 class TAssignmentsGradersData(t.TypedDict, total=False):
@@ -25,15 +35,135 @@ class TAssignmentsGradersData(t.TypedDict, total=False):
     lineitem: str
 
 
+class TPutGradeResult(t.TypedDict):
+    """Outcome of one grade sent by ``put_grades``."""
+
+    grade: Grade
+    lineitem: LineItem | None
+    response: TServiceConnectorResponse | None
+    error: Exception | None
+    attempts: int
+
+
+class TPutGradesStats(t.TypedDict):
+    """Throughput of one ``put_grades`` batch."""
+
+    total: int
+    succeeded: int
+    failed: int
+    retries: int
+    elapsed: float
+    grades_per_second: float
+
+
+class TPutGradesResponse(t.TypedDict):
+    """Per-grade results (in the input order) and stats of a ``put_grades`` batch."""
+
+    results: list[TPutGradeResult]
+    stats: TPutGradesStats
+
+
+class TLineItemIndex(t.TypedDict):
+    """Line items of one context: by id and ids by tag/resourceId/resourceLinkId (first line item wins)."""
+
+    lineitems: dict[str, TLineItem]
+    tag: dict[str, str]
+    resourceId: dict[str, str]
+    resourceLinkId: dict[str, str]
+
+
+# Line item property -> query parameter supported by the line items endpoint
+LINEITEM_FILTERS = {"tag": "tag", "resourceId": "resource_id", "resourceLinkId": "resource_link_id"}
+
+
 class AssignmentsGradesService:
     """Reads, creates, and updates AGS line items and scores."""
 
     _service_connector: ServiceConnector
     _service_data: TAssignmentsGradersData
+    _lineitem_index_cache: MemoryCache[str, TLineItemIndex] | LaunchDataStorage[t.Any] | None = None
+    _lineitem_index_lifetime: int | None = None
+    _lineitem_index_memory_cache: MemoryCache[str, TLineItemIndex] = MemoryCache(maxsize=256)
 
     def __init__(self, service_connector: ServiceConnector, service_data: TAssignmentsGradersData):
         self._service_connector = service_connector
         self._service_data = service_data
+        self._lineitem_index_cache = None
+
+    def set_lineitem_index_caching(
+        self, data_storage: LaunchDataStorage[t.Any] | None = None, lifetime: int | None = 300
+    ) -> te.Self:
+        """
+        Keep an index of the context's line items, so find_lineitem_* lookups don't fetch all line items
+        every time. The index is loaded once and updated by create_lineitem/update_lineitem/delete_lineitem.
+
+        :param data_storage: launch data storage shared by workers. In-process LRU is used if not set
+        :param lifetime: number of seconds to keep the index
+        """
+        self._lineitem_index_cache = data_storage if data_storage is not None else self._lineitem_index_memory_cache
+        self._lineitem_index_lifetime = lifetime
+        return self
+
+    def _get_lineitem_index_cache_key(self) -> str:
+        lineitems_url = str(self._service_data.get("lineitems"))
+        return "lineitem-index-" + hashlib.md5(lineitems_url.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _get_lineitem_index_ids(index: TLineItemIndex) -> dict[str, dict[str, str]]:
+        return {"tag": index["tag"], "resourceId": index["resourceId"], "resourceLinkId": index["resourceLinkId"]}
+
+    @classmethod
+    def _build_lineitem_index(cls, lineitems: abc.Iterable[TLineItem]) -> TLineItemIndex:
+        index: TLineItemIndex = {"lineitems": {}, "tag": {}, "resourceId": {}, "resourceLinkId": {}}
+        index_ids = cls._get_lineitem_index_ids(index)
+        for lineitem in lineitems:
+            lineitem_id = lineitem.get("id")
+            if not lineitem_id:
+                continue
+            index["lineitems"][lineitem_id] = lineitem
+            for prop_name, ids in index_ids.items():
+                prop_value = lineitem.get(prop_name)
+                if prop_value:
+                    ids.setdefault(str(prop_value), lineitem_id)
+        return index
+
+    def _get_cached_lineitem_index(self) -> TLineItemIndex | None:
+        cache_key = self._get_lineitem_index_cache_key()
+        if isinstance(self._lineitem_index_cache, LaunchDataStorage):
+            with DisableSessionId(self._lineitem_index_cache):
+                return self._lineitem_index_cache.get_value(cache_key)
+        if self._lineitem_index_cache is not None:
+            return self._lineitem_index_cache.get(cache_key)
+        return None
+
+    def _cache_lineitem_index(self, index: TLineItemIndex) -> None:
+        cache_key = self._get_lineitem_index_cache_key()
+        if isinstance(self._lineitem_index_cache, LaunchDataStorage):
+            with DisableSessionId(self._lineitem_index_cache):
+                self._lineitem_index_cache.set_value(cache_key, index, self._lineitem_index_lifetime)
+        elif self._lineitem_index_cache is not None:
+            self._lineitem_index_cache.set(cache_key, index, self._lineitem_index_lifetime)
+
+    def _get_lineitem_index(self) -> TLineItemIndex | None:
+        if self._lineitem_index_cache is None:
+            return None
+        index = self._get_cached_lineitem_index()
+        if index is None:
+            index = self._build_lineitem_index(self.iter_lineitems())
+            self._cache_lineitem_index(index)
+        return index
+
+    def _update_lineitem_index(self, lineitem: TLineItem | None = None, removed_id: str | None = None) -> None:
+        # The index is updated only if it is loaded already, otherwise it will be built from the fresh list
+        index = self._get_cached_lineitem_index() if self._lineitem_index_cache is not None else None
+        if index is None:
+            return
+        lineitems = dict(index["lineitems"])
+        if removed_id:
+            lineitems.pop(removed_id, None)
+        if lineitem and lineitem.get("id"):
+            lineitems[lineitem["id"]] = lineitem
+        self._cache_lineitem_index(self._build_lineitem_index(lineitems.values()))
 
     def can_read_lineitem(self) -> bool:
         return (
@@ -62,23 +192,143 @@ class AssignmentsGradesService:
         if not self.can_put_grade():
             raise LtiException("Can't put grade: Missing required scope")
 
+        if lineitem and not lineitem.get_id():
+            lineitem = self.find_or_create_lineitem(lineitem)
+        return self._post_score(grade, self._get_score_url(lineitem))
+
+    def put_grades(
+        self,
+        grades: abc.Iterable[tuple[Grade, LineItem | None]],
+        max_workers: int = 8,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ) -> TPutGradesResponse:
+        """
+        Send many grades to the LTI platform concurrently.
+        Line items without ID are found/created once per batch, all requests share the connector's access token
+        and HTTP session. Requests rejected with HTTP 429/5xx are retried with exponential backoff (``Retry-After``
+        is respected) by the connector's retry policy or, if the connector has none, by a policy built from the
+        arguments below. A failed grade doesn't abort the batch: its error is returned in the results.
+
+        :param grades: iterable of (Grade instance, LineItem instance or None for the default lineitem)
+        :param max_workers: max number of concurrent requests. Keep it below the HTTP session's connection pool
+            size (10 by default for requests) so the connections are reused
+        :param max_retries: max number of retries for one grade (without a connector's retry policy)
+        :param backoff: delay (sec) before the first retry, doubled on every next retry (without a connector's retry
+            policy)
+        :param max_backoff: max delay (sec) between retries (without a connector's retry policy)
+        :return: dict with per-grade results (in the input order) and stats
+        """
+        if not self.can_put_grade():
+            raise LtiException("Can't put grade: Missing required scope")
+
+        start = time.monotonic()
+        results: list[TPutGradeResult] = []
+        jobs: list[tuple[TPutGradeResult, str]] = []
+        resolved_lineitems: dict[str, LineItem | LtiException] = {}
+
+        for grade, lineitem in grades:
+            result: TPutGradeResult = {
+                "grade": grade,
+                "lineitem": lineitem,
+                "response": None,
+                "error": None,
+                "attempts": 0,
+            }
+            results.append(result)
+            try:
+                if lineitem and not lineitem.get_id():
+                    lineitem = self._resolve_lineitem(lineitem, resolved_lineitems)
+                    result["lineitem"] = lineitem
+                jobs.append((result, self._get_score_url(lineitem)))
+            except LtiException as e:
+                result["error"] = e
+
+        if jobs:
+            try:
+                # Fetch the token before the fan-out, so workers don't wait for it one by one
+                self._service_connector.get_access_token(self._service_data["scope"])
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                for result, _ in jobs:
+                    result["error"] = e
+                jobs = []
+        if jobs:
+            # Scores are idempotent (the platform keeps the latest score by its timestamp), so they are retried by
+            # one policy here instead of the connector, which also counts the attempts of every grade
+            retry_policy = self._service_connector.get_retry_policy() or RetryPolicy(
+                max_retries, backoff, max_backoff, retry_statuses=range(500, 600)
+            )
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as executor:
+                for result, score_url in jobs:
+                    executor.submit(self._put_grade_with_retries, result, score_url, retry_policy)
+
+        elapsed = time.monotonic() - start
+        failed = sum(1 for result in results if result["error"] is not None)
+        return {
+            "results": results,
+            "stats": {
+                "total": len(results),
+                "succeeded": len(results) - failed,
+                "failed": failed,
+                "retries": sum(max(result["attempts"] - 1, 0) for result in results),
+                "elapsed": elapsed,
+                "grades_per_second": len(results) / elapsed if elapsed > 0 else 0.0,
+            },
+        }
+
+    def _resolve_lineitem(self, lineitem: LineItem, resolved_lineitems: dict[str, LineItem | LtiException]) -> LineItem:
+        # Line items are resolved sequentially, otherwise concurrent workers could create duplicates
+        key = lineitem.get_value()
+        if key not in resolved_lineitems:
+            try:
+                resolved_lineitems[key] = self.find_or_create_lineitem(lineitem)
+            except LtiException as e:
+                resolved_lineitems[key] = e
+        resolved = resolved_lineitems[key]
+        if isinstance(resolved, LtiException):
+            raise resolved
+        return resolved
+
+    def _put_grade_with_retries(self, result: TPutGradeResult, score_url: str, retry_policy: RetryPolicy) -> None:
+        while True:
+            result["attempts"] += 1
+            try:
+                result["response"] = self._post_score(result["grade"], score_url, retry=False)
+                result["error"] = None
+                return
+            except (LtiServiceException, requests.RequestException) as e:
+                # Connection errors, throttling and server errors are transient
+                result["error"] = e
+                response = e.response if isinstance(e, LtiServiceException) else None
+                status_code = response.status_code if response is not None else None
+                if not retry_policy.should_retry("POST", status_code, result["attempts"], idempotent=True):
+                    return
+                retry_after = response.headers.get("Retry-After") if response is not None else None
+                time.sleep(retry_policy.get_delay(result["attempts"], retry_after))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                result["error"] = e
+                return
+
+    def _get_score_url(self, lineitem: LineItem | None) -> str:
         if lineitem:
-            if not lineitem.get_id():
-                lineitem = self.find_or_create_lineitem(lineitem)
             score_url = lineitem.get_id()
-        elif not lineitem and self._service_data.get("lineitem"):
-            score_url = self._service_data.get("lineitem")
         else:
+            score_url = self._service_data.get("lineitem")
+        if not score_url:
             raise LtiException("Can't find lineitem to put grade")
+        return self._add_url_path_ending(score_url, "scores")
 
-        assert score_url is not None
-        score_url = self._add_url_path_ending(score_url, "scores")
+    def _post_score(self, grade: Grade, score_url: str, retry: bool = True) -> TServiceConnectorResponse:
         return self._service_connector.make_service_request(
             self._service_data["scope"],
             score_url,
             method="POST",
             data=grade.get_value(),
             content_type="application/vnd.ims.lis.v1.score+json",
+            retry=retry,
+            # The platform keeps the latest score by its timestamp, so a score may be sent again
+            idempotent=True,
         )
 
     def get_lineitem(self, lineitem_url: str | None = None):
@@ -126,7 +376,9 @@ class AssignmentsGradesService:
         )
         if not isinstance(lineitem_response["body"], dict):
             raise LtiException("Unknown response type received for update line item")
-        return LineItem(t.cast(TLineItem, lineitem_response["body"]))
+        updated_lineitem = t.cast(TLineItem, lineitem_response["body"])
+        self._update_lineitem_index(updated_lineitem, removed_id=lineitem_url)
+        return LineItem(updated_lineitem)
 
     def delete_lineitem(self, lineitem_url: str | None) -> None:
         """
@@ -148,6 +400,7 @@ class AssignmentsGradesService:
             content_type="application/vnd.ims.lis.v2.lineitem+json",
             accept="application/vnd.ims.lis.v2.lineitem+json",
         )
+        self._update_lineitem_index(removed_id=lineitem_url)
 
     def get_lineitems_page(self, lineitems_url: str | None = None) -> tuple[list, str | None]:
         """
@@ -177,28 +430,50 @@ class AssignmentsGradesService:
 
         :return: list of line item dicts
         """
-        lineitems_url: str | None = self._service_data["lineitems"]
-        lineitems: list[TLineItem] = []
+        return list(self.iter_lineitems())
 
-        if lineitems_url is None:
-            return lineitems
+    def iter_lineitems(
+        self,
+        prefetch: bool = False,
+        tag: str | None = None,
+        resource_id: str | None = None,
+        resource_link_id: str | None = None,
+    ) -> abc.Iterator[TLineItem]:
+        """
+        Iterate over all available line items page by page.
+        Filters are passed to the platform, which may ignore them: check the returned line items.
+
+        :param prefetch: request the next page while the caller processes the current one
+        :param tag: return only line items with this tag (optional)
+        :param resource_id: return only line items with this resource ID (optional)
+        :param resource_link_id: return only line items of this resource link (optional)
+        :return: iterator over line item dicts
+        """
+        lineitems_url = self._service_data.get("lineitems")
+        filters = {"tag": tag, "resource_id": resource_id, "resource_link_id": resource_link_id}
+        for param_name, param_value in filters.items():
+            if lineitems_url and param_value:
+                lineitems_url = add_param_to_url(lineitems_url, param_name, param_value)
 
         lineitem_pages = self._service_connector.get_paginated_data(
             self._service_data["scope"],
             lineitems_url,
             accept="application/vnd.ims.lis.v2.lineitemcontainer+json",
+            prefetch=prefetch,
         )
         for page in lineitem_pages:
             if not isinstance(page["body"], list):
                 raise LtiException("Unknown response type received for line items")
-            lineitems.extend([t.cast(TLineItem, item) for item in page["body"]])
-        return lineitems
+            yield from (t.cast(TLineItem, item) for item in page["body"])
 
     def find_lineitem_satisfying(self, condition: abc.Callable[[TLineItem], bool]) -> LineItem | None:
         """
         Find a line item using an arbitrary predicate.
         """
-        for lineitem_dict in self.get_lineitems():
+        index = self._get_lineitem_index()
+        # Stop fetching pages as soon as the line item is found
+        lineitems = index["lineitems"].values() if index is not None else self.iter_lineitems()
+        for lineitem_dict in lineitems:
             if condition(lineitem_dict):
                 return LineItem(lineitem_dict)
         return None
@@ -211,6 +486,23 @@ class AssignmentsGradesService:
         :param prop_value: property value
         :return: LineItem instance or None
         """
+        index = self._get_lineitem_index()
+        if index is not None and (prop_name == "id" or prop_name in LINEITEM_FILTERS):
+            if prop_name == "id":
+                lineitem_id = prop_value
+            else:
+                lineitem_id = self._get_lineitem_index_ids(index)[prop_name].get(str(prop_value))
+            lineitem_dict = index["lineitems"].get(lineitem_id) if lineitem_id else None
+            return LineItem(lineitem_dict) if lineitem_dict else None
+
+        if index is None and prop_name in LINEITEM_FILTERS:
+            # Let the platform filter the line items
+            lineitems = self.iter_lineitems(**{LINEITEM_FILTERS[prop_name]: prop_value})
+            for lineitem_dict in lineitems:
+                if lineitem_dict.get(prop_name) == prop_value:
+                    return LineItem(lineitem_dict)
+            return None
+
         return self.find_lineitem_satisfying(lambda lineitem: lineitem.get(prop_name) == prop_value)
 
     def find_lineitem_by_id(self, ln_id: str) -> LineItem | None:
@@ -309,7 +601,9 @@ class AssignmentsGradesService:
         )
         if not isinstance(created_lineitem["body"], dict):
             raise LtiException("Unknown response type received for create line item")
-        return LineItem(t.cast(TLineItem, created_lineitem["body"]))
+        lineitem = t.cast(TLineItem, created_lineitem["body"])
+        self._update_lineitem_index(lineitem)
+        return LineItem(lineitem)
 
     def get_grades(self, lineitem: LineItem | None = None) -> list[object]:
         """
@@ -318,6 +612,16 @@ class AssignmentsGradesService:
         :param lineitem: LineItem instance
         :return: list of grade dicts
         """
+        return list(self.iter_grades(lineitem))
+
+    def iter_grades(self, lineitem: LineItem | None = None, prefetch: bool = False) -> abc.Iterator[object]:
+        """
+        Iterate over all grades for the passed line item page by page.
+
+        :param lineitem: LineItem instance
+        :param prefetch: request the next page while the caller processes the current one
+        :return: iterator over grade dicts
+        """
         if not self.can_read_grades():
             raise LtiException("Can't read grades: Missing required scope")
 
@@ -327,20 +631,23 @@ class AssignmentsGradesService:
             lineitem_id = self._service_data.get("lineitem")
 
         if not lineitem_id:
-            return []
+            return iter(())
 
         results_url = self._add_url_path_ending(lineitem_id, "results")
         score_pages = self._service_connector.get_paginated_data(
             self._service_data["scope"],
             results_url,
             accept="application/vnd.ims.lis.v2.resultcontainer+json",
+            prefetch=prefetch,
         )
-        scores: list[object] = []
-        for page in score_pages:
+        return self._iter_page_items(score_pages)
+
+    @staticmethod
+    def _iter_page_items(pages: abc.Iterable[TServiceConnectorResponse]) -> abc.Iterator[object]:
+        for page in pages:
             if not isinstance(page["body"], list):
                 raise LtiException("Unknown response type received for results")
-            scores.extend(page["body"])
-        return scores
+            yield from page["body"]
 
     @staticmethod
     def _add_url_path_ending(url: str, url_path_ending: str) -> str:
@@ -5,3 +5,4 @@ from .message_launch import DjangoMessageLaunch as DjangoMessageLaunch
 from .oidc_login import DjangoOIDCLogin as DjangoOIDCLogin
 from .launch_data_storage.cache import DjangoCacheDataStorage as DjangoCacheDataStorage
 from .lti1p3_tool_config import DjangoDbToolConf as DjangoDbToolConf
+from .jwks import jwks_view_response as jwks_view_response
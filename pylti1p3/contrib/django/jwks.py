@@ -0,0 +1,26 @@
+"""Django response helper for the tool JWKS endpoint."""
+
+from django.http import HttpResponse, HttpResponseNotModified  # type: ignore
+
+from pylti1p3.tool_config import ToolConfAbstract
+from pylti1p3.utils import etag_matches
+
+
+def jwks_view_response(request, tool_conf: ToolConfAbstract, iss: str | None = None, client_id: str | None = None):
+    """
+    Serve the memoized JWKS of the tool, answers 304 when the platform sends the current ETag.
+
+    :param request: django.http.HttpRequest
+    :param tool_conf: tool config
+    :param iss: issuer (all keys when not set)
+    :param client_id: client_id for the issuers with many clients
+    :return: HttpResponse
+    """
+    jwks = tool_conf.get_jwks_response(iss, client_id)
+    if etag_matches(request.headers.get("If-None-Match"), jwks["etag"]):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(jwks["body"], content_type="application/json")
+    response["ETag"] = jwks["etag"]
+    response["Cache-Control"] = jwks["cache_control"]
+    return response
@@ -8,6 +8,7 @@ class DjangoCacheDataStorage(CacheDataStorage):
     """Uses Django's cache backend for launch data storage."""
 
     _cache = None
+    _delete_returns_result = True
 
     def __init__(self, cache_name="default", **kwargs):
         self._cache = caches[cache_name]
@@ -1,16 +1,19 @@
 """Django database-backed tool configuration helpers."""
 
+import copy
 import json
 import typing as t
 import typing_extensions as te
+import uuid
 from collections import abc
 
 from pylti1p3.actions import Action
 from pylti1p3.deployment import Deployment
 from pylti1p3.exception import LtiException
+from pylti1p3.memory_cache import MemoryCache
 from pylti1p3.registration import Registration
 from pylti1p3.request import Request
-from pylti1p3.tool_config.abstract import ToolConfAbstract
+from pylti1p3.tool_config.abstract import TJwksResponse, ToolConfAbstract
 
 if t.TYPE_CHECKING:
     from .models import LtiTool, LtiToolKey
@@ -18,14 +21,35 @@ if t.TYPE_CHECKING:
 default_app_config = "pylti1p3.contrib.django.lti1p3_tool_config.apps.PyLTI1p3ToolConfig"
 
 
+class TToolConfCacheEntry(t.TypedDict):
+    registration: Registration
+    deployments: dict[str, Deployment]
+    version: str
+
+
 class DjangoDbToolConf(ToolConfAbstract):
     """Looks up registrations and deployments from Django models."""
 
-    _lti_tools: dict[str, dict[str, "LtiTool"] | "LtiTool"]
+    _lti_tools: "dict[str, dict[str, LtiTool] | LtiTool]"
     _tools_cls: type["LtiTool"]
     _keys_cls: type["LtiToolKey"]
+    _cache_lifetime: int = 300
+    # Views usually create a new tool config per request, so the registrations are shared by the whole process:
+    # (iss, client_id) -> prebuilt registration and deployments
+    _cache: MemoryCache[tuple[str, str | None], TToolConfCacheEntry] = MemoryCache(maxsize=1024)
+    # Random token replaced in the Django cache when LtiTool/LtiToolKey is changed, so other processes drop their
+    # entries too. A token is never reused, so entries cached before the key was evicted never look valid again
+    _cache_version_key: str = "lti1p3-tool-config-version"
+    # The shared version is read at most once per interval (sec) by each process
+    _cache_version_check_interval: int = 5
+    _cache_versions: MemoryCache[str, str] = MemoryCache(maxsize=16)
+    _jwks_cache: MemoryCache[abc.Hashable, TJwksResponse] = MemoryCache(maxsize=256)
 
-    def __init__(self):
+    def __init__(self, cache_lifetime: int | None = None):
+        """
+        :param cache_lifetime: lifetime (sec) of the process-level registration and JWKS caches, 0 disables them
+            and the reuse of registrations by restored launches
+        """
         # pylint: disable=import-outside-toplevel
         from .models import LtiTool, LtiToolKey
 
@@ -33,6 +57,70 @@ class DjangoDbToolConf(ToolConfAbstract):
         self._lti_tools = {}
         self._tools_cls = LtiTool
         self._keys_cls = LtiToolKey
+        if cache_lifetime is not None:
+            self._cache_lifetime = cache_lifetime
+            self.jwks_cache_lifetime = cache_lifetime
+
+    @property
+    def static_registrations(self) -> bool:  # type: ignore[override]
+        # Restored launches reuse registrations only while the process-level caches are enabled, otherwise changes
+        # made bypassing the model signals (e.g. QuerySet.update()) would be missed
+        return bool(self._cache_lifetime)
+
+    @classmethod
+    def _get_cache_version(cls) -> str:
+        version = cls._cache_versions.get(cls._cache_version_key)
+        if version is not None:
+            return version
+
+        # pylint: disable=import-outside-toplevel
+        from django.core.cache import cache  # type: ignore
+
+        version = cache.get(cls._cache_version_key)
+        if version is None:
+            # Never set or evicted: the first process to add a new token wins
+            new_version = uuid.uuid4().hex
+            cache.add(cls._cache_version_key, new_version, None)
+            version = cache.get(cls._cache_version_key) or new_version
+        cls._cache_versions.set(cls._cache_version_key, version, cls._cache_version_check_interval)
+        return version
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """
+        Drop the cached registrations and JWKS in all processes. Is called automatically when LtiTool or LtiToolKey
+        is saved or deleted.
+        """
+        # pylint: disable=import-outside-toplevel
+        from django.core.cache import cache  # type: ignore
+
+        cls._cache.clear()
+        cls._jwks_cache.clear()
+        version = uuid.uuid4().hex
+        cache.set(cls._cache_version_key, version, None)
+        cls._cache_versions.set(cls._cache_version_key, version, cls._cache_version_check_interval)
+
+    def _get_cache_entry(self, iss: str, client_id: str | None) -> TToolConfCacheEntry:
+        version = self._get_cache_version() if self._cache_lifetime else ""
+        if self._cache_lifetime:
+            entry = self._cache.get((iss, client_id))
+            if entry is not None and entry["version"] == version:
+                return entry
+
+        lti_tool = self.get_lti_tool(iss, client_id)
+        if isinstance(lti_tool, dict):
+            raise LtiException(f"iss {iss} has many client_ids, please provide client_id")
+        deployment_ids: list[str] = json.loads(lti_tool.deployment_ids) if lti_tool.deployment_ids else []
+        entry = {
+            "registration": self._build_registration(lti_tool),
+            "deployments": {
+                deployment_id: Deployment().set_deployment_id(deployment_id) for deployment_id in deployment_ids
+            },
+            "version": version,
+        }
+        if self._cache_lifetime:
+            self._cache.set((iss, client_id), entry, self._cache_lifetime)
+        return entry
 
     @t.overload
     def get_lti_tool(self, iss: str, client_id: str) -> "LtiTool": ...
@@ -50,11 +138,12 @@ class DjangoDbToolConf(ToolConfAbstract):
         if lti_tool:
             return lti_tool
 
+        tools = self._tools_cls.objects.select_related("tool_key")
         if client_id is None:
-            lti_tool = self._tools_cls.objects.filter(issuer=iss, is_active=True).order_by("use_by_default").first()
+            lti_tool = tools.filter(issuer=iss, is_active=True).order_by("use_by_default").first()
         else:
             try:
-                lti_tool = self._tools_cls.objects.get(issuer=iss, client_id=client_id, is_active=True)
+                lti_tool = tools.get(issuer=iss, client_id=client_id, is_active=True)
             except self._tools_cls.DoesNotExist:
                 pass
 
@@ -99,9 +188,10 @@ class DjangoDbToolConf(ToolConfAbstract):
         request: Request | None = None,
         jwt_body: abc.Mapping[str, t.Any] | None = None,
     ) -> Registration:
-        lti_tool = self.get_lti_tool(iss, client_id)
-        if isinstance(lti_tool, dict):
-            raise LtiException(f"iss {iss} has many client_ids, please provide client_id to find registration")
+        # The launch sets the fetched key set on the registration, the cached one must stay intact
+        return copy.copy(self._get_cache_entry(iss, client_id)["registration"])
+
+    def _build_registration(self, lti_tool: "LtiTool") -> Registration:
         auth_audience = lti_tool.auth_audience if lti_tool.auth_audience else None
         key_set = json.loads(lti_tool.key_set) if lti_tool.key_set else None
         key_set_url = lti_tool.key_set_url if lti_tool.key_set_url else None
@@ -121,14 +211,20 @@ class DjangoDbToolConf(ToolConfAbstract):
 
     @te.override
     def find_deployment_by_params(self, iss: str, deployment_id: str, client_id: str | None):
-        lti_tool = self.get_lti_tool(iss, client_id)
-        if isinstance(lti_tool, dict):
-            raise LtiException(f"iss {iss} has many client_ids, please provide client_id to find deployment")
-        deployment_ids: list[str] = json.loads(lti_tool.deployment_ids) if lti_tool.deployment_ids else []
-        if deployment_id not in deployment_ids:
-            return None
-        d = Deployment()
-        return d.set_deployment_id(deployment_id)
+        return self._get_cache_entry(iss, client_id)["deployments"].get(deployment_id)
+
+    @te.override
+    def get_registrations_version(self) -> abc.Hashable:
+        return self._get_cache_version()
+
+    @te.override
+    def get_registrations_cache_key(self) -> abc.Hashable:
+        # Views usually create a new tool config per request, all of them find the same registrations
+        return (type(self), self._get_cache_version())
+
+    @te.override
+    def _get_jwks_cache_key(self, iss: str | None, client_id: str | None) -> abc.Hashable:
+        return (self._get_cache_version(), iss, client_id)
 
     @te.override
     def get_jwks(
@@ -159,3 +255,8 @@ class DjangoDbToolConf(ToolConfAbstract):
                     jwks.append(Registration.get_jwk(key.public_key))
                 public_key_lst.append(key.public_key)
         return {"keys": jwks}
+
+
+def invalidate_tool_conf_cache(*args, **kwargs) -> None:
+    # pylint: disable=unused-argument
+    DjangoDbToolConf.invalidate_cache()
@@ -8,3 +8,16 @@ class PyLTI1p3ToolConfig(AppConfig):
 
     name = "pylti1p3.contrib.django.lti1p3_tool_config"
     verbose_name = "PyLTI 1.3 Tool Config"
+
+    def ready(self):
+        # pylint: disable=import-outside-toplevel
+        from django.db.models.signals import post_delete, post_save  # type: ignore
+
+        from . import invalidate_tool_conf_cache
+        from .models import LtiTool, LtiToolKey
+
+        for model in (LtiTool, LtiToolKey):
+            post_save.connect(invalidate_tool_conf_cache, sender=model, dispatch_uid=f"lti1p3-save-{model.__name__}")
+            post_delete.connect(
+                invalidate_tool_conf_cache, sender=model, dispatch_uid=f"lti1p3-delete-{model.__name__}"
+            )
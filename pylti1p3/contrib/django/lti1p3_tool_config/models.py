@@ -1,6 +1,9 @@
 """Django models that store LTI tool registrations and keys."""
 
 # mypy: ignore-errors
+# Field annotations use django-stubs generics, which aren't subscriptable at runtime
+from __future__ import annotations
+
 import json
 
 from django.core.exceptions import ValidationError
@@ -1,20 +1,19 @@
 """Django-specific access token caching for service requests."""
 
-from math import floor
-
 from django.core.cache import cache  # type: ignore
 
-from pylti1p3.service_connector import ServiceConnector
+from pylti1p3.service_connector import ServiceConnector, TAccessTokenCacheData
 
 
 class DjangoServiceConnector(ServiceConnector):
+    """Keeps access tokens in the Django cache when no access token storage is set."""
+
     def _get_cache_key(self, scope_key: str) -> str:
         return f"lti1p3-access-token-{scope_key}"
 
-    def _get_cached_access_token(self, scope_key: str) -> str | None:
-        token = cache.get(self._get_cache_key(scope_key))
-        return token if isinstance(token, str) else None
+    def _get_local_access_token_cache_data(self, scope_key: str) -> TAccessTokenCacheData | None:
+        token_data = cache.get(self._get_cache_key(scope_key))
+        return token_data if isinstance(token_data, dict) else None
 
-    def _cache_access_token(self, scope_key: str, access_token: str, expires_in: float):
-        expires_in = max(1, expires_in - 10)
-        cache.set(self._get_cache_key(scope_key), access_token, floor(expires_in))
+    def _set_local_access_token_cache_data(self, scope_key: str, token_data: TAccessTokenCacheData, lifetime: int):
+        cache.set(self._get_cache_key(scope_key), token_data, lifetime)
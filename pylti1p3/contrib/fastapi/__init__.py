@@ -7,3 +7,4 @@ from .message_launch import FastAPIMessageLaunch as FastAPIMessageLaunch
 from .oidc_login import FastAPIOIDCLogin as FastAPIOIDCLogin
 from .request import FastAPIRequest as FastAPIRequest
 from .session import FastAPISessionService as FastAPISessionService
+from .jwks import jwks_view_response as jwks_view_response
@@ -0,0 +1,298 @@
+"""Async Assignment and Grades Service helpers for AGS requests."""
+
+import typing as t
+from collections import abc
+
+from pylti1p3.assignments_grades import AssignmentsGradesService, TAssignmentsGradersData
+from pylti1p3.exception import LtiException
+from pylti1p3.grade import Grade
+from pylti1p3.lineitem import LineItem, TLineItem
+from pylti1p3.service_connector import TServiceConnectorResponse
+
+from .async_service_connector import AsyncServiceConnector
+
+
+class AsyncAssignmentsGradesService:
+    """Reads, creates, and updates AGS line items and scores without blocking the event loop."""
+
+    _service_connector: AsyncServiceConnector
+    _service_data: TAssignmentsGradersData
+
+    def __init__(self, service_connector: AsyncServiceConnector, service_data: TAssignmentsGradersData):
+        self._service_connector = service_connector
+        self._service_data = service_data
+
+    def can_read_lineitem(self) -> bool:
+        return (
+            "https://purl.imsglobal.org/spec/lti-ags/scope/lineitem.readonly" in self._service_data["scope"]
+            or "https://purl.imsglobal.org/spec/lti-ags/scope/lineitem" in self._service_data["scope"]
+        )
+
+    def can_create_lineitem(self) -> bool:
+        return "https://purl.imsglobal.org/spec/lti-ags/scope/lineitem" in self._service_data["scope"]
+
+    def can_read_grades(self) -> bool:
+        return "https://purl.imsglobal.org/spec/lti-ags/scope/result.readonly" in self._service_data["scope"]
+
+    def can_put_grade(self) -> bool:
+        return "https://purl.imsglobal.org/spec/lti-ags/scope/score" in self._service_data["scope"]
+
+    async def put_grade(self, grade: Grade, lineitem: LineItem | None = None) -> TServiceConnectorResponse:
+        """
+        Send grade to the LTI platform.
+
+        :param grade: Grade instance
+        :param lineitem: LineItem instance
+        :return: dict with HTTP response body and headers
+        """
+        if not self.can_put_grade():
+            raise LtiException("Can't put grade: Missing required scope")
+
+        if lineitem:
+            if not lineitem.get_id():
+                lineitem = await self.find_or_create_lineitem(lineitem)
+            score_url = lineitem.get_id()
+        elif self._service_data.get("lineitem"):
+            score_url = self._service_data.get("lineitem")
+        else:
+            raise LtiException("Can't find lineitem to put grade")
+
+        assert score_url is not None
+        score_url = AssignmentsGradesService._add_url_path_ending(score_url, "scores")
+        return await self._service_connector.make_service_request(
+            self._service_data["scope"],
+            score_url,
+            method="POST",
+            data=grade.get_value(),
+            content_type="application/vnd.ims.lis.v1.score+json",
+        )
+
+    async def get_lineitem(self, lineitem_url: str | None = None) -> LineItem:
+        """
+        Retrieves an individual lineitem. By default retrieves the lineitem
+        associated with the LTI message.
+
+        :param lineitem_url: endpoint for LTI line item (optional)
+        :return: LineItem instance
+        """
+        if not self.can_read_lineitem():
+            raise LtiException("Can't read lineitem: Missing required scope")
+
+        if lineitem_url is None:
+            lineitem_url = self._service_data["lineitem"]
+
+        lineitem_response = await self._service_connector.make_service_request(
+            self._service_data["scope"],
+            lineitem_url,
+            accept="application/vnd.ims.lis.v2.lineitem+json",
+        )
+        return LineItem(t.cast(TLineItem, lineitem_response["body"]))
+
+    async def update_lineitem(self, lineitem: LineItem) -> LineItem:
+        """
+        Update an individual lineitem. Lineitem to be updated is identified by the lineitem ID.
+
+        :param lineitem: LineItem instance to be updated
+        :return: LineItem instance (updated, based on response from the LTI platform)
+        """
+        if not self.can_create_lineitem():
+            raise LtiException("Can't update lineitem: Missing required scope")
+
+        lineitem_url = lineitem.get_id()
+        if not lineitem_url:
+            raise LtiException("Can't update lineitem: Missing lineitem URL")
+
+        lineitem_response = await self._service_connector.make_service_request(
+            self._service_data["scope"],
+            lineitem_url,
+            method="PUT",
+            data=lineitem.get_value(),
+            content_type="application/vnd.ims.lis.v2.lineitem+json",
+            accept="application/vnd.ims.lis.v2.lineitem+json",
+        )
+        if not isinstance(lineitem_response["body"], dict):
+            raise LtiException("Unknown response type received for update line item")
+        return LineItem(t.cast(TLineItem, lineitem_response["body"]))
+
+    async def delete_lineitem(self, lineitem_url: str | None) -> None:
+        """
+        Delete an individual lineitem.
+
+        :param lineitem_url: endpoint for LTI line item
+        :return: None
+        """
+        if not self.can_create_lineitem():
+            raise LtiException("Can't delete lineitem: Missing required scope")
+
+        if not lineitem_url:
+            raise LtiException("Can't delete lineitem: Missing lineitem URL")
+
+        await self._service_connector.make_service_request(
+            self._service_data["scope"],
+            lineitem_url,
+            method="DELETE",
+            content_type="application/vnd.ims.lis.v2.lineitem+json",
+            accept="application/vnd.ims.lis.v2.lineitem+json",
+        )
+
+    async def get_lineitems_page(self, lineitems_url: str | None = None) -> tuple[list, str | None]:
+        """
+        Get one page with line items.
+
+        :param lineitems_url: LTI platform's URL (optional)
+        :return: tuple in format: (list with line items, next page url)
+        """
+        if not self.can_read_lineitem():
+            raise LtiException("Can't read lineitem: Missing required scope")
+
+        if not lineitems_url:
+            lineitems_url = self._service_data["lineitems"]
+
+        lineitems = await self._service_connector.make_service_request(
+            self._service_data["scope"],
+            lineitems_url,
+            accept="application/vnd.ims.lis.v2.lineitemcontainer+json",
+        )
+        if not isinstance(lineitems["body"], list):
+            raise LtiException("Unknown response type received for line items")
+        return lineitems["body"], lineitems["next_page_url"]
+
+    async def get_lineitems(self) -> list[TLineItem]:
+        """
+        Get list of all available line items.
+
+        :return: list of line item dicts
+        """
+        return [lineitem async for lineitem in self.iter_lineitems()]
+
+    async def iter_lineitems(self, prefetch: bool = False) -> abc.AsyncIterator[TLineItem]:
+        """
+        Iterate over all available line items page by page.
+
+        :param prefetch: request the next page while the caller processes the current one
+        :return: async iterator over line item dicts
+        """
+        lineitem_pages = self._service_connector.get_paginated_data(
+            self._service_data["scope"],
+            self._service_data["lineitems"],
+            accept="application/vnd.ims.lis.v2.lineitemcontainer+json",
+            prefetch=prefetch,
+        )
+        async for page in lineitem_pages:
+            if not isinstance(page["body"], list):
+                raise LtiException("Unknown response type received for line items")
+            for item in page["body"]:
+                yield t.cast(TLineItem, item)
+
+    async def find_lineitem_satisfying(self, condition: abc.Callable[[TLineItem], bool]) -> LineItem | None:
+        """
+        Find a line item using an arbitrary predicate.
+        """
+        # Stop fetching pages as soon as the line item is found
+        async for lineitem_dict in self.iter_lineitems():
+            if condition(lineitem_dict):
+                return LineItem(lineitem_dict)
+        return None
+
+    async def find_lineitem(self, prop_name: str, prop_value: t.Any) -> LineItem | None:
+        """
+        Find line item by some property (ID/Tag).
+
+        :param prop_name: property name
+        :param prop_value: property value
+        :return: LineItem instance or None
+        """
+        return await self.find_lineitem_satisfying(lambda lineitem: lineitem.get(prop_name) == prop_value)
+
+    async def find_or_create_lineitem(
+        self,
+        new_lineitem: LineItem,
+        find_by: str = "tag",
+        condition: abc.Callable[[TLineItem], bool] | None = None,
+    ) -> LineItem:
+        """
+        Try to find line item using ID or Tag. New lime item will be created if nothing is found.
+
+        :param new_lineitem: LineItem instance
+        :param find_by: str ("tag"/"id"/"resource_link_id"/"resource_id")
+        :return: LineItem instance (based on response from the LTI platform)
+        """
+        if condition is None:
+            prop_name, prop_value = {
+                "tag": ("tag", new_lineitem.get_tag()),
+                "id": ("id", new_lineitem.get_id()),
+                "resource_link_id": ("resourceLinkId", new_lineitem.get_resource_link_id()),
+                "resource_id": ("resourceId", new_lineitem.get_resource_id()),
+            }.get(find_by, (None, None))
+            if prop_name is None:
+                raise LtiException('Invalid "find_by" value: ' + str(find_by))
+            if not prop_value:
+                raise LtiException(f"{find_by} value is not specified")
+            lineitem = await self.find_lineitem(prop_name, prop_value)
+        else:
+            lineitem = await self.find_lineitem_satisfying(condition)
+
+        if lineitem:
+            return lineitem
+
+        return await self.create_lineitem(new_lineitem)
+
+    async def create_lineitem(self, new_lineitem: LineItem) -> LineItem:
+        """
+        Create a line item on the platform.
+        """
+        if not self.can_create_lineitem():
+            raise LtiException("Can't create lineitem: Missing required scope")
+
+        created_lineitem = await self._service_connector.make_service_request(
+            self._service_data["scope"],
+            self._service_data["lineitems"],
+            method="POST",
+            data=new_lineitem.get_value(),
+            content_type="application/vnd.ims.lis.v2.lineitem+json",
+            accept="application/vnd.ims.lis.v2.lineitem+json",
+        )
+        if not isinstance(created_lineitem["body"], dict):
+            raise LtiException("Unknown response type received for create line item")
+        return LineItem(t.cast(TLineItem, created_lineitem["body"]))
+
+    async def get_grades(self, lineitem: LineItem | None = None) -> list[object]:
+        """
+        Return all grades for the passed line item (across all users enrolled in the line item's context).
+
+        :param lineitem: LineItem instance
+        :return: list of grade dicts
+        """
+        return [grade async for grade in self.iter_grades(lineitem)]
+
+    async def iter_grades(self, lineitem: LineItem | None = None, prefetch: bool = False) -> abc.AsyncIterator[object]:
+        """
+        Iterate over all grades for the passed line item page by page.
+
+        :param lineitem: LineItem instance
+        :param prefetch: request the next page while the caller processes the current one
+        :return: async iterator over grade dicts
+        """
+        if not self.can_read_grades():
+            raise LtiException("Can't read grades: Missing required scope")
+
+        if lineitem:
+            lineitem_id = lineitem.get_id()
+        else:
+            lineitem_id = self._service_data.get("lineitem")
+
+        if not lineitem_id:
+            return
+
+        results_url = AssignmentsGradesService._add_url_path_ending(lineitem_id, "results")
+        score_pages = self._service_connector.get_paginated_data(
+            self._service_data["scope"],
+            results_url,
+            accept="application/vnd.ims.lis.v2.resultcontainer+json",
+            prefetch=prefetch,
+        )
+        async for page in score_pages:
+            if not isinstance(page["body"], list):
+                raise LtiException("Unknown response type received for results")
+            for grade in page["body"]:
+                yield grade
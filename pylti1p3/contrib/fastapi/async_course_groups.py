@@ -0,0 +1,98 @@
+"""Async Course Groups Service helpers for group and set listings."""
+
+import typing as t
+from collections import abc
+
+from pylti1p3.course_groups import TGroup, TGroupsServiceData, TSet
+from pylti1p3.utils import add_param_to_url
+
+from .async_service_connector import AsyncServiceConnector
+
+
+class AsyncCourseGroupsService:
+    """Fetches group and group-set data for the current launch context without blocking the event loop."""
+
+    _service_connector: AsyncServiceConnector
+    _service_data: TGroupsServiceData
+
+    def __init__(
+        self,
+        service_connector: AsyncServiceConnector,
+        groups_service_data: TGroupsServiceData,
+    ):
+        self._service_connector = service_connector
+        self._service_data = groups_service_data
+
+    async def get_page(self, data_url: str, data_key: str = "groups") -> tuple[list, str | None]:
+        """
+        Get one page with the groups/sets.
+
+        :param data_url
+        :param data_key
+        :return: tuple in format: (list with data items, next page url)
+        """
+        data = await self._service_connector.make_service_request(
+            self._service_data["scope"],
+            data_url,
+            accept="application/vnd.ims.lti-gs.v1.contextgroupcontainer+json",
+        )
+        data_body = t.cast(t.Any, data.get("body", {}))
+        return data_body.get(data_key, []), data["next_page_url"]
+
+    async def _iter_items(self, data_url: str | None, data_key: str, prefetch: bool) -> abc.AsyncIterator[t.Any]:
+        pages = self._service_connector.get_paginated_data(
+            self._service_data["scope"],
+            data_url,
+            accept="application/vnd.ims.lti-gs.v1.contextgroupcontainer+json",
+            prefetch=prefetch,
+        )
+        async for page in pages:
+            data_body = t.cast(t.Any, page.get("body", {}))
+            for item in data_body.get(data_key, []):
+                yield item
+
+    async def get_groups(self, user_id=None):
+        return [group async for group in self.iter_groups(user_id)]
+
+    def iter_groups(self, user_id: str | None = None, prefetch: bool = False) -> abc.AsyncIterator[TGroup]:
+        """
+        Iterate over all groups page by page.
+
+        :param user_id: return only groups of this user (optional)
+        :param prefetch: request the next page while the caller processes the current one
+        :return: async iterator over groups
+        """
+        groups_url = self._service_data.get("context_groups_url")
+        if user_id:
+            groups_url = add_param_to_url(groups_url, "user_id", user_id)
+        return self._iter_items(groups_url, "groups", prefetch)
+
+    def has_sets(self):
+        return "context_group_sets_url" in self._service_data
+
+    def iter_sets(self, prefetch: bool = False) -> abc.AsyncIterator[TSet]:
+        """
+        Iterate over all group sets page by page.
+
+        :param prefetch: request the next page while the caller processes the current one
+        :return: async iterator over sets
+        """
+        return self._iter_items(self._service_data.get("context_group_sets_url"), "sets", prefetch)
+
+    async def get_sets(self, include_groups=False):
+        sets_res_lst = [group_set async for group_set in self.iter_sets()]
+
+        if include_groups and sets_res_lst:
+            set_id_to_index = {}
+            for i, s in enumerate(sets_res_lst):
+                set_id_to_index[s["id"]] = i
+                sets_res_lst[i]["groups"] = []
+
+            groups = await self.get_groups()
+            for group in groups:
+                set_id = group.get("set_id")
+                if set_id and set_id in set_id_to_index:
+                    index = set_id_to_index[set_id]
+                    sets_res_lst[index]["groups"].append(group)
+
+        return sets_res_lst
@@ -0,0 +1,87 @@
+"""Async Names and Roles Provisioning Service helpers."""
+
+import typing as t
+from collections import abc
+
+from pylti1p3.names_roles import TMember, TNamesAndRolesData
+from pylti1p3.service_connector import TServiceConnectorResponse
+from pylti1p3.utils import add_param_to_url
+
+from .async_service_connector import AsyncServiceConnector
+
+
+class AsyncNamesRolesProvisioningService:
+    """Fetches class roster and context data from the platform without blocking the event loop."""
+
+    _service_connector: AsyncServiceConnector
+    _service_data: TNamesAndRolesData
+
+    def __init__(self, service_connector: AsyncServiceConnector, service_data: TNamesAndRolesData):
+        self._service_connector = service_connector
+        self._service_data = service_data
+
+    async def get_nrps_data(self, members_url: str | None = None) -> TServiceConnectorResponse:
+        if not members_url:
+            members_url = self._service_data["context_memberships_url"]
+
+        return await self._service_connector.make_service_request(
+            ["https://purl.imsglobal.org/spec/lti-nrps/scope/contextmembership.readonly"],
+            members_url,
+            accept="application/vnd.ims.lti-nrps.v2.membershipcontainer+json",
+        )
+
+    async def get_members_page(self, members_url: str | None = None) -> tuple[list[TMember], str | None]:
+        """
+        Get one page with the users.
+
+        :param members_url: LTI platform's URL (optional)
+        :return: tuple in format: (list with users, next page url)
+        """
+        data = await self.get_nrps_data(members_url=members_url)
+        data_body = t.cast(t.Any, data.get("body", {}))
+        return data_body.get("members", []), data["next_page_url"]
+
+    async def get_members(self, resource_link_id: str | None = None) -> list[TMember]:
+        """
+        Get list with all users.
+
+        :param resource_link_id: resource link id (optional)
+        :return: list
+        """
+        return [member async for member in self.iter_members(resource_link_id)]
+
+    async def iter_members(
+        self, resource_link_id: str | None = None, prefetch: bool = False
+    ) -> abc.AsyncIterator[TMember]:
+        """
+        Iterate over all users page by page, without keeping the whole roster in memory.
+
+        :param resource_link_id: resource link id (optional)
+        :param prefetch: request the next page while the caller processes the current one
+        :return: async iterator over users
+        """
+        members_url: str | None = self._service_data["context_memberships_url"]
+
+        if members_url and resource_link_id:
+            members_url = add_param_to_url(members_url, "rlid", resource_link_id)
+
+        pages = self._service_connector.get_paginated_data(
+            ["https://purl.imsglobal.org/spec/lti-nrps/scope/contextmembership.readonly"],
+            members_url,
+            accept="application/vnd.ims.lti-nrps.v2.membershipcontainer+json",
+            prefetch=prefetch,
+        )
+        async for page in pages:
+            data_body = t.cast(t.Any, page.get("body", {}))
+            for member in data_body.get("members", []):
+                yield member
+
+    async def get_context(self):
+        """
+        Get context data.
+
+        :return: dict
+        """
+        data = await self.get_nrps_data()
+        data_body = t.cast(t.Any, data.get("body", {}))
+        return data_body.get("context", {})
@@ -0,0 +1,309 @@
+"""Async service connector built on httpx for FastAPI applications."""
+
+import asyncio
+import typing as t
+import weakref
+from collections import abc
+
+import httpx
+
+from pylti1p3.exception import LtiException, LtiServiceException
+from pylti1p3.instrumentation import get_tracer
+from pylti1p3.launch_data_storage.base import LaunchDataStorage
+from pylti1p3.launch_data_storage.session import SessionDataStorage
+from pylti1p3.registration import Registration
+from pylti1p3.service_connector import REQUESTS_USER_AGENT, BaseServiceConnector, TServiceConnectorResponse
+
+
+def _is_http2_available() -> bool:
+    try:
+        import h2  # type: ignore # noqa: F401 # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        return False
+    return True
+
+
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def create_async_http_client(
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 30.0,
+    timeout: float = 30.0,
+    http2: bool | None = None,
+) -> httpx.AsyncClient:
+    """
+    Create an HTTP client with connection pooling and keep-alive.
+    HTTP/2 is enabled when the "h2" package is installed.
+    """
+    return httpx.AsyncClient(
+        http2=_is_http2_available() if http2 is None else http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        timeout=timeout,
+        headers={"User-Agent": REQUESTS_USER_AGENT},
+    )
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Returns the HTTP client shared by all connectors running on the current event loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = create_async_http_client()
+        _http_clients[loop] = client
+    return client
+
+
+async def close_async_http_client() -> None:
+    """
+    Close the shared HTTP client of the current event loop. Call it on the application shutdown.
+    """
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+class AsyncServiceConnector(BaseServiceConnector):
+    """Exchanges service credentials for tokens and performs LTI service calls without blocking the event loop."""
+
+    _http_client: httpx.AsyncClient | None
+
+    # One lock per event loop and scope key, so concurrent requests don't fetch the same token at the same time
+    _access_token_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Lock]]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _background_tasks: set["asyncio.Task[t.Any]"] = set()
+
+    def __init__(self, registration: Registration, http_client: httpx.AsyncClient | None = None):
+        super().__init__(registration)
+        self._http_client = http_client
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        return self._http_client if self._http_client else get_async_http_client()
+
+    @classmethod
+    def _get_access_token_lock(cls, scope_key: str) -> asyncio.Lock:
+        locks = cls._access_token_locks.setdefault(asyncio.get_running_loop(), {})
+        lock = locks.get(scope_key)
+        if lock is None:
+            lock = asyncio.Lock()
+            locks[scope_key] = lock
+        return lock
+
+    @staticmethod
+    async def _call_storage(data_storage: t.Any, func: abc.Callable[..., t.Any], *args: t.Any) -> t.Any:
+        # In-process caches are called directly, shared storages (cache, redis) may block on I/O
+        if not isinstance(data_storage, LaunchDataStorage) or isinstance(data_storage, SessionDataStorage):
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+
+    async def _call_token_storage(self, func: abc.Callable[..., t.Any], *args: t.Any) -> t.Any:
+        return await self._call_storage(self._access_token_cache_data_storage, func, *args)
+
+    async def _call_response_storage(self, func: abc.Callable[..., t.Any], *args: t.Any) -> t.Any:
+        return await self._call_storage(self._response_cache, func, *args)
+
+    def _get_cached_access_token_and_expiry(self, scope_key: str) -> tuple[str | None, bool]:
+        # The cached token and whether it should be refreshed ahead, read in one storage call
+        cached_token = self._get_cached_access_token(scope_key)
+        expires_soon = bool(
+            cached_token and self._access_token_refresh_ahead and self._access_token_expires_soon(scope_key)
+        )
+        return cached_token, expires_soon
+
+    def _refresh_access_token_in_background(self, scopes: t.Sequence[str], scope_key: str) -> None:
+        lock = self._get_access_token_lock(scope_key)
+        if lock.locked():
+            return
+
+        async def refresh():
+            async with lock:
+                if await self._call_token_storage(self._access_token_expires_soon, scope_key):
+                    try:
+                        await self._fetch_access_token_single_flight(scopes, scope_key)
+                    except LtiException:
+                        # The current token is still valid, the next request will try again
+                        pass
+
+        task = asyncio.ensure_future(refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def get_access_token(self, scopes: t.Sequence[str]) -> str:
+        scopes = sorted(scopes)
+        scope_key = self._scope_key(scopes)
+
+        cached_token, expires_soon = await self._call_token_storage(self._get_cached_access_token_and_expiry, scope_key)
+        self._trace_access_token_cache(cached_token)
+        if cached_token:
+            if expires_soon:
+                self._refresh_access_token_in_background(scopes, scope_key)
+            return cached_token
+
+        async with self._get_access_token_lock(scope_key):
+            cached_token = await self._call_token_storage(self._get_cached_access_token, scope_key)
+            if cached_token:
+                return cached_token
+            with get_tracer().start_span("pylti1p3.access_token.fetch"):
+                return await self._fetch_access_token_single_flight(scopes, scope_key)
+
+    async def _fetch_access_token_single_flight(self, scopes: t.Sequence[str], scope_key: str) -> str:
+        if not (self._access_token_cache_data_storage and self._access_token_distributed_lock):
+            return await self._fetch_access_token(scopes, scope_key)
+
+        lock_acquired = await self._call_token_storage(self._acquire_access_token_distributed_lock, scope_key)
+        if not lock_acquired:
+            # Another node is fetching the token right now
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self._access_token_lock_timeout
+            while loop.time() < deadline:
+                await asyncio.sleep(self._access_token_lock_poll_interval)
+                token = await self._call_token_storage(self._get_fresh_access_token, scope_key)
+                if token:
+                    return token
+
+        try:
+            return await self._fetch_access_token(scopes, scope_key)
+        finally:
+            if lock_acquired:
+                await self._call_token_storage(self._release_access_token_distributed_lock, scope_key)
+
+    async def _fetch_access_token(self, scopes: t.Sequence[str], scope_key: str) -> str:
+        auth_url, auth_request = self._get_access_token_request_data(scopes)
+
+        r = await self._send_request("POST", auth_url, idempotent=True, data=auth_request)
+        if not r.is_success:
+            raise LtiServiceException("There was an error while getting an access token from the platform.", r)
+        try:
+            response = r.json()
+        except ValueError as err:
+            raise LtiServiceException("The platform did not return a JSON response for the access token.", r) from err
+
+        await self._call_token_storage(
+            self._cache_access_token,
+            scope_key,
+            response["access_token"],
+            response.get("expires_in", 0),
+        )
+        return response["access_token"]
+
+    async def make_service_request(
+        self,
+        scopes: t.Sequence[str],
+        url: str,
+        method: str = "GET",
+        data: str | None = None,
+        content_type: str = "application/json",
+        accept: str = "application/json",
+        case_insensitive_headers: bool = False,
+        *,
+        retry: bool = True,
+        idempotent: bool | None = None,
+    ) -> TServiceConnectorResponse:
+        """
+        :param retry: retry the request according to the retry policy, disable it if the caller retries itself
+        :param idempotent: whether the request may be repeated after server errors (by default it depends on the
+            method)
+        """
+        self._check_service_request_method(method)
+        access_token = await self.get_access_token(scopes)
+        headers = self._get_service_request_headers(access_token, method, content_type, accept)
+        content = (data or None) if method in ("PUT", "POST") else None
+        cached_response = None
+        if method == "GET":
+            cached_response = await self._call_response_storage(self._get_cached_response, scopes, url, accept)
+            headers.update(self._get_conditional_request_headers(cached_response))
+
+        r = await self._send_request(method, url, retry=retry, idempotent=idempotent, headers=headers, content=content)
+        self._trace_response_cache(method, cached_response, r.status_code)
+        if r.status_code == 304 and cached_response:
+            return self._get_response_from_cache(cached_response, case_insensitive_headers)
+        if not r.is_success:
+            raise LtiServiceException("There was an error making a service request.", r)
+
+        response: TServiceConnectorResponse = {
+            "headers": r.headers if case_insensitive_headers else dict(r.headers),
+            "body": r.json() if r.content else None,
+            "next_page_url": self._get_next_page_url(r.headers.get("link", "")),
+        }
+        if self._response_cache is not None:
+            if method == "GET":
+                await self._call_response_storage(self._cache_response, scopes, url, accept, response)
+            else:
+                await self._call_response_storage(self._invalidate_cached_responses, url)
+        return response
+
+    async def _send_request(
+        self, method: str, url: str, idempotent: bool | None = None, retry: bool = True, **kwargs
+    ) -> httpx.Response:
+        tracer = get_tracer()
+        attempt = 0
+        while True:
+            attempt += 1
+            rate_limiter = self._get_rate_limiter()
+            delay = rate_limiter.reserve() if rate_limiter else 0.0
+            if delay > 0:
+                await asyncio.sleep(delay)
+            with self._start_request_span(method, url, attempt) as span:
+                try:
+                    r: httpx.Response | None = await self._get_http_client().request(method, url, **kwargs)
+                except httpx.TransportError as e:
+                    if not retry or not self._should_retry(method, None, attempt, idempotent):
+                        raise
+                    span.set_attribute("error.type", type(e).__name__)
+                    r = None
+                else:
+                    span.set_attribute("http.response.status_code", r.status_code)
+                    if tracer.enabled:
+                        span.set_attribute("http.response.body.size", len(r.content))
+            if r is None:
+                await asyncio.sleep(self._get_retry_delay(attempt))
+                continue
+            if r.status_code < 400 or not retry or not self._should_retry(method, r.status_code, attempt, idempotent):
+                return r
+            await asyncio.sleep(self._get_retry_delay(attempt, r.headers.get("Retry-After")))
+
+    async def get_paginated_data(
+        self,
+        scopes: t.Sequence[str],
+        url: str | None,
+        *args,
+        prefetch: bool = False,
+        **kwargs,
+    ) -> abc.AsyncGenerator[TServiceConnectorResponse]:
+        """
+        Yields the pages one by one following the "next" links.
+
+        :param prefetch: request the next page in a background task while the caller processes the current one
+        """
+        tracer = get_tracer()
+        if not prefetch:
+            while url:
+                response = await self.make_service_request(scopes, url, *args, **kwargs)
+                tracer.add_counter("pylti1p3.service.pages")
+                yield response
+                url = response["next_page_url"]
+            return
+
+        task = asyncio.ensure_future(self.make_service_request(scopes, url, *args, **kwargs)) if url else None
+        try:
+            while task is not None:
+                response = await task
+                tracer.add_counter("pylti1p3.service.pages")
+                next_page_url = response["next_page_url"]
+                if next_page_url:
+                    task = asyncio.ensure_future(self.make_service_request(scopes, next_page_url, *args, **kwargs))
+                else:
+                    task = None
+                yield response
+        finally:
+            # The caller may stop iterating early, the prefetched page is dropped then
+            if task is not None:
+                task.cancel()
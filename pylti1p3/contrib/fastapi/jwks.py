@@ -0,0 +1,25 @@
+"""FastAPI response helper for the tool JWKS endpoint."""
+
+import fastapi
+
+from pylti1p3.tool_config import ToolConfAbstract
+from pylti1p3.utils import etag_matches
+
+
+def jwks_view_response(
+    request: fastapi.Request, tool_conf: ToolConfAbstract, iss: str | None = None, client_id: str | None = None
+) -> fastapi.Response:
+    """
+    Serve the memoized JWKS of the tool, answers 304 when the platform sends the current ETag.
+
+    :param request: fastapi.Request
+    :param tool_conf: tool config
+    :param iss: issuer (all keys when not set)
+    :param client_id: client_id for the issuers with many clients
+    :return: fastapi.Response
+    """
+    jwks = tool_conf.get_jwks_response(iss, client_id)
+    headers = {"ETag": jwks["etag"], "Cache-Control": jwks["cache_control"]}
+    if etag_matches(request.headers.get("if-none-match"), jwks["etag"]):
+        return fastapi.Response(status_code=304, headers=headers)
+    return fastapi.Response(jwks["body"], media_type="application/json", headers=headers)
@@ -1,25 +1,45 @@
 """FastAPI implementation of the launch validator."""
 
-from typing import Any, TypeVar, override
+import asyncio
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from typing_extensions import Self, override
 
 from requests import Session
 
 from pylti1p3.contrib.fastapi.request import FastAPIRequest
+from pylti1p3.exception import LtiException
+from pylti1p3.instrumentation import get_tracer
 from pylti1p3.message_launch import MessageLaunch
 from pylti1p3.launch_data_storage.base import LaunchDataStorage
-from pylti1p3.service_connector import ServiceConnector
+from pylti1p3.launch_data_storage.session import SessionDataStorage
+from pylti1p3.registration import TKeySet
 from pylti1p3.tool_config.abstract import ToolConfAbstract
 
 from .cookie import FastAPICookieService
 from .service_connector import FastAPIServiceConnector
 from .session import FastAPISessionService
 
+if TYPE_CHECKING:
+    import httpx
+
+    from .async_assignments_grades import AsyncAssignmentsGradesService
+    from .async_course_groups import AsyncCourseGroupsService
+    from .async_names_roles import AsyncNamesRolesProvisioningService
+    from .async_service_connector import AsyncServiceConnector
+
 ToolConfT = TypeVar("ToolConfT", bound=ToolConfAbstract)
+T = TypeVar("T")
 
 
 class FastAPIMessageLaunch(MessageLaunch[FastAPIRequest, ToolConfT, FastAPISessionService, FastAPICookieService]):
     """Wraps a FastAPI request so launch validation can read params and cookies."""
 
+    _service_connector_cls = FastAPIServiceConnector
+    _http_client: "httpx.AsyncClient | None" = None
+    _async_service_connector: "AsyncServiceConnector | None" = None
+
     def __init__(
         self,
         request: FastAPIRequest,
@@ -28,6 +48,7 @@ class FastAPIMessageLaunch(MessageLaunch[FastAPIRequest, ToolConfT, FastAPISessi
         cookie_service: FastAPICookieService | None = None,
         launch_data_storage: LaunchDataStorage[Any] | None = None,
         requests_session: Session | None = None,
+        http_client: "httpx.AsyncClient | None" = None,
     ) -> None:
         cookie_service = cookie_service if cookie_service else FastAPICookieService(request)
         session_service = session_service if session_service else FastAPISessionService(request)
@@ -39,6 +60,8 @@ class FastAPIMessageLaunch(MessageLaunch[FastAPIRequest, ToolConfT, FastAPISessi
             launch_data_storage,
             requests_session,
         )
+        self._http_client = http_client
+        self._async_service_connector = None
 
     @override
     def _get_request_param(self, key: str) -> str:
@@ -48,6 +71,150 @@ class FastAPIMessageLaunch(MessageLaunch[FastAPIRequest, ToolConfT, FastAPISessi
         raise ValueError(f"Missing request param: {key}")
 
     @override
-    def get_service_connector(self) -> ServiceConnector:
+    def _reset_service_connectors(self) -> None:
+        super()._reset_service_connectors()
+        self._async_service_connector = None
+
+    async def _call_storage(self, data_storage: LaunchDataStorage[Any] | None, func: Callable[..., T], *args: Any) -> T:
+        # Session storage lives in the request, other storages (cache, redis) may block on I/O
+        if data_storage is None or isinstance(data_storage, SessionDataStorage):
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+
+    async def validate_async(self) -> Self:
+        """
+        Async version of validate(). The JWKS is fetched with httpx and the launch data storage
+        is accessed in a worker thread, so the event loop is never blocked.
+        """
+        if self._restored:
+            raise LtiException("Can't validate restored launch")
+        self._validated = True
+        data_storage = self._session_service.data_storage
+        tracer = get_tracer()
+        try:
+            with tracer.start_span("pylti1p3.launch.validate"):
+                with tracer.start_span("pylti1p3.launch.validate_state"):
+                    await self._call_storage(data_storage, self.validate_state)
+                with tracer.start_span("pylti1p3.launch.validate_jwt_format"):
+                    self.validate_jwt_format()
+                with tracer.start_span("pylti1p3.launch.validate_registration"):
+                    self.validate_registration()
+                with tracer.start_span("pylti1p3.launch.validate_jwt_signature"):
+                    await self.validate_jwt_signature_async()
+                with tracer.start_span("pylti1p3.launch.validate_nonce"):
+                    await self._call_storage(data_storage, self.validate_nonce)
+                with tracer.start_span("pylti1p3.launch.validate_deployment"):
+                    self.validate_deployment()
+                with tracer.start_span("pylti1p3.launch.validate_message"):
+                    self.validate_message()
+                with tracer.start_span("pylti1p3.launch.save_launch_data"):
+                    await self._call_storage(data_storage, self.save_launch_data)
+        except Exception:
+            self._validated = False
+            raise
+        return self
+
+    async def fetch_public_key_async(self, key_set_url: str) -> TKeySet:
+        # pylint: disable=import-outside-toplevel
+        import httpx
+
+        from .async_service_connector import get_async_http_client
+
+        cache_key = self._get_key_set_cache_key(key_set_url)
+        data_storage = self._public_key_cache_data_storage
+        public_key = await self._call_storage(data_storage, self._get_cached_key_set, cache_key)
+        tracer = get_tracer()
+        if data_storage and tracer.enabled:
+            tracer.add_counter("pylti1p3.public_key.cache", attributes={"result": "hit" if public_key else "miss"})
+        if public_key:
+            return public_key
+
+        http_client = self._http_client if self._http_client else get_async_http_client()
+        with tracer.start_span(
+            "pylti1p3.http.request", {"http.request.method": "GET", "url.full": key_set_url}
+        ) as span:
+            try:
+                resp = await http_client.get(key_set_url)
+            except httpx.HTTPError as e:
+                raise LtiException(f"Error during fetch URL {key_set_url}: {str(e)}") from e
+            span.set_attribute("http.response.status_code", resp.status_code)
+            span.set_attribute("http.response.body.size", len(resp.content))
+        try:
+            public_key = resp.json()
+        except ValueError as e:
+            raise LtiException(f"Invalid response from {key_set_url}. Must be JSON: {resp.text}") from e
+        await self._call_storage(data_storage, self._cache_key_set, cache_key, public_key)
+        return public_key
+
+    async def _get_public_key_set_async(self) -> TKeySet:
+        assert self._registration is not None, "Registration not yet set"
+        public_key_set = self._registration.get_key_set()
+
+        if not public_key_set and self._jwks_manager:
+            kid = self._jwt.get("header", {}).get("kid", None)
+            public_key_set = self._jwks_manager.get_cached_key_set(self._get_key_set_url(), kid)
+            # The manager blocks only when the key set must be (re)fetched
+            return public_key_set if public_key_set else await asyncio.to_thread(self._get_public_key_set)
+        if not public_key_set:
+            public_key_set = await self.fetch_public_key_async(self._get_key_set_url())
+            self._registration.set_key_set(public_key_set)
+
+        return public_key_set
+
+    async def get_public_key_object_async(self) -> tuple[Any, str]:
+        key, key_alg = self._find_public_jwk(await self._get_public_key_set_async())
+        return self._load_public_key_object(key, key_alg), key_alg
+
+    async def validate_jwt_signature_async(self) -> Self:
+        id_token = self._get_id_token()
+        public_key, key_alg = await self.get_public_key_object_async()
+        return self._verify_jwt_signature(id_token, public_key, key_alg)
+
+    def get_async_service_connector(self) -> "AsyncServiceConnector":
+        """
+        Returns the async service connector for the current launch. Requires the "httpx" package.
+
+        :return: AsyncServiceConnector
+        """
+        # pylint: disable=import-outside-toplevel
+        from .async_service_connector import AsyncServiceConnector
+
         assert self._registration is not None, "Registration not yet set"
-        return FastAPIServiceConnector(self._registration, self._requests_session)
+        if self._async_service_connector is None:
+            connector = AsyncServiceConnector(self._registration, self._http_client)
+            self._configure_service_connector(connector)
+            self._async_service_connector = connector
+        return self._async_service_connector
+
+    def get_async_nrps(self) -> "AsyncNamesRolesProvisioningService":
+        """
+        Fetches an instance of the async names and roles service for the current launch.
+
+        :return: AsyncNamesRolesProvisioningService
+        """
+        # pylint: disable=import-outside-toplevel
+        from .async_names_roles import AsyncNamesRolesProvisioningService
+
+        return AsyncNamesRolesProvisioningService(self.get_async_service_connector(), self._get_nrps_service_data())
+
+    def get_async_ags(self) -> "AsyncAssignmentsGradesService":
+        """
+        Fetches an instance of the async assignments and grades service for the current launch.
+
+        :return: AsyncAssignmentsGradesService
+        """
+        # pylint: disable=import-outside-toplevel
+        from .async_assignments_grades import AsyncAssignmentsGradesService
+
+        return AsyncAssignmentsGradesService(self.get_async_service_connector(), self._get_ags_service_data())
+
+    def get_async_cgs(self) -> "AsyncCourseGroupsService":
+        """
+        Fetches an instance of the async course groups service for the current launch.
+
+        :return: AsyncCourseGroupsService
+        """
+        # pylint: disable=import-outside-toplevel
+        from .async_course_groups import AsyncCourseGroupsService
+
+        return AsyncCourseGroupsService(self.get_async_service_connector(), self._get_cgs_service_data())
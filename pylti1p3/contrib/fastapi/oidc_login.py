@@ -1,6 +1,8 @@
 """FastAPI implementation of the OIDC login redirect builder."""
 
-from typing import Any, override
+from typing import Any
+
+from typing_extensions import override
 
 import fastapi
 from fastapi.responses import HTMLResponse
@@ -7,3 +7,4 @@ from .message_launch import FlaskMessageLaunch as FlaskMessageLaunch
 from .request import FlaskRequest as FlaskRequest
 from .session import FlaskSessionService as FlaskSessionService
 from .launch_data_storage.cache import FlaskCacheDataStorage as FlaskCacheDataStorage
+from .jwks import jwks_view_response as jwks_view_response
@@ -0,0 +1,23 @@
+"""Flask response helper for the tool JWKS endpoint."""
+
+from flask import Response  # type: ignore
+
+from pylti1p3.tool_config import ToolConfAbstract
+from pylti1p3.utils import etag_matches
+
+
+def jwks_view_response(request, tool_conf: ToolConfAbstract, iss: str | None = None, client_id: str | None = None):
+    """
+    Serve the memoized JWKS of the tool, answers 304 when the platform sends the current ETag.
+
+    :param request: flask.request
+    :param tool_conf: tool config
+    :param iss: issuer (all keys when not set)
+    :param client_id: client_id for the issuers with many clients
+    :return: flask.Response
+    """
+    jwks = tool_conf.get_jwks_response(iss, client_id)
+    headers = {"ETag": jwks["etag"], "Cache-Control": jwks["cache_control"]}
+    if etag_matches(request.headers.get("If-None-Match"), jwks["etag"]):
+        return Response(status=304, headers=headers)
+    return Response(jwks["body"], mimetype="application/json", headers=headers)
@@ -7,7 +7,17 @@ class FlaskCacheDataStorage(CacheDataStorage):
     """Uses Flask-compatible cache storage for launch data."""
 
     _cache = None
+    _delete_returns_result = True
 
     def __init__(self, cache, **kwargs):
         self._cache = cache
         super().__init__(cache, **kwargs)
+
+    def get_many(self, keys):
+        # Flask-Caching API: get_many(*keys) -> [value, ...]
+        prepared_keys = self._prepare_keys(keys)
+        values = self._get_cache().get_many(*prepared_keys)
+        return {key: value for key, value in zip(prepared_keys.values(), values) if value is not None}
+
+    def delete_many(self, keys):
+        self._get_cache().delete_many(*self._prepare_keys(keys))
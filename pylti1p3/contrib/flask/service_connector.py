@@ -1,25 +1,15 @@
 """Flask-specific access token caching for service requests."""
 
-from datetime import datetime, timedelta
-
-from pylti1p3.service_connector import ServiceConnector
+from pylti1p3.service_connector import ServiceConnector, TAccessTokenCacheData
 
 
 class FlaskServiceConnector(ServiceConnector):
-    access_tokens: dict[str, tuple[str, datetime]] = {}
+    """Shares access tokens between the launches of the process when no access token storage is set."""
 
-    def _get_cached_access_token(self, scope_key: str) -> str | None:
-        cached_token = self.__class__.access_tokens.get(scope_key)
-        if cached_token is None:
-            return None
+    access_tokens: dict[str, TAccessTokenCacheData] = {}
 
-        token, expires_at = cached_token
-        if expires_at > datetime.now():
-            return token
-        return None
+    def _get_local_access_token_cache_data(self, scope_key: str) -> TAccessTokenCacheData | None:
+        return self.__class__.access_tokens.get(scope_key)
 
-    def _cache_access_token(self, scope_key: str, access_token: str, expires_in: float):
-        self.__class__.access_tokens[scope_key] = (
-            access_token,
-            datetime.now() + timedelta(seconds=expires_in),
-        )
+    def _set_local_access_token_cache_data(self, scope_key: str, token_data: TAccessTokenCacheData, lifetime: int):
+        self.__class__.access_tokens[scope_key] = token_data
@@ -2,6 +2,7 @@
 
 import typing as t
 import typing_extensions as te
+from collections import abc
 
 from .utils import add_param_to_url
 from .service_connector import ServiceConnector
@@ -69,28 +70,47 @@ class CourseGroupsService:
         data_body = t.cast(t.Any, data.get("body", {}))
         return data_body.get(data_key, []), data["next_page_url"]
 
+    def _iter_items(self, data_url: str | None, data_key: str, prefetch: bool) -> abc.Iterator[t.Any]:
+        pages = self._service_connector.get_paginated_data(
+            self._service_data["scope"],
+            data_url,
+            accept="application/vnd.ims.lti-gs.v1.contextgroupcontainer+json",
+            prefetch=prefetch,
+        )
+        for page in pages:
+            data_body = t.cast(t.Any, page.get("body", {}))
+            yield from data_body.get(data_key, [])
+
     def get_groups(self, user_id=None):
-        groups_res_lst = []
+        return list(self.iter_groups(user_id))
+
+    def iter_groups(self, user_id: str | None = None, prefetch: bool = False) -> abc.Iterator[TGroup]:
+        """
+        Iterate over all groups page by page.
+
+        :param user_id: return only groups of this user (optional)
+        :param prefetch: request the next page while the caller processes the current one
+        :return: iterator over groups
+        """
         groups_url = self._service_data.get("context_groups_url")
         if user_id:
             groups_url = add_param_to_url(groups_url, "user_id", user_id)
-
-        while groups_url:
-            groups, groups_url = self.get_page(groups_url, data_key="groups")
-            groups_res_lst.extend(groups)
-
-        return groups_res_lst
+        return self._iter_items(groups_url, "groups", prefetch)
 
     def has_sets(self):
         return "context_group_sets_url" in self._service_data
 
-    def get_sets(self, include_groups=False):
-        sets_res_lst = []
-        sets_url = self._service_data.get("context_group_sets_url")
+    def iter_sets(self, prefetch: bool = False) -> abc.Iterator[TSet]:
+        """
+        Iterate over all group sets page by page.
+
+        :param prefetch: request the next page while the caller processes the current one
+        :return: iterator over sets
+        """
+        return self._iter_items(self._service_data.get("context_group_sets_url"), "sets", prefetch)
 
-        while sets_url:
-            sets, sets_url = self.get_page(sets_url, data_key="sets")
-            sets_res_lst.extend(sets)
+    def get_sets(self, include_groups=False):
+        sets_res_lst = list(self.iter_sets())
 
         if include_groups and sets_res_lst:
             set_id_to_index = {}
@@ -5,7 +5,6 @@ import typing as t
 import typing_extensions as te
 import uuid
 
-import jwt  # type: ignore
 from .deep_link_resource import DeepLinkResource
 from .registration import Registration
 
@@ -61,19 +60,7 @@ class DeepLink:
         return message_jwt
 
     def encode_jwt(self, message):
-        headers = None
-        kid = self._registration.get_kid()
-        if kid:
-            headers = {"kid": kid}
-        encoded_jwt = jwt.encode(
-            message,
-            self._registration.get_tool_private_key(),
-            algorithm="RS256",
-            headers=headers,
-        )
-        if isinstance(encoded_jwt, bytes):
-            return encoded_jwt.decode("utf-8")
-        return encoded_jwt
+        return self._registration.get_signer().encode_jwt(message)
 
     def get_response_jwt(self, resources: t.Sequence[DeepLinkResource]) -> str:
         message_jwt = self.get_message_jwt(resources)
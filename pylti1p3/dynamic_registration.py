@@ -1,5 +1,7 @@
 """Helpers for the LTI dynamic registration flow."""
 
+import contextlib
+from collections.abc import Iterator
 from typing import Any
 
 from cryptography.hazmat.primitives import serialization
@@ -8,6 +10,7 @@ import requests
 from requests.exceptions import RequestException
 
 from .exception import LtiException, LtiServiceException
+from .session_registry import REQUESTS_USER_AGENT, SessionRegistry, default_session_registry
 
 
 def generate_key_pair(key_size: int = 4096) -> tuple[str, str]:
@@ -43,9 +46,28 @@ class DynamicRegistration:
     description = ""
     response_types = ["id_token"]
     grant_types = ["implicit", "client_credentials"]
+    _session_registry: SessionRegistry | None = default_session_registry
 
     def get_request_session(self) -> requests.Session:
-        return requests.Session()
+        """
+        Returns a new session for the requests of the registration, it is closed once they are sent.
+        Unless this method is overridden, requests go through the session registry instead.
+
+        :return: requests.Session
+        """
+        session = requests.Session()
+        session.headers["User-Agent"] = REQUESTS_USER_AGENT
+        return session
+
+    @contextlib.contextmanager
+    def _open_request_session(self, url: str) -> Iterator[requests.Session]:
+        get_request_session = type(self).get_request_session
+        if self._session_registry is not None and get_request_session is DynamicRegistration.get_request_session:
+            # Shared session of the platform: kept open for the following launches
+            yield self._session_registry.get_session(url)
+        else:
+            with self.get_request_session() as session:
+                yield session
 
     def get_client_name(self) -> str:
         return self.client_name
@@ -116,7 +138,7 @@ class DynamicRegistration:
     def get_openid_configuration(self) -> dict[str, Any]:
         openid_configuration_endpoint = self.get_openid_configuration_endpoint()
 
-        with self.get_request_session() as session:
+        with self._open_request_session(openid_configuration_endpoint) as session:
             response = session.get(openid_configuration_endpoint)
             try:
                 return response.json()
@@ -140,36 +162,36 @@ class DynamicRegistration:
 
         openid_configuration = self.get_openid_configuration()
 
-        with self.get_request_session() as session:
-            assert "registration_endpoint" in openid_configuration, (
-                "The OpenID config does not have a registration endpoint."
-            )
-            registration_endpoint = openid_configuration["registration_endpoint"]
-            registration_data = self.lti_registration_data()
+        assert "registration_endpoint" in openid_configuration, (
+            "The OpenID config does not have a registration endpoint."
+        )
+        registration_endpoint = openid_configuration["registration_endpoint"]
+        registration_data = self.lti_registration_data()
 
-            headers = {"Accept": "application/json"}
-            if registration_token is not None:
-                headers["Authorization"] = "Bearer " + registration_token
+        headers = {"Accept": "application/json"}
+        if registration_token is not None:
+            headers["Authorization"] = "Bearer " + registration_token
 
+        with self._open_request_session(registration_endpoint) as session:
             response = session.post(
                 registration_endpoint,
                 headers=headers,
                 json=registration_data,
             )
 
-            if not response.ok:
-                raise LtiServiceException(
-                    "The registration endpoint returned an error response.",
-                    response,
-                )
+        if not response.ok:
+            raise LtiServiceException(
+                "The registration endpoint returned an error response.",
+                response,
+            )
 
-            try:
-                openid_registration = response.json()
-            except ValueError as err:
-                raise LtiServiceException(
-                    "The registration endpoint did not return a JSON object.",
-                    response,
-                ) from err
+        try:
+            openid_registration = response.json()
+        except ValueError as err:
+            raise LtiServiceException(
+                "The registration endpoint did not return a JSON object.",
+                response,
+            ) from err
 
         conf_spec = "https://purl.imsglobal.org/spec/lti-platform-configuration"
         assert conf_spec in openid_configuration, "The OpenID config is not an LTI platform configuration"
@@ -1,7 +1,12 @@
 """Exception types raised by the LTI launch and service flow."""
 
+import typing as t
+
 import requests
 
+if t.TYPE_CHECKING:
+    import httpx
+
 
 class LtiException(Exception):
     """Base exception for tool-side LTI failures."""
@@ -24,7 +29,11 @@ class OIDCException(LtiException):
 class LtiServiceException(LtiException):
     """Wraps failed outbound service calls to the platform."""
 
-    def __init__(self, message: str, response: requests.Response):
+    def __init__(self, message: str, response: "requests.Response | httpx.Response"):
+        """
+        :param message: error message
+        :param response: response of the platform, from requests or from httpx (async connector)
+        """
         msg = f"{message} HTTP response [{response.url}]: {response.status_code}"
         super().__init__(msg)
         self.response = response
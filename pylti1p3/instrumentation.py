@@ -0,0 +1,181 @@
+"""Timed spans and counters emitted on the library's hot paths. The default tracer does nothing."""
+
+import time
+import typing as t
+from collections import abc
+
+TAttributeValue = str | int | float | bool | None
+
+
+class TSpanData(t.TypedDict):
+    name: str
+    attributes: dict[str, TAttributeValue]
+    duration: float
+    error: BaseException | None
+
+
+class Span:
+    """
+    Span of the default tracer: does nothing. Spans are context managers, the time between
+    ``__enter__`` and ``__exit__`` is the duration of the span.
+    """
+
+    def set_attribute(self, key: str, value: TAttributeValue) -> None:
+        pass
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+
+_NOOP_SPAN = Span()
+
+
+class Tracer:
+    """
+    Default tracer: spans and counters are dropped. Subclasses receive the span of every ``validate_*`` step of
+    the launch, every HTTP request to the platform, access token fetches, launch data storage access and counters
+    of cache hits/misses and fetched pages.
+    """
+
+    # Callers skip the preparation of attributes when the tracer is disabled
+    enabled: bool = False
+
+    def start_span(self, name: str, attributes: dict[str, TAttributeValue] | None = None) -> Span:
+        # pylint: disable=unused-argument
+        return _NOOP_SPAN
+
+    def add_counter(self, name: str, value: int = 1, attributes: dict[str, TAttributeValue] | None = None) -> None:
+        pass
+
+
+class _TimedSpan(Span):
+    def __init__(
+        self,
+        name: str,
+        attributes: dict[str, TAttributeValue] | None,
+        on_span: abc.Callable[[TSpanData], None],
+    ):
+        self._name = name
+        self._attributes = dict(attributes or {})
+        self._on_span = on_span
+        self._started_at = 0.0
+
+    def set_attribute(self, key: str, value: TAttributeValue) -> None:
+        self._attributes[key] = value
+
+    def __enter__(self) -> "_TimedSpan":
+        self._started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._on_span(
+            {
+                "name": self._name,
+                "attributes": self._attributes,
+                "duration": time.perf_counter() - self._started_at,
+                "error": exc_value,
+            }
+        )
+
+
+class CallbackTracer(Tracer):
+    """
+    Passes finished spans and counters to callbacks, e.g. to write them to logs or metrics.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        on_span: abc.Callable[[TSpanData], None] | None = None,
+        on_counter: abc.Callable[[str, int, dict[str, TAttributeValue]], None] | None = None,
+    ):
+        """
+        :param on_span: called with the data of every finished span
+        :param on_counter: called with the name, value and attributes of every counter increment
+        """
+        self._on_span = on_span
+        self._on_counter = on_counter
+
+    def start_span(self, name: str, attributes: dict[str, TAttributeValue] | None = None) -> Span:
+        if self._on_span is None:
+            return _NOOP_SPAN
+        return _TimedSpan(name, attributes, self._on_span)
+
+    def add_counter(self, name: str, value: int = 1, attributes: dict[str, TAttributeValue] | None = None) -> None:
+        if self._on_counter is not None:
+            self._on_counter(name, value, attributes or {})
+
+
+class _OpenTelemetrySpan(Span):
+    def __init__(self, context_manager: t.Any):
+        self._context_manager = context_manager
+        self._span: t.Any = None
+
+    def set_attribute(self, key: str, value: TAttributeValue) -> None:
+        # OpenTelemetry doesn't accept None values
+        if self._span is not None and value is not None:
+            self._span.set_attribute(key, value)
+
+    def __enter__(self) -> "_OpenTelemetrySpan":
+        self._span = self._context_manager.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._context_manager.__exit__(exc_type, exc_value, traceback)
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    Adapter for OpenTelemetry. The library doesn't depend on ``opentelemetry``: pass the tracer (and optionally
+    the meter) created by your application.
+
+    .. code-block:: python
+
+        from opentelemetry import metrics, trace
+
+        set_tracer(OpenTelemetryTracer(trace.get_tracer("pylti1p3"), metrics.get_meter("pylti1p3")))
+    """
+
+    enabled = True
+
+    def __init__(self, tracer: t.Any, meter: t.Any = None):
+        """
+        :param tracer: opentelemetry.trace.Tracer
+        :param meter: opentelemetry.metrics.Meter used for counters (optional)
+        """
+        self._tracer = tracer
+        self._meter = meter
+        self._counters: dict[str, t.Any] = {}
+
+    def start_span(self, name: str, attributes: dict[str, TAttributeValue] | None = None) -> Span:
+        attributes = {k: v for k, v in attributes.items() if v is not None} if attributes else None
+        return _OpenTelemetrySpan(self._tracer.start_as_current_span(name, attributes=attributes))
+
+    def add_counter(self, name: str, value: int = 1, attributes: dict[str, TAttributeValue] | None = None) -> None:
+        if self._meter is None:
+            return
+        counter = self._counters.get(name)
+        if counter is None:
+            counter = self._counters[name] = self._meter.create_counter(name)
+        counter.add(value, {k: v for k, v in (attributes or {}).items() if v is not None})
+
+
+_tracer: Tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    """
+    Set the tracer used by the whole process.
+
+    :param tracer: Tracer (None to disable instrumentation)
+    """
+    global _tracer  # pylint: disable=global-statement
+    _tracer = tracer if tracer is not None else Tracer()
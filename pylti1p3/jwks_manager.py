@@ -0,0 +1,231 @@
+"""Keeps platform key sets warm so launches don't wait for the JWKS endpoint."""
+
+import re
+import threading
+import time
+import typing as t
+
+import requests
+
+from .exception import LtiException
+from .instrumentation import get_tracer
+from .registration import TKeySet
+from .session_registry import default_session_registry
+
+
+class TJwksCacheEntry(t.TypedDict):
+    """Key set fetched from one JWKS endpoint."""
+
+    key_set: TKeySet
+    etag: str | None
+    expires_at: float
+    fetched_at: float
+
+
+class JwksManager:
+    """
+    Keeps one key set per ``key_set_url`` in memory and refreshes it in the background before it expires.
+    The lifetime of a key set is taken from the ``Cache-Control: max-age`` header of the platform's response,
+    refreshes use conditional GETs (``If-None-Match``) and a key set without the requested ``kid`` is re-fetched
+    at most once per ``kid_miss_interval`` seconds.
+    """
+
+    _requests_session: requests.Session | None
+    _default_max_age: int
+    _min_max_age: int
+    _max_max_age: int
+    _refresh_margin: float
+    _kid_miss_interval: float
+    _background_refresh: bool
+    _entries: dict[str, TJwksCacheEntry]
+    _locks: dict[str, threading.Lock]
+    _timers: dict[str, threading.Timer]
+
+    def __init__(
+        self,
+        requests_session: requests.Session | None = None,
+        default_max_age: int = 3600,
+        min_max_age: int = 60,
+        max_max_age: int = 86400,
+        refresh_margin: float = 0.1,
+        kid_miss_interval: float = 30,
+        background_refresh: bool = True,
+    ):
+        """
+        :param requests_session: session used to fetch key sets (sessions of the process-wide registry by default)
+        :param default_max_age: key set lifetime (sec) if the platform doesn't send Cache-Control
+        :param min_max_age: lower bound for the key set lifetime (sec)
+        :param max_max_age: upper bound for the key set lifetime (sec)
+        :param refresh_margin: part of the lifetime before the expiration when the key set is refreshed
+        :param kid_miss_interval: min interval (sec) between re-fetches caused by an unknown kid
+        :param background_refresh: refresh key sets in a background thread
+        """
+        self._requests_session = requests_session
+        self._default_max_age = default_max_age
+        self._min_max_age = min_max_age
+        self._max_max_age = max_max_age
+        self._refresh_margin = refresh_margin
+        self._kid_miss_interval = kid_miss_interval
+        self._background_refresh = background_refresh
+        self._entries = {}
+        self._locks = {}
+        self._timers = {}
+        self._guard = threading.Lock()
+
+    def _get_lock(self, key_set_url: str) -> threading.Lock:
+        with self._guard:
+            lock = self._locks.get(key_set_url)
+            if lock is None:
+                lock = threading.Lock()
+                self._locks[key_set_url] = lock
+            return lock
+
+    def get_key_set(self, key_set_url: str, kid: str | None = None) -> TKeySet:
+        """
+        Returns the key set of the platform.
+
+        :param key_set_url: platform's JWKS endpoint
+        :param kid: kid the caller is looking for (optional). The key set is re-fetched if it lacks the kid.
+        :return: dict
+        """
+        entry = self._entries.get(key_set_url)
+        tracer = get_tracer()
+        if tracer.enabled:
+            fresh = entry is not None and entry["expires_at"] > time.time()
+            tracer.add_counter("pylti1p3.public_key.cache", attributes={"result": "hit" if fresh else "miss"})
+        if entry is None or entry["expires_at"] <= time.time():
+            with self._get_lock(key_set_url):
+                entry = self._entries.get(key_set_url)
+                if entry is None:
+                    entry = self._fetch(key_set_url)
+                elif entry["expires_at"] <= time.time():
+                    try:
+                        entry = self._fetch(key_set_url)
+                    except LtiException:
+                        # The platform is unavailable, a stale key set is better than a failed launch
+                        pass
+
+        if kid is not None and not self._has_kid(entry["key_set"], kid):
+            entry = self._refetch_on_kid_miss(key_set_url, kid)
+
+        return entry["key_set"]
+
+    def get_cached_key_set(self, key_set_url: str, kid: str | None = None) -> TKeySet | None:
+        """
+        Returns the key set without any network calls: None if it isn't fetched yet, expired or lacks the kid.
+
+        :param key_set_url: platform's JWKS endpoint
+        :param kid: kid the caller is looking for (optional)
+        :return: dict or None
+        """
+        entry = self._entries.get(key_set_url)
+        if entry is None or entry["expires_at"] <= time.time():
+            return None
+        if kid is not None and not self._has_kid(entry["key_set"], kid):
+            return None
+        return entry["key_set"]
+
+    def refresh(self, key_set_url: str) -> TKeySet:
+        """
+        Re-fetch the key set right now.
+
+        :param key_set_url: platform's JWKS endpoint
+        :return: dict
+        """
+        with self._get_lock(key_set_url):
+            return self._fetch(key_set_url)["key_set"]
+
+    def close(self) -> None:
+        """
+        Stop all background refreshes.
+        """
+        with self._guard:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+
+    @staticmethod
+    def _has_kid(key_set: TKeySet, kid: str) -> bool:
+        return any(key.get("kid") == kid for key in key_set.get("keys", []))
+
+    def _refetch_on_kid_miss(self, key_set_url: str, kid: str) -> TJwksCacheEntry:
+        with self._get_lock(key_set_url):
+            entry = self._entries[key_set_url]
+            # Another thread may have re-fetched the key set while we were waiting for the lock
+            if self._has_kid(entry["key_set"], kid) or time.time() - entry["fetched_at"] < self._kid_miss_interval:
+                return entry
+            try:
+                return self._fetch(key_set_url)
+            except LtiException:
+                return entry
+
+    def _get_max_age(self, response: requests.Response) -> int:
+        max_age = self._default_max_age
+        cache_control = response.headers.get("Cache-Control", "")
+        match = re.search(r"max-age=(\d+)", cache_control)
+        if match:
+            max_age = int(match.group(1))
+        elif "no-cache" in cache_control or "no-store" in cache_control:
+            max_age = self._min_max_age
+        return min(max(max_age, self._min_max_age), self._max_max_age)
+
+    def _get_requests_session(self, key_set_url: str) -> requests.Session:
+        if self._requests_session is not None:
+            return self._requests_session
+        return default_session_registry.get_session(key_set_url)
+
+    def _fetch(self, key_set_url: str) -> TJwksCacheEntry:
+        entry = self._entries.get(key_set_url)
+        headers = {"If-None-Match": entry["etag"]} if entry and entry["etag"] else {}
+
+        tracer = get_tracer()
+        with tracer.start_span(
+            "pylti1p3.http.request", {"http.request.method": "GET", "url.full": key_set_url}
+        ) as span:
+            try:
+                resp = self._get_requests_session(key_set_url).get(key_set_url, headers=headers)
+            except requests.exceptions.RequestException as e:
+                raise LtiException(f"Error during fetch URL {key_set_url}: {str(e)}") from e
+            span.set_attribute("http.response.status_code", resp.status_code)
+            span.set_attribute("http.response.body.size", len(resp.content))
+
+        now = time.time()
+        max_age = self._get_max_age(resp)
+        if resp.status_code == 304 and entry:
+            key_set = entry["key_set"]
+        elif not resp.ok:
+            raise LtiException(f"Error during fetch URL {key_set_url}: HTTP {resp.status_code}")
+        else:
+            try:
+                key_set = resp.json()
+            except ValueError as e:
+                raise LtiException(f"Invalid response from {key_set_url}. Must be JSON: {resp.text}") from e
+
+        entry = {
+            "key_set": key_set,
+            "etag": resp.headers.get("ETag") or (entry["etag"] if entry else None),
+            "expires_at": now + max_age,
+            "fetched_at": now,
+        }
+        self._entries[key_set_url] = entry
+        self._schedule_refresh(key_set_url, max_age * (1 - self._refresh_margin))
+        return entry
+
+    def _schedule_refresh(self, key_set_url: str, delay: float) -> None:
+        if not self._background_refresh:
+            return
+        timer = threading.Timer(delay, self._refresh_in_background, args=(key_set_url,))
+        timer.daemon = True
+        with self._guard:
+            old_timer = self._timers.get(key_set_url)
+            if old_timer is not None:
+                old_timer.cancel()
+            self._timers[key_set_url] = timer
+        timer.start()
+
+    def _refresh_in_background(self, key_set_url: str) -> None:
+        try:
+            self.refresh(key_set_url)
+        except LtiException:
+            # Keep serving the current key set, the next launch will try again when it expires
+            self._schedule_refresh(key_set_url, self._min_max_age)
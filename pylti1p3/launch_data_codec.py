@@ -0,0 +1,83 @@
+"""Compact serialization of the launch data saved for MessageLaunch.from_cache."""
+
+import base64
+import json
+import typing as t
+import zlib
+from collections import abc
+
+if t.TYPE_CHECKING:
+    from .message_launch import TLaunchData
+
+
+class LaunchDataCodec:
+    """
+    Keeps only the configured claims of the launch and stores them as compact JSON compressed with zlib.
+    The value is bytes for storages which can store them (cache backends) and a text otherwise (sessions).
+    """
+
+    # Claims needed to restore the launch: registration lookup and message type checks
+    required_claims: frozenset[str] = frozenset(
+        {
+            "iss",
+            "aud",
+            "azp",
+            "sub",
+            "https://purl.imsglobal.org/spec/lti/claim/message_type",
+            "https://purl.imsglobal.org/spec/lti/claim/version",
+            "https://purl.imsglobal.org/spec/lti/claim/deployment_id",
+        }
+    )
+    # Format of the encoded value: prefix of the text values and first byte of the binary ones
+    _text_prefix: str = "lti1p3-launch:"
+    _format_json: bytes = b"j"
+    _format_zlib: bytes = b"z"
+
+    _claims: frozenset[str] | None
+    _compress_level: int
+    _min_compress_size: int
+
+    def __init__(self, claims: abc.Iterable[str] | None = None, compress_level: int = 6, min_compress_size: int = 256):
+        """
+        :param claims: claims to store in addition to required_claims (None to store all claims)
+        :param compress_level: zlib level, 0 disables compression
+        :param min_compress_size: smaller payloads are stored uncompressed
+        """
+        self._claims = self.required_claims | frozenset(claims) if claims is not None else None
+        self._compress_level = compress_level
+        self._min_compress_size = min_compress_size
+
+    def project(self, jwt_body: "TLaunchData") -> dict[str, t.Any]:
+        if self._claims is None:
+            return dict(jwt_body)
+        return {claim: value for claim, value in jwt_body.items() if claim in self._claims}
+
+    def encode(self, jwt_body: "TLaunchData", binary: bool = True) -> bytes | str:
+        """
+        :param jwt_body: launch data
+        :param binary: return bytes, otherwise a text safe for JSON-serialized sessions
+        :return: encoded launch data
+        """
+        payload = json.dumps(self.project(jwt_body), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        if self._compress_level and len(payload) >= self._min_compress_size:
+            value = self._format_zlib + zlib.compress(payload, self._compress_level)
+        else:
+            value = self._format_json + payload
+        if binary:
+            return value
+        return self._text_prefix + base64.b64encode(value).decode("ascii")
+
+    @classmethod
+    def is_encoded(cls, value: t.Any) -> bool:
+        return isinstance(value, bytes) or (isinstance(value, str) and value.startswith(cls._text_prefix))
+
+    @classmethod
+    def decode(cls, value: bytes | str) -> "TLaunchData":
+        if isinstance(value, str):
+            value = base64.b64decode(value[len(cls._text_prefix) :])
+        data_format, payload = value[:1], value[1:]
+        if data_format == cls._format_zlib:
+            payload = zlib.decompress(payload)
+        elif data_format != cls._format_json:
+            raise ValueError("Unknown launch data format")
+        return json.loads(payload)
@@ -2,6 +2,7 @@
 
 import typing as t
 from abc import ABC, abstractmethod
+from collections import abc
 from ..request import Request
 
 T = t.TypeVar("T")
@@ -46,6 +47,9 @@ class LaunchDataStorage(t.Generic[T], ABC):
     def can_set_keys_expiration(self) -> bool:
         raise NotImplementedError
 
+    def can_store_bytes(self) -> bool:
+        return False
+
     @abstractmethod
     def get_value(self, key: str) -> T:
         raise NotImplementedError
@@ -58,6 +62,53 @@ class LaunchDataStorage(t.Generic[T], ABC):
     def check_value(self, key: str) -> bool:
         raise NotImplementedError
 
+    def add_value(self, key: str, value: T, exp: int | None = None) -> bool:
+        """
+        Set the value only if the key doesn't exist yet. Returns True if the value was stored.
+        Storages which are able to do it atomically (cache backends) should override this method.
+        """
+        if self.check_value(key):
+            return False
+        self.set_value(key, value, exp)
+        return True
+
+    def remove_value(self, key: str) -> None:
+        raise NotImplementedError
+
+    def get_many(self, keys: abc.Iterable[str]) -> dict[str, T]:
+        """
+        Get several values at once, the missing keys are omitted from the result.
+        Storages which are able to do it in one round trip (cache backends) should override this method.
+        """
+        values = {}
+        for key in keys:
+            value = self.get_value(key)
+            if value is not None:
+                values[key] = value
+        return values
+
+    def set_many(self, values: abc.Mapping[str, T], exp: int | None = None) -> None:
+        for key, value in values.items():
+            self.set_value(key, value, exp)
+
+    def delete_many(self, keys: abc.Iterable[str]) -> None:
+        for key in keys:
+            self.remove_value(key)
+
+    def consume_value(self, key: str) -> bool:
+        """
+        Remove the key and return True if it existed, so a value (e.g. nonce) can be used only once.
+        Storages which are able to do it atomically (cache backends) should override this method.
+        """
+        if not self.check_value(key):
+            return False
+        try:
+            self.remove_value(key)
+        except NotImplementedError:
+            # Storages written for the previous versions may not support removal, the value expires instead
+            pass
+        return True
+
 
 class DisableSessionId:
     """Context manager that temporarily disables session scoping."""
@@ -1,6 +1,7 @@
 """Cache-backed launch storage for request and launch data."""
 
 import typing as t
+from collections import abc
 
 from .base import LaunchDataStorage
 
@@ -11,6 +12,8 @@ class CacheDataStorage(LaunchDataStorage[T], t.Generic[T]):
     """Stores launch data in a cache backend with optional key expiration."""
 
     _cache = None
+    # The cache's delete() returns True when the key existed (Django, Flask-Caching), consume_value relies on it
+    _delete_returns_result: bool = False
 
     def get_session_cookie_name(self) -> str | None:
         """
@@ -43,5 +46,55 @@ class CacheDataStorage(LaunchDataStorage[T], t.Generic[T]):
         key = self._prepare_key(key)
         return self._get_cache().get(key) is not None
 
+    def add_value(self, key: str, value: T, exp: int | None = None) -> bool:
+        cache = self._get_cache()
+        if not hasattr(cache, "add"):
+            return super().add_value(key, value, exp)
+        key = self._prepare_key(key)
+        return bool(cache.add(key, value, exp))
+
+    def remove_value(self, key: str) -> None:
+        key = self._prepare_key(key)
+        self._get_cache().delete(key)
+
+    def _prepare_keys(self, keys: abc.Iterable[str]) -> dict[str, str]:
+        return {self._prepare_key(key): key for key in keys}
+
+    def get_many(self, keys: abc.Iterable[str]) -> dict[str, T]:
+        cache = self._get_cache()
+        if not hasattr(cache, "get_many"):
+            return super().get_many(keys)
+        prepared_keys = self._prepare_keys(keys)
+        # Django-style API: get_many(keys) -> {key: value}
+        values = cache.get_many(list(prepared_keys))
+        return {prepared_keys[key]: value for key, value in values.items() if value is not None}
+
+    def set_many(self, values: abc.Mapping[str, T], exp: int | None = None) -> None:
+        cache = self._get_cache()
+        if not hasattr(cache, "set_many"):
+            super().set_many(values, exp)
+            return
+        cache.set_many({self._prepare_key(key): value for key, value in values.items()}, exp)
+
+    def delete_many(self, keys: abc.Iterable[str]) -> None:
+        cache = self._get_cache()
+        if not hasattr(cache, "delete_many"):
+            super().delete_many(keys)
+            return
+        cache.delete_many(list(self._prepare_keys(keys)))
+
+    def consume_value(self, key: str) -> bool:
+        cache = self._get_cache()
+        if hasattr(cache, "getdel"):
+            # Redis-compatible client: GETDEL reads and removes the key in one command
+            return cache.getdel(self._prepare_key(key)) is not None
+        if self._delete_returns_result:
+            return bool(cache.delete(self._prepare_key(key)))
+        return super().consume_value(key)
+
     def can_set_keys_expiration(self) -> bool:
         return True
+
+    def can_store_bytes(self) -> bool:
+        # Django and Flask-Caching backends pickle the values
+        return True
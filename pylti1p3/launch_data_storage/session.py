@@ -1,6 +1,7 @@
 """Session-backed launch storage for request and launch data."""
 
 import typing as t
+from collections import abc
 
 from .base import LaunchDataStorage
 
@@ -29,5 +30,18 @@ class SessionDataStorage(LaunchDataStorage[T], t.Generic[T]):
         assert self._request is not None, "Request should be set at this point"
         return key in self._request.session
 
+    def remove_value(self, key: str) -> None:
+        assert self._request is not None, "Request should be set at this point"
+        self._request.session.pop(key, None)
+
+    def set_many(self, values: abc.Mapping[str, T], exp: int | None = None) -> None:
+        # pylint: disable=unused-argument
+        assert self._request is not None, "Request should be set at this point"
+        self._request.session.update(values)
+
+    def consume_value(self, key: str) -> bool:
+        assert self._request is not None, "Request should be set at this point"
+        return self._request.session.pop(key, None) is not None
+
     def can_set_keys_expiration(self) -> bool:
         return False
@@ -0,0 +1,63 @@
+"""Thread-safe in-process LRU cache with per-key expiration."""
+
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+K = t.TypeVar("K", bound=t.Hashable)
+V = t.TypeVar("V")
+
+
+class MemoryCache(t.Generic[K, V]):
+    """
+    Bounded in-process cache. The least recently used key is evicted when ``maxsize`` is reached
+    and keys expire ``ttl`` seconds after they were set (``None`` means never).
+    """
+
+    _maxsize: int
+    _ttl: float | None
+    _data: "OrderedDict[K, tuple[V, float | None]]"
+
+    def __init__(self, maxsize: int = 128, ttl: float | None = None):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, exp: float | None = None) -> None:
+        """
+        :param key: cache key
+        :param value: value to store
+        :param exp: lifetime in seconds, the cache's default ttl is used when not set
+        """
+        lifetime = exp if exp is not None else self._ttl
+        expires_at = time.monotonic() + lifetime if lifetime is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -2,15 +2,20 @@
 
 import base64
 import collections.abc
+import copy
 import hashlib
 import json
+import time
 import typing as t
 import typing_extensions as te
 import uuid
 from abc import ABC, abstractmethod
 
 import jwt
+import jwt.algorithms
+import jwt.utils
 import requests
+from jwcrypto.common import JWException
 from jwcrypto.jwk import JWK
 
 from .actions import Action
@@ -19,14 +24,22 @@ from .cookie import CookieService
 from .course_groups import CourseGroupsService, TGroupsServiceData
 from .deep_link import DeepLink, TDeepLinkData
 from .exception import LtiException
+from .instrumentation import get_tracer
+from .jwks_manager import JwksManager
+from .launch_data_codec import LaunchDataCodec
 from .launch_data_storage.base import DisableSessionId, LaunchDataStorage
-from .message_validators import get_validators
-from .message_validators.deep_link import DeepLinkMessageValidator
-from .message_validators.privacy_launch import PrivacyLaunchValidator
-from .message_validators.resource_message import ResourceMessageValidator
-from .message_validators.submission_review import SubmissionReviewLaunchValidator
+from .memory_cache import MemoryCache
+from .message_validators import (
+    DeepLinkMessageValidator,
+    PrivacyLaunchValidator,
+    ResourceMessageValidator,
+    SubmissionReviewLaunchValidator,
+    ValidatorRegistry,
+    default_validator_registry,
+)
 from .names_roles import NamesRolesProvisioningService, TNamesAndRolesData
 from .roles import (
+    RoleIndex,
     StaffRole,
     StudentRole,
     TeacherRole,
@@ -35,10 +48,12 @@ from .roles import (
     ObserverRole,
     TransientRole,
 )
-from .registration import Registration, TKeySet
+from .registration import Registration, TKey, TKeySet
+from .retry_policy import RetryPolicy
 from .request import Request
-from .session import SessionService
-from .service_connector import ServiceConnector, REQUESTS_USER_AGENT
+from .session import SessionService, TStateData
+from .session_registry import SessionRegistry, default_session_registry
+from .service_connector import BaseServiceConnector, ServiceConnector, REQUESTS_USER_AGENT
 from .tool_config import ToolConfAbstract
 
 
@@ -183,8 +198,38 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
     _auto_validation: bool = True
     _restored: bool = False
     _id_token_hash: str | None
+    # The state read by validate_state, get_params_from_login reuses it
+    _state_data: TStateData | None = None
+    # Roles claim of the launch and its parsed roles, rebuilt when the roles claim is replaced
+    _role_index: tuple[list[str], RoleIndex] | None = None
     _public_key_cache_data_storage: LaunchDataStorage[t.Any] | None = None
     _public_key_cache_lifetime: int | None = None
+    # Parsed public keys shared by all launches: (issuer, kid, alg, key fingerprint) -> key object
+    _jwks_manager: JwksManager | None = None
+    _public_key_objects: MemoryCache[tuple[str, str, str, str], t.Any] = MemoryCache(maxsize=256, ttl=86400)
+    # Registrations of restored launches shared by all launches:
+    # (tool config's registrations cache key, iss, client_id) -> registration
+    _restored_registrations: MemoryCache[tuple[collections.abc.Hashable, str, str], Registration] = MemoryCache(
+        maxsize=256, ttl=300
+    )
+    _access_token_cache_data_storage: LaunchDataStorage[t.Any] | None = None
+    _access_token_expiration_margin: int = 10
+    _access_token_distributed_lock: bool = False
+    _access_token_refresh_ahead: int = 0
+    _response_caching: bool = False
+    _response_cache_data_storage: LaunchDataStorage[t.Any] | None = None
+    _response_cache_lifetime: int | None = 86400
+    _retry_policy: RetryPolicy | None = None
+    _service_connector_cls: type[ServiceConnector] = ServiceConnector
+    _service_connector: ServiceConnector | None = None
+    _requests_session: requests.Session | None = None
+    # Set to None to create a separate session for each launch
+    _session_registry: SessionRegistry | None = default_session_registry
+    # Validators of the supported message types
+    _validator_registry: ValidatorRegistry = default_validator_registry
+    # id_token with the header and body decoded by validate_jwt_format, verified without parsing the token again
+    _decoded_id_token: tuple[str, TJwtHeader, TLaunchData] | None = None
+    _jwt_algorithms: dict[str, jwt.algorithms.Algorithm] = jwt.algorithms.get_default_algorithms()
 
     def __init__(
         self,
@@ -207,16 +252,20 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
         self._jwt = {}
         self._jwt_verify_options = {"verify_aud": False}
         self._id_token_hash = None
+        self._state_data = None
+        self._role_index = None
         self._validated = False
         self._auto_validation = True
         self._restored = False
         self._public_key_cache_data_storage = None
         self._public_key_cache_lifetime = None
-        if requests_session:
-            self._requests_session: requests.Session = requests_session
-        else:
-            self._requests_session = requests.Session()
-            self._requests_session.headers["User-Agent"] = REQUESTS_USER_AGENT
+        self._jwks_manager = None
+        self._access_token_cache_data_storage = None
+        self._response_caching = False
+        self._response_cache_data_storage = None
+        self._retry_policy = None
+        self._service_connector = None
+        self._requests_session = requests_session
 
         if launch_data_storage:
             self.set_launch_data_storage(launch_data_storage)
@@ -286,7 +335,7 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
             .set_auto_validation(enable=False)
             .set_jwt({"body": launch_data})
             .set_restored()
-            .validate_registration()
+            .validate_restored_registration()
         )
 
     def validate(self) -> te.Self:
@@ -296,17 +345,23 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
         if self._restored:
             raise LtiException("Can't validate restored launch")
         self._validated = True
+        tracer = get_tracer()
+        steps = (
+            self.validate_state,
+            self.validate_jwt_format,
+            self.validate_registration,
+            self.validate_jwt_signature,
+            self.validate_nonce,
+            self.validate_deployment,
+            self.validate_message,
+            self.save_launch_data,
+        )
         try:
-            return (
-                self.validate_state()
-                .validate_jwt_format()
-                .validate_nonce()
-                .validate_registration()
-                .validate_jwt_signature()
-                .validate_deployment()
-                .validate_message()
-                .save_launch_data()
-            )
+            with tracer.start_span("pylti1p3.launch.validate"):
+                for step in steps:
+                    with tracer.start_span("pylti1p3.launch." + step.__name__):
+                        step()
+            return self
         except Exception:
             self._validated = False
             raise
@@ -345,8 +400,51 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
         return deployment_id
 
     def get_service_connector(self) -> ServiceConnector:
+        """
+        Returns the service connector for the current launch. The connector is created once per launch,
+        so NRPS/AGS/CGS services share the same access tokens.
+
+        :return: ServiceConnector
+        """
         assert self._registration is not None, "Registration not yet set"
-        return ServiceConnector(self._registration, self._requests_session)
+        if self._service_connector is None:
+            connector = self._service_connector_cls(self._registration, self.get_requests_session())
+            self._configure_service_connector(connector)
+            self._service_connector = connector
+        return self._service_connector
+
+    def get_requests_session(self) -> requests.Session:
+        """
+        Returns the session used for requests to the platform. Unless a session was passed to the constructor,
+        it is taken from the session registry, so launches from the same platform reuse kept-alive connections.
+
+        :return: requests.Session
+        """
+        if self._requests_session is None:
+            if self._session_registry is None:
+                self._requests_session = requests.Session()
+                self._requests_session.headers["User-Agent"] = REQUESTS_USER_AGENT
+            else:
+                iss = self._registration.get_issuer() if self._registration else None
+                return self._session_registry.get_session(iss)
+        return self._requests_session
+
+    def _reset_service_connectors(self) -> None:
+        self._service_connector = None
+
+    def _configure_service_connector(self, connector: BaseServiceConnector) -> None:
+        if self._access_token_cache_data_storage:
+            connector.set_access_token_caching(
+                self._access_token_cache_data_storage,
+                self._access_token_expiration_margin,
+                distributed_lock=self._access_token_distributed_lock,
+            )
+        if self._access_token_refresh_ahead:
+            connector.set_access_token_refresh_ahead(self._access_token_refresh_ahead)
+        if self._response_caching:
+            connector.set_response_caching(self._response_cache_data_storage, self._response_cache_lifetime)
+        if self._retry_policy:
+            connector.set_retry_policy(self._retry_policy)
 
     def has_nrps(self) -> bool:
         """
@@ -368,11 +466,13 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
         :return: NamesRolesProvisioningService
         """
         assert self._registration is not None, "Registration not yet set"
-        connector = self.get_service_connector()
+        return NamesRolesProvisioningService(self.get_service_connector(), self._get_nrps_service_data())
+
+    def _get_nrps_service_data(self) -> TNamesAndRolesData:
         names_role_service = self._get_jwt_body().get("https://purl.imsglobal.org/spec/lti-nrps/claim/namesroleservice")
         if not names_role_service:
             raise LtiException("namesroleservice is not set in jwt body")
-        return NamesRolesProvisioningService(connector, names_role_service)
+        return names_role_service
 
     def has_ags(self) -> bool:
         """
@@ -389,11 +489,13 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
         :return: AssignmentsGradesService
         """
         assert self._registration is not None, "Registration not yet set"
-        connector = self.get_service_connector()
+        return AssignmentsGradesService(self.get_service_connector(), self._get_ags_service_data())
+
+    def _get_ags_service_data(self) -> TAssignmentsGradersData:
         endpoint = self._get_jwt_body().get("https://purl.imsglobal.org/spec/lti-ags/claim/endpoint")
         if not endpoint:
             raise LtiException("endpoint is not set in jwt body")
-        return AssignmentsGradesService(connector, endpoint)
+        return endpoint
 
     def has_cgs(self) -> bool:
         """
@@ -411,14 +513,16 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
         :return:
         """
         assert self._registration is not None, "Registration not yet set"
-        connector = self.get_service_connector()
+        return CourseGroupsService(self.get_service_connector(), self._get_cgs_service_data())
+
+    def _get_cgs_service_data(self) -> TGroupsServiceData:
         groups_service_data = self._get_jwt_body().get("https://purl.imsglobal.org/spec/lti-gs/claim/groupsservice")
         if not groups_service_data:
             raise LtiException("groupsservice is not set in jwt body")
         context_groups_url = groups_service_data.get("context_groups_url", None)
         if not context_groups_url:
             raise LtiException("context_groups_url is not set in groupsservice section")
-        return CourseGroupsService(connector, groups_service_data)
+        return groups_service_data
 
     def get_deep_link(self) -> DeepLink:
         """
@@ -464,8 +568,7 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
 
         :return: bool  Returns true if the current launch is a deep linking launch.
         """
-        jwt_body = self._get_jwt_body()
-        return DeepLinkMessageValidator().can_validate(jwt_body)
+        return self._get_message_type() == DeepLinkMessageValidator.message_type
 
     def is_resource_launch(self) -> bool:
         """
@@ -473,8 +576,7 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
 
         :return: bool  Returns true if the current launch is a resource launch.
         """
-        jwt_body = self._get_jwt_body()
-        return ResourceMessageValidator().can_validate(jwt_body)
+        return self._get_message_type() == ResourceMessageValidator.message_type
 
     def is_data_privacy_launch(self) -> bool:
         """
@@ -482,8 +584,7 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
 
         :return: bool  Returns true if the current launch is a data privacy launch.
         """
-        jwt_body = self._get_jwt_body()
-        return PrivacyLaunchValidator().can_validate(jwt_body)
+        return self._get_message_type() == PrivacyLaunchValidator.message_type
 
     def is_submission_review_launch(self) -> bool:
         """
@@ -491,8 +592,7 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
 
         :return: bool  Returns true if the current launch is a submission review launch.
         """
-        jwt_body = self._get_jwt_body()
-        return SubmissionReviewLaunchValidator().can_validate(jwt_body)
+        return self._get_message_type() == SubmissionReviewLaunchValidator.message_type
 
     def get_launch_data(self) -> TLaunchData:
         """
@@ -526,42 +626,149 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
         self._public_key_cache_data_storage = data_storage
         self._public_key_cache_lifetime = cache_lifetime
 
-    def fetch_public_key(self, key_set_url: str) -> TKeySet:
-        cache_key = "key-set-url-" + hashlib.md5(key_set_url.encode("utf-8")).hexdigest()
+    def set_jwks_manager(self, jwks_manager: JwksManager) -> te.Self:
+        """
+        Use a shared JwksManager to get the platform's key set. The manager keeps key sets warm
+        and re-fetches a key set when it doesn't contain the kid of the launch.
+        """
+        self._jwks_manager = jwks_manager
+        return self
+
+    def set_access_token_caching(
+        self,
+        data_storage: LaunchDataStorage[t.Any],
+        expiration_margin: int = 10,
+        distributed_lock: bool = False,
+        refresh_ahead: int = 0,
+    ) -> te.Self:
+        self._access_token_cache_data_storage = data_storage
+        self._access_token_expiration_margin = expiration_margin
+        self._access_token_distributed_lock = distributed_lock
+        self._access_token_refresh_ahead = refresh_ahead
+        self._reset_service_connectors()
+        return self
+
+    def set_retry_policy(self, retry_policy: RetryPolicy | None) -> te.Self:
+        """
+        Retry throttled and failed NRPS/AGS/CGS requests according to the policy.
+
+        :param retry_policy: RetryPolicy instance or None to disable retries
+        """
+        self._retry_policy = retry_policy
+        self._reset_service_connectors()
+        return self
+
+    def set_response_caching(
+        self, data_storage: LaunchDataStorage[t.Any] | None = None, lifetime: int | None = 86400
+    ) -> te.Self:
+        """
+        Cache NRPS/AGS/CGS GET responses and revalidate them with conditional requests (ETag/Last-Modified).
+
+        :param data_storage: launch data storage shared by workers. In-process LRU is used if not set
+        :param lifetime: number of seconds to keep the responses
+        """
+        self._response_caching = True
+        self._response_cache_data_storage = data_storage
+        self._response_cache_lifetime = lifetime
+        self._reset_service_connectors()
+        return self
+
+    def _get_key_set_cache_key(self, key_set_url: str) -> str:
+        return "key-set-url-" + hashlib.md5(key_set_url.encode("utf-8")).hexdigest()
 
+    def _get_cached_key_set(self, cache_key: str) -> TKeySet | None:
+        if not self._public_key_cache_data_storage:
+            return None
         with DisableSessionId(self._public_key_cache_data_storage):
-            if self._public_key_cache_data_storage:
-                public_key = self._public_key_cache_data_storage.get_value(cache_key)
-                if public_key:
-                    return public_key
+            return self._public_key_cache_data_storage.get_value(cache_key)
 
+    def _cache_key_set(self, cache_key: str, public_key_set: TKeySet) -> None:
+        if not self._public_key_cache_data_storage:
+            return
+        with DisableSessionId(self._public_key_cache_data_storage):
+            self._public_key_cache_data_storage.set_value(cache_key, public_key_set, self._public_key_cache_lifetime)
+
+    def fetch_public_key(self, key_set_url: str) -> TKeySet:
+        tracer = get_tracer()
+        cache_key = self._get_key_set_cache_key(key_set_url)
+        public_key = self._get_cached_key_set(cache_key)
+        if self._public_key_cache_data_storage and tracer.enabled:
+            tracer.add_counter("pylti1p3.public_key.cache", attributes={"result": "hit" if public_key else "miss"})
+        if public_key:
+            return public_key
+
+        with tracer.start_span(
+            "pylti1p3.http.request", {"http.request.method": "GET", "url.full": key_set_url}
+        ) as span:
             try:
-                resp = self._requests_session.get(key_set_url)
+                resp = self.get_requests_session().get(key_set_url)
             except requests.exceptions.RequestException as e:
                 raise LtiException(f"Error during fetch URL {key_set_url}: {str(e)}") from e
-            try:
-                public_key = resp.json()
-                if self._public_key_cache_data_storage:
-                    self._public_key_cache_data_storage.set_value(
-                        cache_key, public_key, self._public_key_cache_lifetime
-                    )
-                return public_key
-            except ValueError as e:
-                raise LtiException(f"Invalid response from {key_set_url}. Must be JSON: {resp.text}") from e
+            span.set_attribute("http.response.status_code", resp.status_code)
+            span.set_attribute("http.response.body.size", len(resp.content))
+        try:
+            public_key = resp.json()
+        except ValueError as e:
+            raise LtiException(f"Invalid response from {key_set_url}. Must be JSON: {resp.text}") from e
+        self._cache_key_set(cache_key, public_key)
+        return public_key
 
-    def get_public_key(self) -> tuple[str, str]:
+    def _get_key_set_url(self) -> str:
         assert self._registration is not None, "Registration not yet set"
-        public_key_set = self._registration.get_key_set()
         key_set_url = self._registration.get_key_set_url()
+        assert key_set_url is not None, "If public_key_set is not set, public_set_url should be set"
+        if not key_set_url.startswith(("http://", "https://")):
+            raise LtiException("Invalid URL: " + key_set_url)
+        return key_set_url
+
+    def _get_public_key_set(self) -> TKeySet:
+        assert self._registration is not None, "Registration not yet set"
+        public_key_set = self._registration.get_key_set()
 
         if not public_key_set:
-            assert key_set_url is not None, "If public_key_set is not set, public_set_url should be set"
-            if key_set_url.startswith(("http://", "https://")):
-                public_key_set = self.fetch_public_key(key_set_url)
-                self._registration.set_key_set(public_key_set)
-            else:
-                raise LtiException("Invalid URL: " + key_set_url)
+            if self._jwks_manager:
+                kid = self._jwt.get("header", {}).get("kid", None)
+                return self._jwks_manager.get_key_set(self._get_key_set_url(), kid)
+            public_key_set = self.fetch_public_key(self._get_key_set_url())
+            self._registration.set_key_set(public_key_set)
+
+        return public_key_set
 
+    def get_public_key(self) -> tuple[str, str]:
+        key, key_alg = self._find_public_jwk(self._get_public_key_set())
+        try:
+            key_json = json.dumps(key)
+            jwk_obj = JWK.from_json(key_json)
+            public_key = jwk_obj.export_to_pem()
+            return public_key.decode(), key_alg
+        except (ValueError, TypeError) as e:
+            raise LtiException("Can't convert JWT key to PEM format") from e
+
+    def get_public_key_object(self) -> tuple[t.Any, str]:
+        """
+        Returns the platform's public key as a key object which may be passed to jwt.decode as is.
+
+        :return: tuple in format: (public key object, alg)
+        """
+        key, key_alg = self._find_public_jwk(self._get_public_key_set())
+        return self._load_public_key_object(key, key_alg), key_alg
+
+    def _load_public_key_object(self, key: TKey, key_alg: str) -> t.Any:
+        assert self._registration is not None, "Registration not yet set"
+        # The key itself is a part of the cache key, so a rotated key with the same kid is parsed again
+        fingerprint = hashlib.md5(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+        cache_key = (self._registration.get_issuer() or "", key["kid"], key_alg, fingerprint)
+
+        public_key = self._public_key_objects.get(cache_key)
+        if public_key is None:
+            try:
+                public_key = JWK(**key).get_op_key("verify")
+            except (ValueError, TypeError, JWException) as e:
+                raise LtiException("Can't load JWT public key") from e
+            self._public_key_objects.set(cache_key, public_key)
+        return public_key
+
+    def _find_public_jwk(self, public_key_set: TKeySet) -> tuple[TKey, str]:
         # Find key used to sign the JWT (matches the KID in the header)
         kid = self._jwt.get("header", {}).get("kid", None)
         alg = self._jwt.get("header", {}).get("alg", None)
@@ -575,13 +782,7 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
             key_kid = key.get("kid")
             key_alg = key.get("alg", "RS256")
             if key_kid and key_kid == kid and key_alg == alg:
-                try:
-                    key_json = json.dumps(key)
-                    jwk_obj = JWK.from_json(key_json)
-                    public_key = jwk_obj.export_to_pem()
-                    return public_key.decode(), key_alg
-                except (ValueError, TypeError) as e:
-                    raise LtiException("Can't convert JWT key to PEM format") from e
+                return key, key_alg
 
         # Could not find public key with a matching kid and alg.
         raise LtiException("Unable to find public key")
@@ -593,7 +794,8 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
             raise LtiException("Missing state param")
 
         id_token_hash = self._get_id_token_hash()
-        if not self._session_service.check_state_is_valid(state_from_request, id_token_hash):
+        self._state_data = self._session_service.get_state(state_from_request)
+        if self._state_data["id_token_hash"] != id_token_hash:
             state_from_cookie = self._cookie_service.get_cookie(state_from_request)
             if state_from_request != state_from_cookie:
                 # Error if state doesn't match.
@@ -610,23 +812,32 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
             raise LtiException("Invalid id_token, JWT must contain 3 parts")
 
         try:
-            # Decode JWT headers.
-            header = self.urlsafe_b64decode(jwt_parts[0])
-            self._jwt["header"] = json.loads(header)
-
-            # Decode JWT body.
-            body = self.urlsafe_b64decode(jwt_parts[1])
-            self._jwt["body"] = json.loads(body)
+            # Decode JWT headers and body once. The body is needed to find the registration, validate_jwt_signature
+            # verifies the signature of these segments, so the decoded body is the launch data.
+            header = json.loads(jwt.utils.base64url_decode(jwt_parts[0]))
+            body = json.loads(jwt.utils.base64url_decode(jwt_parts[1]))
+            if not isinstance(header, dict) or not isinstance(body, dict):
+                raise ValueError("JWT header and body must be JSON objects")
+            self._jwt["header"] = header  # type: ignore
+            self._jwt["body"] = body  # type: ignore
         except Exception as e:
             raise LtiException("Invalid JWT format, can't be decoded") from e
+        self._decoded_id_token = (id_token, header, body)
 
         return self
 
     def validate_nonce(self) -> te.Self:
+        """
+        Consumes the nonce of the login. Runs after validate_jwt_signature, so forged tokens can't use up nonces.
+        """
         nonce = self._get_jwt_body().get("nonce")
         if not nonce:
             raise LtiException('"nonce" is empty')
 
+        if self._state_data is not None and self._state_data["id_token_hash"] == self._get_id_token_hash():
+            # The same id_token is validated again: its nonce was consumed by the first validation
+            return self
+
         res = self._session_service.check_nonce(nonce)
         if not res:
             raise LtiException("Invalid Nonce")
@@ -657,6 +868,7 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
 
         if not self._registration:
             raise LtiException("Registration not found.")
+        self._reset_service_connectors()
 
         # Check client id
         if client_id != self._registration.get_client_id():
@@ -664,24 +876,127 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
 
         return self
 
+    def validate_restored_registration(self) -> te.Self:
+        """
+        validate_registration for launches restored from cache: the registration found by the first restored
+        launch is reused if the tool config declares that its registrations don't depend on the request.
+        """
+        config: ToolConfAbstract = self._tool_config
+        if not config.static_registrations:
+            return self.validate_registration()
+
+        cache_key = (config.get_registrations_cache_key(), self.get_iss(), self.get_client_id())
+        cached = self._restored_registrations.get(cache_key)
+        if cached is not None:
+            # Every launch gets its own copy, so changes made by one launch don't reach the others
+            self._registration = copy.copy(cached)
+            self._reset_service_connectors()
+            return self
+
+        self.validate_registration()
+        assert self._registration is not None
+        self._restored_registrations.set(cache_key, copy.copy(self._registration))
+        return self
+
     def validate_jwt_signature(self) -> te.Self:
         id_token = self._get_id_token()
 
         # Fetch public key object
-        public_key, key_alg = self.get_public_key()
+        public_key, key_alg = self.get_public_key_object()
+        return self._verify_jwt_signature(id_token, public_key, key_alg)
 
+    def _verify_jwt_signature(self, id_token: str, public_key: t.Any, key_alg: str) -> te.Self:
+        """
+        Verifies the id_token. The header and body decoded by validate_jwt_format are verified as they are, so the
+        token is parsed once; tokens which need PyJWT's other checks (e.g. "crit" headers, short keys) and options
+        which skip the signature go through jwt.decode, whose payload replaces the body.
+        """
         try:
-            jwt.decode(
-                id_token,
-                public_key,
-                algorithms=[key_alg],
-                options=self._jwt_verify_options,
-            )
+            decoded = self._decoded_id_token
+            if (
+                decoded is None
+                or decoded[0] != id_token
+                or not self._verify_decoded_jwt(id_token, decoded[1], decoded[2], public_key, key_alg)
+            ):
+                self._jwt["body"] = jwt.decode(
+                    id_token,
+                    public_key,
+                    algorithms=[key_alg],
+                    options=self._jwt_verify_options,
+                )
+            else:
+                self._jwt["header"], self._jwt["body"] = decoded[1], decoded[2]
         except jwt.InvalidTokenError as e:
             raise LtiException(f"Can't decode id_token: {str(e)}") from e
 
         return self
 
+    def _verify_decoded_jwt(
+        self, id_token: str, header: TJwtHeader, body: TLaunchData, public_key: t.Any, key_alg: str
+    ) -> bool:
+        """
+        Verifies the signature and the claims of the decoded id_token like jwt.decode does (no audience, issuer
+        or leeway is passed). Returns False if the token has to be verified by jwt.decode instead.
+        """
+        options = self._jwt_verify_options
+        algorithm = self._jwt_algorithms.get(key_alg)
+        if (
+            algorithm is None
+            or not options.get("verify_signature", True)
+            or "crit" in header
+            or "b64" in header
+            or not isinstance(header.get("kid", ""), str)
+        ):
+            return False
+        if header.get("alg") != key_alg:
+            raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+        prepared_key = algorithm.prepare_key(public_key)
+        if hasattr(algorithm, "check_key_length") and algorithm.check_key_length(prepared_key):
+            # Short keys are warned about or rejected by jwt.decode
+            return False
+        signing_input, _, signature_segment = id_token.rpartition(".")
+        try:
+            signature = jwt.utils.base64url_decode(signature_segment)
+        except (TypeError, ValueError) as e:
+            raise jwt.DecodeError("Invalid crypto padding") from e
+        if not algorithm.verify(signing_input.encode("utf-8"), prepared_key, signature):
+            raise jwt.InvalidSignatureError("Signature verification failed")
+
+        self._validate_jwt_claims(t.cast(dict[str, t.Any], body), options)
+        return True
+
+    @staticmethod
+    def _validate_jwt_claims(body: dict[str, t.Any], options: dict[str, t.Any]) -> None:
+        for claim in options.get("require", ()):
+            if body.get(claim) is None:
+                raise jwt.MissingRequiredClaimError(claim)
+
+        now = time.time()
+        if "iat" in body and options.get("verify_iat", True):
+            iat = MessageLaunch._get_int_claim(body, "iat", jwt.InvalidIssuedAtError, "Issued At claim (iat)")
+            if iat > now:
+                raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+        if "nbf" in body and options.get("verify_nbf", True):
+            if MessageLaunch._get_int_claim(body, "nbf", jwt.DecodeError, "Not Before claim (nbf)") > now:
+                raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+        if "exp" in body and options.get("verify_exp", True):
+            if MessageLaunch._get_int_claim(body, "exp", jwt.DecodeError, "Expiration Time claim (exp)") <= now:
+                raise jwt.ExpiredSignatureError("Signature has expired")
+        # No audience is expected, so a token with one is rejected when the audience is verified
+        if options.get("verify_aud", True) and body.get("aud"):
+            raise jwt.InvalidAudienceError("Invalid audience")
+        for claim, name in (("sub", "Subject"), ("jti", "JWT ID")):
+            if options.get(f"verify_{claim}", True) and claim in body and not isinstance(body[claim], str):
+                raise jwt.InvalidTokenError(f"{name} must be a string")
+
+    @staticmethod
+    def _get_int_claim(body: dict[str, t.Any], claim: str, error_cls: type[jwt.InvalidTokenError], name: str) -> int:
+        try:
+            return int(body[claim])
+        except (ValueError, TypeError, OverflowError):
+            raise error_cls(f"{name} must be an integer.") from None
+
     def validate_deployment(self) -> te.Self:
         iss = self.get_iss()
         client_id = self.get_client_id()
@@ -698,25 +1013,20 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
 
         return self
 
+    def _get_message_type(self) -> str | None:
+        return self._get_jwt_body().get("https://purl.imsglobal.org/spec/lti/claim/message_type")
+
     def validate_message(self) -> te.Self:
         jwt_body = self._get_jwt_body()
-        message_type = jwt_body.get("https://purl.imsglobal.org/spec/lti/claim/message_type", None)
+        message_type = self._get_message_type()
         if not message_type:
             raise LtiException("Invalid message type")
 
-        validators = get_validators()
-        validated = False
-        for validator in validators:
-            if validator.can_validate(jwt_body):
-                if validated:
-                    raise LtiException("Validator conflict")
-                validated = True
-                res = validator.validate(jwt_body)
-                if not res:
-                    raise LtiException("Message validation failed")
-
-        if not validated:
+        validator = self._validator_registry.find_validator(jwt_body)
+        if validator is None:
             raise LtiException("Unrecognized message type")
+        if not validator.validate(jwt_body):
+            raise LtiException("Message validation failed")
 
         return self
 
@@ -736,15 +1046,30 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
         self._session_service.set_launch_data_lifetime(time_sec)
         return self
 
+    def set_launch_data_compaction(
+        self, claims: collections.abc.Iterable[str] | None = None, compress_level: int = 6
+    ) -> te.Self:
+        """
+        Store only the given claims of the launch (in addition to the ones needed by from_cache), compressed.
+        from_cache restores such launches transparently.
+
+        :param claims: claims to store (None to store all claims)
+        :param compress_level: zlib level, 0 disables compression
+        :return: self
+        """
+        self._session_service.set_launch_data_codec(LaunchDataCodec(claims, compress_level=compress_level))
+        return self
+
     def save_launch_data(self) -> te.Self:
         state_from_request = self._get_request_param("state")
         id_token_hash = self._get_id_token_hash()
 
-        self._session_service.save_launch_data(self._launch_id, self._get_jwt_body())
-        self._session_service.set_state_valid(state_from_request, id_token_hash)
+        self._session_service.save_launch(self._launch_id, self._get_jwt_body(), state_from_request, id_token_hash)
         return self
 
     def get_params_from_login(self):
+        if self._state_data is not None:
+            return self._state_data["params"]
         state = self._get_request_param("state")
         return self._session_service.get_state_params(state)
 
@@ -752,30 +1077,34 @@ class MessageLaunch(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServic
         jwt_body = self._get_jwt_body()
         return not jwt_body
 
+    def get_role_index(self) -> RoleIndex:
+        """
+        Returns the roles of the launch parsed once for all role checks.
+
+        :return: RoleIndex
+        """
+        jwt_roles = self._get_jwt_body().get("https://purl.imsglobal.org/spec/lti/claim/roles", [])
+        if self._role_index is None or self._role_index[0] is not jwt_roles:
+            self._role_index = (jwt_roles, RoleIndex(jwt_roles))
+        return self._role_index[1]
+
     def check_staff_access(self) -> bool:
-        jwt_body = self._get_jwt_body()
-        return StaffRole(jwt_body).check()
+        return self.get_role_index().check(StaffRole)
 
     def check_student_access(self) -> bool:
-        jwt_body = self._get_jwt_body()
-        return StudentRole(jwt_body).check()
+        return self.get_role_index().check(StudentRole)
 
     def check_teacher_access(self) -> bool:
-        jwt_body = self._get_jwt_body()
-        return TeacherRole(jwt_body).check()
+        return self.get_role_index().check(TeacherRole)
 
     def check_teaching_assistant_access(self) -> bool:
-        jwt_body = self._get_jwt_body()
-        return TeachingAssistantRole(jwt_body).check()
+        return self.get_role_index().check(TeachingAssistantRole)
 
     def check_designer_access(self) -> bool:
-        jwt_body = self._get_jwt_body()
-        return DesignerRole(jwt_body).check()
+        return self.get_role_index().check(DesignerRole)
 
     def check_observer_access(self) -> bool:
-        jwt_body = self._get_jwt_body()
-        return ObserverRole(jwt_body).check()
+        return self.get_role_index().check(ObserverRole)
 
     def check_transient(self) -> bool:
-        jwt_body = self._get_jwt_body()
-        return TransientRole(jwt_body).check()
+        return self.get_role_index().check(TransientRole)
@@ -1,17 +1,34 @@
-"""Factories for the launch validators used by MessageLaunch."""
+"""Registry of the launch validators used by MessageLaunch."""
 
+from .abstract import MessageValidatorAbstract as MessageValidatorAbstract
 from .deep_link import DeepLinkMessageValidator as DeepLinkMessageValidator
 from .resource_message import ResourceMessageValidator as ResourceMessageValidator
 from .privacy_launch import PrivacyLaunchValidator as PrivacyLaunchValidator
+from .registry import ValidatorRegistry as ValidatorRegistry
 from .submission_review import SubmissionReviewLaunchValidator as SubmissionReviewLaunchValidator
 
+__all__ = [
+    "MessageValidatorAbstract",
+    "DeepLinkMessageValidator",
+    "ResourceMessageValidator",
+    "PrivacyLaunchValidator",
+    "ValidatorRegistry",
+    "SubmissionReviewLaunchValidator",
+    "default_validator_registry",
+    "get_validators",
+]
 
-def get_validators():
-    """Return the validators checked against incoming launch JWTs."""
-
-    return [
+default_validator_registry = ValidatorRegistry(
+    [
         DeepLinkMessageValidator(),
         ResourceMessageValidator(),
         PrivacyLaunchValidator(),
         SubmissionReviewLaunchValidator(),
     ]
+)
+
+
+def get_validators():
+    """Return the validators checked against incoming launch JWTs."""
+
+    return default_validator_registry.get_validators()
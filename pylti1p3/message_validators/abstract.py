@@ -9,13 +9,15 @@ class MessageValidatorAbstract:
 
     __metaclass__ = ABCMeta
 
+    # Value of the message_type claim handled by the validator
+    message_type: str | None = None
+
     @abstractmethod
     def validate(self, jwt_body) -> bool:
         raise NotImplementedError
 
-    @abstractmethod
     def can_validate(self, jwt_body) -> bool:
-        raise NotImplementedError
+        return jwt_body.get("https://purl.imsglobal.org/spec/lti/claim/message_type") == self.message_type
 
     def run_common_validators(self, jwt_body) -> None:
         if not jwt_body.get("sub"):
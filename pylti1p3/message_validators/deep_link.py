@@ -7,6 +7,8 @@ from .abstract import MessageValidatorAbstract
 class DeepLinkMessageValidator(MessageValidatorAbstract):
     """Checks the claims required for an LTI deep-linking request."""
 
+    message_type = "LtiDeepLinkingRequest"
+
     def validate(self, jwt_body) -> bool:
         self.run_common_validators(jwt_body)
 
@@ -26,6 +28,3 @@ class DeepLinkMessageValidator(MessageValidatorAbstract):
             raise LtiException("Must support a presentation type")
 
         return True
-
-    def can_validate(self, jwt_body) -> bool:
-        return jwt_body.get("https://purl.imsglobal.org/spec/lti/claim/message_type") == "LtiDeepLinkingRequest"
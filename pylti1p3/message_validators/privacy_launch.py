@@ -12,6 +12,8 @@ class PrivacyLaunchValidator(MessageValidatorAbstract):
     was made on behalf of.
     """
 
+    message_type = "DataPrivacyLaunchRequest"
+
     def validate(self, jwt_body) -> bool:
         self.run_common_validators(jwt_body)
 
@@ -26,6 +28,3 @@ class PrivacyLaunchValidator(MessageValidatorAbstract):
             raise LtiException("For user claim must be included in a DataPrivacyLaunchRequest")
 
         return True
-
-    def can_validate(self, jwt_body) -> bool:
-        return jwt_body.get("https://purl.imsglobal.org/spec/lti/claim/message_type") == "DataPrivacyLaunchRequest"
@@ -0,0 +1,95 @@
+"""Process-wide table of the launch validators, keyed by the LTI message type."""
+
+import threading
+import typing as t
+
+from ..exception import LtiException
+from .abstract import MessageValidatorAbstract
+
+
+class ValidatorRegistry:
+    """
+    Maps the message_type claim of a launch to the validator of that message type, so a launch is
+    dispatched to its validator with one lookup. Validators are stateless and shared by all launches.
+    Custom message types (e.g. ``LtiStartProctoring``) are supported by registering their validators.
+    Validators without a message_type are kept aside and picked by their can_validate when no validator is
+    registered for the message type of a launch.
+    """
+
+    _validators: dict[str, MessageValidatorAbstract]
+    _fallback_validators: tuple[MessageValidatorAbstract, ...]
+
+    def __init__(self, validators: list[MessageValidatorAbstract] | None = None):
+        """
+        :param validators: validators to register, each one for its message_type
+        """
+        self._validators = {}
+        self._fallback_validators = ()
+        self._lock = threading.Lock()
+        for validator in validators or []:
+            self.register(validator)
+
+    def register(
+        self, validator: MessageValidatorAbstract, message_type: str | None = None, replace: bool = False
+    ) -> MessageValidatorAbstract:
+        """
+        Register the validator of the message type.
+
+        :param validator: validator instance
+        :param message_type: message type (validator.message_type by default), validators without one are
+            consulted through can_validate
+        :param replace: replace the validator already registered for the message type
+        :return: validator
+        """
+        message_type = message_type or validator.message_type
+        with self._lock:
+            if not message_type:
+                if validator not in self._fallback_validators:
+                    self._fallback_validators = self._fallback_validators + (validator,)
+                return validator
+            if not replace and message_type in self._validators:
+                raise LtiException("Validator conflict")
+            # Copy on write: launches read the table without the lock
+            self._validators = {**self._validators, message_type: validator}
+        return validator
+
+    def unregister(self, message_type: str) -> None:
+        with self._lock:
+            validators = dict(self._validators)
+            validators.pop(message_type, None)
+            self._validators = validators
+
+    def unregister_validator(self, validator: MessageValidatorAbstract) -> None:
+        with self._lock:
+            self._validators = {key: value for key, value in self._validators.items() if value is not validator}
+            self._fallback_validators = tuple(value for value in self._fallback_validators if value is not validator)
+
+    def get_validator(self, message_type: str | None) -> MessageValidatorAbstract | None:
+        """
+        Returns the validator of the message type.
+
+        :param message_type: message_type claim of the launch
+        :return: validator or None if the message type isn't registered
+        """
+        if not message_type:
+            return None
+        return self._validators.get(message_type)
+
+    def find_validator(self, jwt_body: dict[str, t.Any]) -> MessageValidatorAbstract | None:
+        """
+        Returns the validator of the launch: the one registered for its message type or, for other message
+        types, the first validator whose can_validate accepts the launch.
+
+        :param jwt_body: launch data
+        :return: validator or None if no validator accepts the launch
+        """
+        validator = self.get_validator(jwt_body.get("https://purl.imsglobal.org/spec/lti/claim/message_type"))
+        if validator is not None:
+            return validator
+        for validator in self.get_validators():
+            if validator.can_validate(jwt_body):
+                return validator
+        return None
+
+    def get_validators(self) -> list[MessageValidatorAbstract]:
+        return list(self._validators.values()) + list(self._fallback_validators)
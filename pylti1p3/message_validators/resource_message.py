@@ -7,6 +7,8 @@ from .abstract import MessageValidatorAbstract
 class ResourceMessageValidator(MessageValidatorAbstract):
     """Checks the claims required for a standard resource launch."""
 
+    message_type = "LtiResourceLinkRequest"
+
     def validate(self, jwt_body) -> bool:
         self.run_common_validators(jwt_body)
 
@@ -15,6 +17,3 @@ class ResourceMessageValidator(MessageValidatorAbstract):
             raise LtiException("Missing Resource Link Id")
 
         return True
-
-    def can_validate(self, jwt_body) -> bool:
-        return jwt_body.get("https://purl.imsglobal.org/spec/lti/claim/message_type") == "LtiResourceLinkRequest"
@@ -12,6 +12,8 @@ class SubmissionReviewLaunchValidator(MessageValidatorAbstract):
     for the reviewed submission.
     """
 
+    message_type = "LtiSubmissionReviewRequest"
+
     def validate(self, jwt_body) -> bool:
         self.run_common_validators(jwt_body)
 
@@ -29,6 +31,3 @@ class SubmissionReviewLaunchValidator(MessageValidatorAbstract):
             raise LtiException("For user claim must include user_id")
 
         return True
-
-    def can_validate(self, jwt_body) -> bool:
-        return jwt_body.get("https://purl.imsglobal.org/spec/lti/claim/message_type") == "LtiSubmissionReviewRequest"
@@ -1,7 +1,12 @@
 """Names and Roles Provisioning Service helpers."""
 
+import hashlib
 import typing as t
+import typing_extensions as te
+from collections import abc
 
+from .exception import LtiServiceException
+from .launch_data_storage.base import DisableSessionId, LaunchDataStorage
 from .utils import add_param_to_url
 from .service_connector import ServiceConnector
 
@@ -29,11 +34,21 @@ class TMember(t.TypedDict, total=False):
     lti11_legacy_user_id: str | None
 
 
+class TMembersSyncResult(t.TypedDict):
+    """Members returned by ``sync_members``."""
+
+    members: list[TMember]
+    # True if only the changes since the previous sync were returned
+    delta: bool
+
+
 class NamesRolesProvisioningService:
     """Fetches class roster and context data from the platform."""
 
     _service_connector: ServiceConnector
     _service_data: TNamesAndRolesData
+    _differences_data_storage: LaunchDataStorage[t.Any] | None = None
+    _differences_url_lifetime: int | None = None
 
     def __init__(self, service_connector: ServiceConnector, service_data: TNamesAndRolesData):
         self._service_connector = service_connector
@@ -68,17 +83,107 @@ class NamesRolesProvisioningService:
         :param resource_link_id: resource link id (optional)
         :return: list
         """
-        members_res_lst: list[TMember] = []
+        return list(self.iter_members(resource_link_id))
+
+    def iter_members(self, resource_link_id: str | None = None, prefetch: bool = False) -> abc.Iterator[TMember]:
+        """
+        Iterate over all users page by page, without keeping the whole roster in memory.
+
+        :param resource_link_id: resource link id (optional)
+        :param prefetch: request the next page while the caller processes the current one
+        :return: iterator over users
+        """
         members_url: str | None = self._service_data["context_memberships_url"]
 
         if members_url and resource_link_id:
             members_url = add_param_to_url(members_url, "rlid", resource_link_id)
 
-        while members_url:
-            members, members_url = self.get_members_page(members_url)
-            members_res_lst.extend(members)
+        pages = self._service_connector.get_paginated_data(
+            ["https://purl.imsglobal.org/spec/lti-nrps/scope/contextmembership.readonly"],
+            members_url,
+            accept="application/vnd.ims.lti-nrps.v2.membershipcontainer+json",
+            prefetch=prefetch,
+        )
+        for page in pages:
+            data_body = t.cast(t.Any, page.get("body", {}))
+            yield from data_body.get("members", [])
+
+    def set_differences_data_storage(
+        self, data_storage: LaunchDataStorage[t.Any], lifetime: int | None = None
+    ) -> te.Self:
+        """
+        Keep the "differences" URL returned by the platform in the storage (memcache/redis/DB),
+        so the next ``sync_members`` call fetches only the membership changes.
+
+        :param data_storage: launch data storage
+        :param lifetime: number of seconds to keep the URL (optional)
+        """
+        self._differences_data_storage = data_storage
+        self._differences_url_lifetime = lifetime
+        return self
+
+    def sync_members(self, resource_link_id: str | None = None) -> TMembersSyncResult:
+        """
+        Get the membership changes since the previous sync of the context, or all users if the previous
+        "differences" URL is unknown or rejected by the platform.
+        Changed members are returned with their current "status" ("Active", "Inactive" or "Deleted").
+
+        :param resource_link_id: resource link id (optional)
+        :return: dict with members and "delta" flag
+        """
+        members_url: str | None = self._service_data["context_memberships_url"]
+        if members_url and resource_link_id:
+            members_url = add_param_to_url(members_url, "rlid", resource_link_id)
 
-        return members_res_lst
+        cache_key = self._get_differences_cache_key(members_url)
+        differences_url = self._get_differences_url(cache_key)
+        if differences_url:
+            try:
+                members, next_differences_url = self._fetch_members_with_differences_url(differences_url)
+                self._set_differences_url(cache_key, next_differences_url)
+                return {"members": members, "delta": True}
+            except LtiServiceException:
+                # The URL is expired or unknown to the platform, fall back to the full roster
+                pass
+
+        members, next_differences_url = self._fetch_members_with_differences_url(members_url)
+        self._set_differences_url(cache_key, next_differences_url)
+        return {"members": members, "delta": False}
+
+    def _fetch_members_with_differences_url(self, members_url: str | None) -> tuple[list[TMember], str | None]:
+        members: list[TMember] = []
+        differences_url = None
+        pages = self._service_connector.get_paginated_data(
+            ["https://purl.imsglobal.org/spec/lti-nrps/scope/contextmembership.readonly"],
+            members_url,
+            accept="application/vnd.ims.lti-nrps.v2.membershipcontainer+json",
+            case_insensitive_headers=True,
+        )
+        for page in pages:
+            data_body = t.cast(t.Any, page.get("body", {}))
+            members.extend(data_body.get("members", []))
+            differences_url = (
+                ServiceConnector._get_link_url(page["headers"].get("link", ""), "differences") or differences_url
+            )
+        return members, differences_url
+
+    def _get_differences_cache_key(self, members_url: str | None) -> str:
+        return "nrps-differences-" + hashlib.md5(str(members_url).encode("utf-8")).hexdigest()
+
+    def _get_differences_url(self, cache_key: str) -> str | None:
+        if not self._differences_data_storage:
+            return None
+        with DisableSessionId(self._differences_data_storage):
+            return self._differences_data_storage.get_value(cache_key)
+
+    def _set_differences_url(self, cache_key: str, differences_url: str | None) -> None:
+        if not self._differences_data_storage:
+            return
+        with DisableSessionId(self._differences_data_storage):
+            if differences_url:
+                self._differences_data_storage.set_value(cache_key, differences_url, self._differences_url_lifetime)
+            else:
+                self._differences_data_storage.remove_value(cache_key)
 
     def get_context(self):
         """
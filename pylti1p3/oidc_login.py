@@ -264,3 +264,7 @@ class OIDCLogin(t.Generic[RequestT, ToolConfT, SessionServiceT, CookieServiceT,
     def set_launch_data_lifetime(self, time_sec: int) -> te.Self:
         self._session_service.set_launch_data_lifetime(time_sec)
         return self
+
+    def set_nonce_lifetime(self, time_sec: int) -> te.Self:
+        self._session_service.set_nonce_lifetime(time_sec)
+        return self
@@ -0,0 +1,51 @@
+"""Token bucket limiting the rate of requests to one platform."""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket: allows ``rate`` requests per second on average and bursts of up to ``burst`` requests.
+    Callers which are over the limit wait for their turn instead of being throttled by the platform.
+    """
+
+    _rate: float
+    _burst: float
+    _tokens: float
+    _updated_at: float
+
+    def __init__(self, rate: float, burst: int | None = None):
+        """
+        :param rate: number of requests per second
+        :param burst: max number of requests sent at once (``rate`` rounded up by default)
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self._rate = rate
+        self._burst = float(burst if burst is not None else max(1, int(rate + 0.999)))
+        self._tokens = self._burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token from the bucket.
+
+        :return: number of seconds the caller must wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._rate)
+            self._updated_at = now
+            self._tokens -= 1
+            # The token is borrowed from the future if the bucket is empty
+            return max(0.0, -self._tokens / self._rate)
+
+    def acquire(self) -> None:
+        """
+        Wait until the request may be sent.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
@@ -1,9 +1,16 @@
 """Platform registration records used during login and launch validation."""
 
+import hashlib
 import typing as t
 from collections import abc
 from jwcrypto.jwk import JWK
 
+from .memory_cache import MemoryCache
+from .signer import PrivateKeySigner, Signer
+
+
+_MISSING: t.Any = object()
+
 
 class TKey(t.TypedDict):
     """Single JWK entry from the platform key set."""
@@ -30,6 +37,9 @@ class Registration:
     _tool_private_key: str | None = None
     _auth_audience: str | None = None
     _tool_public_key: str | None = None
+    _signer: Signer | None = None
+    # kid of the tool's public key: hash of the PEM -> kid
+    _kids: MemoryCache[str, str | None] = MemoryCache(maxsize=128)
 
     def get_issuer(self) -> str | None:
         return self._issuer
@@ -114,6 +124,26 @@ class Registration:
     def get_kid(self) -> str | None:
         key = self.get_tool_public_key()
         if key:
-            jwk = Registration.get_jwk(key)
-            return jwk.get("kid") if jwk else None
+            cache_key = hashlib.sha256(key.encode("utf-8")).hexdigest()
+            # Keys without a kid are cached too, the sentinel tells them apart from the keys not seen yet
+            kid = self._kids.get(cache_key, _MISSING)
+            if kid is _MISSING:
+                jwk = Registration.get_jwk(key)
+                kid = jwk.get("kid") if jwk else None
+                self._kids.set(cache_key, kid)
+            return kid
         return None
+
+    def get_signer(self) -> Signer:
+        """
+        Returns the signer for JWTs sent to the platform. Unless a custom signer is set,
+        the tool's private key is used (it is parsed only once per process).
+        """
+        if self._signer:
+            return self._signer
+        assert self._tool_private_key is not None, "Private key should be set at this point"
+        return PrivateKeySigner.from_pem(self._tool_private_key, self.get_kid())
+
+    def set_signer(self, signer: Signer | None) -> "Registration":
+        self._signer = signer
+        return self
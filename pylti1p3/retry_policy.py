@@ -0,0 +1,92 @@
+"""Retry rules for requests to the platform's services."""
+
+import random
+import time
+import typing as t
+from email.utils import parsedate_to_datetime
+
+
+class RetryPolicy:
+    """
+    Retries requests which failed because of throttling (HTTP 429), transient server errors or connection errors
+    with exponential backoff and jitter. ``Retry-After`` sent by the platform takes precedence over the backoff
+    and is only limited by ``max_retry_after``.
+    Only idempotent methods are retried after server/connection errors, as the platform may have already processed
+    the request. Throttled requests weren't processed, so they are retried for any method.
+    """
+
+    _max_retries: int
+    _backoff: float
+    _max_backoff: float
+    _max_retry_after: float
+    _retry_statuses: frozenset[int]
+    _methods: frozenset[str]
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses: t.Iterable[int] = (500, 502, 503, 504),
+        methods: t.Iterable[str] = ("GET", "PUT", "DELETE"),
+        max_retry_after: float = 300.0,
+    ):
+        """
+        :param max_retries: max number of retries for one request
+        :param backoff: delay (sec) before the first retry, doubled on every next retry
+        :param max_backoff: max delay (sec) between retries
+        :param retry_statuses: HTTP statuses (besides 429) which are retried for the allowed methods
+        :param methods: idempotent methods which are retried after server and connection errors
+        :param max_retry_after: max delay (sec) requested by the platform with Retry-After
+        """
+        self._max_retries = max_retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._max_retry_after = max_retry_after
+        self._retry_statuses = frozenset(retry_statuses)
+        self._methods = frozenset(method.upper() for method in methods)
+
+    def get_max_retries(self) -> int:
+        return self._max_retries
+
+    def should_retry(self, method: str, status_code: int | None, attempt: int, idempotent: bool | None = None) -> bool:
+        """
+        :param method: HTTP method
+        :param status_code: HTTP status of the response or None for connection errors
+        :param attempt: number of the failed attempt (starting from 1)
+        :param idempotent: whether the request may be repeated (by default it depends on the method)
+        :return: bool
+        """
+        if attempt > self._max_retries:
+            return False
+        if status_code == 429:
+            return True
+        if idempotent is None:
+            idempotent = method.upper() in self._methods
+        if not idempotent:
+            return False
+        return status_code is None or status_code in self._retry_statuses
+
+    def get_delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """
+        :param attempt: number of the failed attempt (starting from 1)
+        :param retry_after: value of the Retry-After header (seconds or HTTP date)
+        :return: number of seconds to wait before the next attempt
+        """
+        delay = self._parse_retry_after(retry_after) if retry_after else None
+        if delay is not None:
+            # Retrying earlier than the platform asked would be throttled again
+            return min(max(delay, 0.0), self._max_retry_after)
+        # Jitter spreads the retries of concurrent workers
+        delay = self._backoff * 2 ** (attempt - 1) * random.uniform(0.5, 1.0)
+        return min(delay, self._max_backoff)
+
+    @staticmethod
+    def _parse_retry_after(retry_after: str) -> float | None:
+        retry_after = retry_after.strip()
+        if retry_after.isdigit():
+            return float(retry_after)
+        try:
+            return parsedate_to_datetime(retry_after).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
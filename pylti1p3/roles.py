@@ -1,6 +1,8 @@
 """Role parsing helpers used to check launch access grants."""
 
+import functools
 from abc import ABC
+from collections import abc
 from enum import StrEnum
 
 
@@ -12,16 +14,54 @@ class RoleType(StrEnum):
     CONTEXT = "membership"
 
 
+TRole = tuple[str, str | None]
+
+_BASE_PREFIX = "http://purl.imsglobal.org/vocab/lis/v2"
+_ROLE_TYPES = frozenset(RoleType)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_role_str(role_str: str) -> TRole:
+    """
+    Split the role URI into the role name and the role type (None for the short and unknown roles).
+    Launches use a small set of role URIs, so the results are cached.
+    """
+    if role_str.startswith(_BASE_PREFIX):
+        role = role_str[len(_BASE_PREFIX) :]
+        role_parts = role.split("/")
+        role_name_parts = role_parts[-1].split("#")
+
+        if len(role_parts) > 1 and len(role_name_parts) > 1:
+            role_type = role_name_parts[0] if role_name_parts[0] == "membership" else role_parts[1]
+            role_name = role_name_parts[1]
+            if role_type in _ROLE_TYPES:
+                return role_name, role_type
+            return role_name, None
+    return role_str, None
+
+
 class AbstractRole(ABC):
     """Parses the JWT role claim and checks for specific access levels."""
 
-    _base_prefix: str = "http://purl.imsglobal.org/vocab/lis/v2"
+    _base_prefix: str = _BASE_PREFIX
     _role_types = [RoleType.SYSTEM, RoleType.INSTITUTION, RoleType.CONTEXT]
     _jwt_roles: list[str] = []
-    _common_roles: tuple | None = None
-    _system_roles: tuple | None = None
-    _institution_roles: tuple | None = None
-    _context_roles: tuple | None = None
+    _common_roles: abc.Set[str] | tuple | None = None
+    _system_roles: abc.Set[str] | tuple | None = None
+    _institution_roles: abc.Set[str] | tuple | None = None
+    _context_roles: abc.Set[str] | tuple | None = None
+    # (role name, role type) pairs matched by the role, built from the tables above when the class is created
+    accepted_roles: frozenset[TRole] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        tables: tuple[tuple[abc.Iterable[str] | None, str | None], ...] = (
+            (cls._common_roles, None),
+            (cls._system_roles, RoleType.SYSTEM),
+            (cls._institution_roles, RoleType.INSTITUTION),
+            (cls._context_roles, RoleType.CONTEXT),
+        )
+        cls.accepted_roles = frozenset((name, role_type) for names, role_type in tables for name in names or ())
 
     def __init__(self, jwt_body):
         self._jwt_roles = jwt_body.get("https://purl.imsglobal.org/spec/lti/claim/roles", [])
@@ -29,11 +69,7 @@ class AbstractRole(ABC):
     def check(self) -> bool:
         roles = [self.parse_role_str(role_str) for role_str in self._jwt_roles]
 
-        context_roles = [
-            (role_name, role_type)
-            for role_name, role_type in roles
-            if role_type == RoleType.CONTEXT
-        ]
+        context_roles = [(role_name, role_type) for role_name, role_type in roles if role_type == RoleType.CONTEXT]
 
         if context_roles:
             roles = context_roles
@@ -70,50 +106,92 @@ class AbstractRole(ABC):
 class StaffRole(AbstractRole):
     """Matches roles that should be treated as staff access."""
 
-    _system_roles = ("Administrator", "SysAdmin")
-    _institution_roles = ("Faculty", "SysAdmin", "Staff", "Instructor")
+    _system_roles = frozenset({"Administrator", "SysAdmin"})
+    _institution_roles = frozenset({"Faculty", "SysAdmin", "Staff", "Instructor"})
 
 
 class StudentRole(AbstractRole):
     """Matches roles that should be treated as student access."""
 
-    _common_roles = ("Learner", "Member", "User")
-    _system_roles = ("User",)
-    _institution_roles = ("Student", "Learner", "Member", "ProspectiveStudent", "User")
-    _context_roles = ("Learner", "Member")
+    _common_roles = frozenset({"Learner", "Member", "User"})
+    _system_roles = frozenset({"User"})
+    _institution_roles = frozenset({"Student", "Learner", "Member", "ProspectiveStudent", "User"})
+    _context_roles = frozenset({"Learner", "Member"})
 
 
 class TeacherRole(AbstractRole):
     """Matches roles that should be treated as instructor access."""
 
-    _common_roles = ("Instructor", "Administrator")
-    _context_roles = ("Instructor", "Administrator")
+    _common_roles = frozenset({"Instructor", "Administrator"})
+    _context_roles = frozenset({"Instructor", "Administrator"})
 
 
 class TeachingAssistantRole(AbstractRole):
     """Matches teaching assistant roles."""
 
-    _context_roles = ("TeachingAssistant",)
+    _context_roles = frozenset({"TeachingAssistant"})
 
 
 class DesignerRole(AbstractRole):
     """Matches content developer roles."""
 
-    _common_roles = ("ContentDeveloper",)
-    _context_roles = ("ContentDeveloper",)
+    _common_roles = frozenset({"ContentDeveloper"})
+    _context_roles = frozenset({"ContentDeveloper"})
 
 
 class ObserverRole(AbstractRole):
     """Matches mentor or observer roles."""
 
-    _common_roles = ("Mentor",)
-    _context_roles = ("Mentor",)
+    _common_roles = frozenset({"Mentor"})
+    _context_roles = frozenset({"Mentor"})
 
 
 class TransientRole(AbstractRole):
     """Matches transient roles used for temporary participants."""
 
-    _common_roles = ("Transient",)
-    _system_roles = ("Transient",)
-    _institution_roles = ("Transient",)
-    _context_roles = ("Transient",)
+    _common_roles = frozenset({"Transient"})
+    _system_roles = frozenset({"Transient"})
+    _institution_roles = frozenset({"Transient"})
+    _context_roles = frozenset({"Transient"})
+
+
+BUILTIN_ROLE_CLASSES: tuple[type[AbstractRole], ...] = (
+    StaffRole,
+    StudentRole,
+    TeacherRole,
+    TeachingAssistantRole,
+    DesignerRole,
+    ObserverRole,
+    TransientRole,
+)
+
+
+class RoleIndex:
+    """
+    Roles of a launch parsed once. The built-in roles are checked when the index is built,
+    so every check is a dict lookup.
+    """
+
+    __slots__ = ("jwt_roles", "roles", "_matches")
+
+    jwt_roles: tuple[str, ...]
+    roles: frozenset[TRole]
+    _matches: dict[type[AbstractRole], bool]
+
+    def __init__(self, jwt_roles: abc.Iterable[str]):
+        self.jwt_roles = tuple(jwt_roles)
+        roles = frozenset(parse_role_str(role_str) for role_str in self.jwt_roles)
+        # Context roles take precedence over the system and institution ones
+        context_roles = frozenset(role for role in roles if role[1] == RoleType.CONTEXT)
+        self.roles = context_roles or roles
+        self._matches = {
+            role_cls: not role_cls.accepted_roles.isdisjoint(self.roles) for role_cls in BUILTIN_ROLE_CLASSES
+        }
+
+    def check(self, role_cls: type[AbstractRole]) -> bool:
+        res = self._matches.get(role_cls)
+        if res is None:
+            # Custom roles may override the parsing, so they are checked the usual way
+            res = role_cls({"https://purl.imsglobal.org/spec/lti/claim/roles": list(self.jwt_roles)}).check()
+            self._matches[role_cls] = res
+        return res
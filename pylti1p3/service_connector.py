@@ -1,16 +1,35 @@
 """OAuth client and request helper for platform service calls."""
 
 import hashlib
+import math
 import re
+import threading
 import time
 import typing as t
+import typing_extensions as te
 import uuid
 from collections import abc
+from concurrent.futures import ThreadPoolExecutor
 
-import jwt  # type: ignore
 import requests
 from .exception import LtiException, LtiServiceException
+from .instrumentation import Span, TAttributeValue, get_tracer
+from .launch_data_storage.base import DisableSessionId, LaunchDataStorage
+from .memory_cache import MemoryCache
+from .rate_limiter import RateLimiter
 from .registration import Registration
+from .retry_policy import RetryPolicy
+from .session_registry import REQUESTS_USER_AGENT, default_session_registry
+from .signer import PrivateKeySigner
+
+__all__ = [
+    "REQUESTS_USER_AGENT",
+    "TServiceConnectorResponse",
+    "TAccessTokenCacheData",
+    "TResponseCacheData",
+    "BaseServiceConnector",
+    "ServiceConnector",
+]
 
 
 class TServiceConnectorResponse(t.TypedDict):
@@ -21,27 +40,48 @@ class TServiceConnectorResponse(t.TypedDict):
     next_page_url: str | None
 
 
-REQUESTS_USER_AGENT = "PyLTI1p3-client"
+class TAccessTokenCacheData(t.TypedDict):
+    """Cached access token together with its absolute expiration time."""
 
+    access_token: str
+    expires_at: float
 
-class ServiceConnector:
-    """Exchanges service credentials for tokens and performs LTI service calls."""
+
+class TResponseCacheData(t.TypedDict):
+    """GET response kept for conditional requests (If-None-Match/If-Modified-Since)."""
+
+    etag: str | None
+    last_modified: str | None
+    headers: dict[str, str]
+    body: int | float | list[object] | dict[str, object] | str | None
+    next_page_url: str | None
+
+
+class BaseServiceConnector:
+    """Access token caching and request helpers shared by the sync and async service connectors."""
 
     _registration: Registration
-    _access_tokens: dict[str, str]
+    _access_tokens: dict[str, TAccessTokenCacheData]
+    _access_token_cache_data_storage: LaunchDataStorage[t.Any] | None = None
+    _access_token_expiration_margin: int = 10
+    _access_token_default_lifetime: int = 3600
+    _access_token_distributed_lock: bool = False
+    _access_token_lock_timeout: int = 10
+    _access_token_lock_poll_interval: float = 0.1
+    _access_token_refresh_ahead: int = 0
+    # Responses are cached per URL: {"<scopes>|<accept>": response}, so writes to the URL drop all variants
+    _response_cache: MemoryCache[str, dict[str, TResponseCacheData]] | LaunchDataStorage[t.Any] | None = None
+    _response_cache_lifetime: int | None = None
+    _response_memory_cache: MemoryCache[str, dict[str, TResponseCacheData]] = MemoryCache(maxsize=1024)
+    _retry_policy: RetryPolicy | None = None
+    # Shared by all connectors of the process: issuer -> rate limiter
+    _rate_limiters: dict[str, RateLimiter] = {}
 
-    def __init__(
-        self,
-        registration: Registration,
-        requests_session: requests.Session | None = None,
-    ):
+    def __init__(self, registration: Registration):
         self._registration = registration
         self._access_tokens = {}
-        if requests_session:
-            self._requests_session = requests_session
-        else:
-            self._requests_session = requests.Session()
-            self._requests_session.headers["User-Agent"] = REQUESTS_USER_AGENT
+        self._access_token_cache_data_storage = None
+        self._response_cache = None
 
     def _scope_key(self, scopes: t.Iterable[str]) -> str:
         issuer = self._registration.get_issuer()
@@ -49,22 +89,230 @@ class ServiceConnector:
         scopes_bytes = scopes_str.encode("utf-8")
         return hashlib.md5(scopes_bytes).hexdigest()
 
-    def _get_cached_access_token(self, scope_key: str) -> str | None:
+    def set_access_token_caching(
+        self,
+        data_storage: LaunchDataStorage[t.Any],
+        expiration_margin: int = 10,
+        distributed_lock: bool = False,
+        lock_timeout: int = 10,
+    ) -> te.Self:
+        """
+        Store access tokens in a shared storage (memcache/redis) instead of the connector instance,
+        so all connectors, workers and nodes reuse the same token until it is about to expire.
+
+        :param data_storage: launch data storage used to keep the tokens
+        :param expiration_margin: number of seconds before the platform's "expires_in" when the token is refreshed
+        :param distributed_lock: use the storage as a lock, so only one node requests a new token at a time
+        :param lock_timeout: max number of seconds to wait for the token requested by another node
+        """
+        self._access_token_cache_data_storage = data_storage
+        self._access_token_expiration_margin = expiration_margin
+        self._access_token_distributed_lock = distributed_lock
+        self._access_token_lock_timeout = lock_timeout
+        return self
+
+    def set_access_token_refresh_ahead(self, seconds: int) -> te.Self:
+        """
+        Refresh the cached access token in the background when it expires in less than ``seconds``.
+        The current token is returned without waiting for the refresh.
+        """
+        self._access_token_refresh_ahead = seconds
+        return self
+
+    def set_retry_policy(self, retry_policy: RetryPolicy | None) -> te.Self:
+        """
+        Retry throttled (HTTP 429) and failed requests to the platform, including access token requests.
+
+        :param retry_policy: RetryPolicy instance or None to disable retries
+        """
+        self._retry_policy = retry_policy
+        return self
+
+    def get_retry_policy(self) -> RetryPolicy | None:
+        return self._retry_policy
+
+    @classmethod
+    def set_rate_limit(cls, issuer: str, rate: float, burst: int | None = None) -> None:
+        """
+        Limit the rate of requests to the platform. The limit is shared by all connectors of the process.
+
+        :param issuer: platform's issuer
+        :param rate: number of requests per second
+        :param burst: max number of requests sent at once
+        """
+        BaseServiceConnector._rate_limiters[issuer] = RateLimiter(rate, burst)
+
+    @classmethod
+    def remove_rate_limit(cls, issuer: str) -> None:
+        BaseServiceConnector._rate_limiters.pop(issuer, None)
+
+    def _get_rate_limiter(self) -> RateLimiter | None:
+        issuer = self._registration.get_issuer()
+        return self._rate_limiters.get(issuer) if issuer else None
+
+    def _should_retry(self, method: str, status_code: int | None, attempt: int, idempotent: bool | None = None) -> bool:
+        return self._retry_policy is not None and self._retry_policy.should_retry(
+            method, status_code, attempt, idempotent
+        )
+
+    def _get_retry_delay(self, attempt: int, retry_after: str | None = None) -> float:
+        assert self._retry_policy is not None, "Retry policy should be set"
+        return self._retry_policy.get_delay(attempt, retry_after)
+
+    def _start_request_span(self, method: str, url: str, attempt: int) -> Span:
+        tracer = get_tracer()
+        if not tracer.enabled:
+            return tracer.start_span("pylti1p3.http.request")
+        attributes: dict[str, TAttributeValue] = {
+            "http.request.method": method,
+            "url.full": url,
+            "http.request.resend_count": attempt - 1,
+            "lti.issuer": self._registration.get_issuer(),
+        }
+        return tracer.start_span("pylti1p3.http.request", attributes)
+
+    def _trace_access_token_cache(self, cached_token: str | None) -> None:
+        tracer = get_tracer()
+        if tracer.enabled:
+            tracer.add_counter("pylti1p3.access_token.cache", attributes={"result": "hit" if cached_token else "miss"})
+
+    def _trace_response_cache(self, method: str, cached_response: TResponseCacheData | None, status_code: int) -> None:
+        tracer = get_tracer()
+        if not tracer.enabled or self._response_cache is None or method != "GET":
+            return
+        result = "hit" if cached_response and status_code == 304 else "miss"
+        tracer.add_counter("pylti1p3.response_cache", attributes={"result": result})
+
+    def set_response_caching(
+        self,
+        data_storage: LaunchDataStorage[t.Any] | None = None,
+        lifetime: int | None = 86400,
+    ) -> te.Self:
+        """
+        Cache GET responses which have "ETag" or "Last-Modified" headers and revalidate them with conditional
+        requests: "304 Not Modified" responses are served from the cache. PUT/POST/DELETE requests to the same URL
+        drop the cached responses.
+
+        :param data_storage: launch data storage (memcache/redis) shared by workers. In-process LRU is used if not set
+        :param lifetime: number of seconds to keep the responses
+        """
+        self._response_cache = data_storage if data_storage is not None else self._response_memory_cache
+        self._response_cache_lifetime = lifetime
+        return self
+
+    def _get_response_cache_key(self, url: str) -> str:
+        client_id = self._registration.get_client_id()
+        return "service-response-" + hashlib.md5(f"{client_id}|{url}".encode()).hexdigest()
+
+    def _get_response_cache_variant(self, scopes: t.Sequence[str], accept: str) -> str:
+        return self._scope_key(scopes) + "|" + accept
+
+    def _get_cached_responses(self, url: str) -> dict[str, TResponseCacheData] | None:
+        cache_key = self._get_response_cache_key(url)
+        if isinstance(self._response_cache, LaunchDataStorage):
+            with DisableSessionId(self._response_cache):
+                return self._response_cache.get_value(cache_key)
+        if self._response_cache is not None:
+            return self._response_cache.get(cache_key)
+        return None
+
+    def _get_cached_response(self, scopes: t.Sequence[str], url: str, accept: str) -> TResponseCacheData | None:
+        responses = self._get_cached_responses(url)
+        return responses.get(self._get_response_cache_variant(scopes, accept)) if responses else None
+
+    def _cache_response(
+        self, scopes: t.Sequence[str], url: str, accept: str, response: TServiceConnectorResponse
+    ) -> None:
+        if self._response_cache is None:
+            return
+        headers = {key.lower(): value for key, value in response["headers"].items()}
+        if not headers.get("etag") and not headers.get("last-modified"):
+            return
+        responses = dict(self._get_cached_responses(url) or {})
+        responses[self._get_response_cache_variant(scopes, accept)] = {
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "headers": dict(response["headers"]),
+            "body": response["body"],
+            "next_page_url": response["next_page_url"],
+        }
+        cache_key = self._get_response_cache_key(url)
+        if isinstance(self._response_cache, LaunchDataStorage):
+            with DisableSessionId(self._response_cache):
+                self._response_cache.set_value(cache_key, responses, self._response_cache_lifetime)
+        else:
+            self._response_cache.set(cache_key, responses, self._response_cache_lifetime)
+
+    def _invalidate_cached_responses(self, url: str) -> None:
+        cache_key = self._get_response_cache_key(url)
+        if isinstance(self._response_cache, LaunchDataStorage):
+            with DisableSessionId(self._response_cache):
+                self._response_cache.remove_value(cache_key)
+        elif self._response_cache is not None:
+            self._response_cache.delete(cache_key)
+
+    @staticmethod
+    def _get_conditional_request_headers(cached_response: TResponseCacheData | None) -> dict[str, str]:
+        headers = {}
+        if cached_response and cached_response["etag"]:
+            headers["If-None-Match"] = cached_response["etag"]
+        if cached_response and cached_response["last_modified"]:
+            headers["If-Modified-Since"] = cached_response["last_modified"]
+        return headers
+
+    @staticmethod
+    def _get_response_from_cache(
+        cached_response: TResponseCacheData, case_insensitive_headers: bool
+    ) -> TServiceConnectorResponse:
+        headers = cached_response["headers"]
+        return {
+            "headers": requests.structures.CaseInsensitiveDict(headers) if case_insensitive_headers else dict(headers),
+            "body": cached_response["body"],
+            "next_page_url": cached_response["next_page_url"],
+        }
+
+    def _get_access_token_cache_key(self, scope_key: str) -> str:
+        return "access-token-" + scope_key
+
+    def _get_access_token_cache_data(self, scope_key: str) -> TAccessTokenCacheData | None:
+        if self._access_token_cache_data_storage:
+            with DisableSessionId(self._access_token_cache_data_storage):
+                return self._access_token_cache_data_storage.get_value(self._get_access_token_cache_key(scope_key))
+        return self._get_local_access_token_cache_data(scope_key)
+
+    def _get_local_access_token_cache_data(self, scope_key: str) -> TAccessTokenCacheData | None:
+        # Used when no access token storage is set. Framework connectors override it to share tokens between launches
         return self._access_tokens.get(scope_key)
 
-    def _cache_access_token(self, scope_key: str, access_token: str, expires_in: float):
-        del expires_in
-        self._access_tokens[scope_key] = access_token
+    def _set_local_access_token_cache_data(self, scope_key: str, token_data: TAccessTokenCacheData, lifetime: int):
+        self._access_tokens[scope_key] = token_data
 
-    def get_access_token(self, scopes: t.Sequence[str]) -> str:
-        # Don't fetch the same key more than once
-        scopes = sorted(scopes)
-        scope_key = self._scope_key(scopes)
+    def _get_cached_access_token(self, scope_key: str) -> str | None:
+        token_data = self._get_access_token_cache_data(scope_key)
+        if token_data and token_data["expires_at"] > time.time():
+            return token_data["access_token"]
+        return None
 
-        cached_token = self._get_cached_access_token(scope_key)
-        if cached_token:
-            return cached_token
+    def _cache_access_token(self, scope_key: str, access_token: str, expires_in: float):
+        lifetime = float(expires_in) if expires_in else float(self._access_token_default_lifetime)
+        lifetime = max(1.0, lifetime - self._access_token_expiration_margin)
+        token_data: TAccessTokenCacheData = {
+            "access_token": access_token,
+            "expires_at": time.time() + lifetime,
+        }
+        if self._access_token_cache_data_storage:
+            with DisableSessionId(self._access_token_cache_data_storage):
+                self._access_token_cache_data_storage.set_value(
+                    self._get_access_token_cache_key(scope_key), token_data, math.ceil(lifetime)
+                )
+        else:
+            self._set_local_access_token_cache_data(scope_key, token_data, math.ceil(lifetime))
+
+    def _access_token_expires_soon(self, scope_key: str) -> bool:
+        token_data = self._get_access_token_cache_data(scope_key)
+        return bool(token_data and token_data["expires_at"] - time.time() < self._access_token_refresh_ahead)
 
+    def _get_access_token_request_data(self, scopes: t.Sequence[str]) -> tuple[str, dict[str, str]]:
         # Build up JWT to exchange for an auth token
         client_id = self._registration.get_client_id()
         assert client_id is not None, "client_id should be set at this point"
@@ -81,15 +329,8 @@ class ServiceConnector:
             "exp": int(time.time()) + 60,
             "jti": "lti-service-token-" + str(uuid.uuid4()),
         }
-        headers = {}
-        kid = self._registration.get_kid()
-        if kid:
-            headers = {"kid": kid}
-
         # Sign the JWT with our private key (given by the platform on registration)
-        private_key = self._registration.get_tool_private_key()
-        assert private_key is not None, "Private key should be set at this point"
-        jwt_val = self.encode_jwt(jwt_claim, private_key, headers)
+        jwt_val = self.encode_jwt(jwt_claim)
 
         auth_request = {
             "grant_type": "client_credentials",
@@ -97,9 +338,161 @@ class ServiceConnector:
             "client_assertion": jwt_val,
             "scope": " ".join(scopes),
         }
+        return auth_url, auth_request
+
+    def _acquire_access_token_distributed_lock(self, scope_key: str) -> bool:
+        assert self._access_token_cache_data_storage is not None, "Access token storage should be set"
+        with DisableSessionId(self._access_token_cache_data_storage):
+            return self._access_token_cache_data_storage.add_value(
+                self._get_access_token_cache_key(scope_key) + "-lock", True, self._access_token_lock_timeout
+            )
+
+    def _release_access_token_distributed_lock(self, scope_key: str) -> None:
+        assert self._access_token_cache_data_storage is not None, "Access token storage should be set"
+        with DisableSessionId(self._access_token_cache_data_storage):
+            self._access_token_cache_data_storage.remove_value(self._get_access_token_cache_key(scope_key) + "-lock")
+
+    def _get_fresh_access_token(self, scope_key: str) -> str | None:
+        # Read through _get_cached_access_token, so tokens cached by subclasses which override it are seen too
+        access_token = self._get_cached_access_token(scope_key)
+        if access_token and self._access_token_refresh_ahead and self._access_token_expires_soon(scope_key):
+            return None
+        return access_token
+
+    def encode_jwt(
+        self,
+        message: dict[str, str | int],
+        private_key: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> str:
+        """
+        Sign the message with the registration's signer or with the passed private key.
+        The "kid" header is added by the signer.
+        """
+        signer = PrivateKeySigner.from_pem(private_key) if private_key else self._registration.get_signer()
+        return signer.encode_jwt(message, headers)
+
+    @staticmethod
+    def _get_link_url(link_header: str, rel: str) -> str | None:
+        if not link_header:
+            return None
+        match = re.search(
+            r'<([^>]*)>;\s*rel="' + re.escape(rel) + '"',
+            link_header.replace("\n", " ").strip(),
+            re.IGNORECASE,
+        )
+        return match.group(1) if match and match.group(1) else None
+
+    @classmethod
+    def _get_next_page_url(cls, link_header: str) -> str | None:
+        return cls._get_link_url(link_header, "next")
+
+    @staticmethod
+    def _check_service_request_method(method: str) -> None:
+        if method not in ("GET", "PUT", "POST", "DELETE"):
+            raise LtiException(f'Unsupported method: {method}. Available methods are: "GET", "PUT", "POST", "DELETE".')
+
+    def _get_service_request_headers(
+        self, access_token: str, method: str, content_type: str, accept: str
+    ) -> dict[str, str]:
+        headers = {"Authorization": "Bearer " + access_token, "Accept": accept}
+        if method in ("PUT", "POST"):
+            headers["Content-Type"] = content_type
+        return headers
+
+
+class ServiceConnector(BaseServiceConnector):
+    """Exchanges service credentials for tokens and performs LTI service calls."""
+
+    # One lock per scope key shared by all connectors of the process,
+    # so concurrent requests don't fetch the same token at the same time
+    _access_token_locks: dict[str, threading.Lock] = {}
+    _access_token_locks_guard = threading.Lock()
+
+    def __init__(
+        self,
+        registration: Registration,
+        requests_session: requests.Session | None = None,
+    ):
+        super().__init__(registration)
+        if requests_session:
+            self._requests_session = requests_session
+        else:
+            self._requests_session = default_session_registry.get_session(registration.get_issuer())
+
+    @classmethod
+    def _get_access_token_lock(cls, scope_key: str) -> threading.Lock:
+        with cls._access_token_locks_guard:
+            lock = cls._access_token_locks.get(scope_key)
+            if lock is None:
+                lock = threading.Lock()
+                cls._access_token_locks[scope_key] = lock
+            return lock
+
+    def _refresh_access_token_in_background(self, scopes: t.Sequence[str], scope_key: str) -> None:
+        lock = self._get_access_token_lock(scope_key)
+        if lock.locked() or not self._access_token_expires_soon(scope_key):
+            return
+
+        def refresh():
+            if not lock.acquire(blocking=False):
+                return
+            try:
+                if self._access_token_expires_soon(scope_key):
+                    self._fetch_access_token_single_flight(scopes, scope_key)
+            except LtiException:
+                # The current token is still valid, the next request will try again
+                pass
+            finally:
+                lock.release()
+
+        threading.Thread(target=refresh, daemon=True).start()
 
-        # Make request to get auth token
-        r = self._requests_session.post(auth_url, data=auth_request)
+    def get_access_token(self, scopes: t.Sequence[str]) -> str:
+        # Don't fetch the same key more than once
+        scopes = sorted(scopes)
+        scope_key = self._scope_key(scopes)
+
+        cached_token = self._get_cached_access_token(scope_key)
+        self._trace_access_token_cache(cached_token)
+        if cached_token:
+            if self._access_token_refresh_ahead:
+                self._refresh_access_token_in_background(scopes, scope_key)
+            return cached_token
+
+        # Only one caller fetches the token, others wait and reuse it
+        with self._get_access_token_lock(scope_key):
+            cached_token = self._get_cached_access_token(scope_key)
+            if cached_token:
+                return cached_token
+            with get_tracer().start_span("pylti1p3.access_token.fetch"):
+                return self._fetch_access_token_single_flight(scopes, scope_key)
+
+    def _fetch_access_token_single_flight(self, scopes: t.Sequence[str], scope_key: str) -> str:
+        if not (self._access_token_cache_data_storage and self._access_token_distributed_lock):
+            return self._fetch_access_token(scopes, scope_key)
+
+        lock_acquired = self._acquire_access_token_distributed_lock(scope_key)
+        if not lock_acquired:
+            # Another node is fetching the token right now
+            deadline = time.time() + self._access_token_lock_timeout
+            while time.time() < deadline:
+                time.sleep(self._access_token_lock_poll_interval)
+                token = self._get_fresh_access_token(scope_key)
+                if token:
+                    return token
+
+        try:
+            return self._fetch_access_token(scopes, scope_key)
+        finally:
+            if lock_acquired:
+                self._release_access_token_distributed_lock(scope_key)
+
+    def _fetch_access_token(self, scopes: t.Sequence[str], scope_key: str) -> str:
+        auth_url, auth_request = self._get_access_token_request_data(scopes)
+
+        # Make request to get auth token. The request is safe to repeat: it only issues a new token
+        r = self._send_request("POST", auth_url, idempotent=True, data=auth_request)
         if not r.ok:
             raise LtiServiceException("There was an error while getting an access token from the platform.", r)
         try:
@@ -114,17 +507,6 @@ class ServiceConnector:
         )
         return response["access_token"]
 
-    def encode_jwt(
-        self,
-        message: dict[str, str | int],
-        private_key: str,
-        headers: dict[str, str],
-    ) -> str:
-        jwt_val = jwt.encode(message, private_key, algorithm="RS256", headers=headers)
-        if isinstance(jwt_val, bytes):
-            return jwt_val.decode("utf-8")
-        return jwt_val
-
     def make_service_request(
         self,
         scopes: t.Sequence[str],
@@ -134,55 +516,116 @@ class ServiceConnector:
         content_type: str = "application/json",
         accept: str = "application/json",
         case_insensitive_headers: bool = False,
+        *,
+        retry: bool = True,
+        idempotent: bool | None = None,
     ) -> TServiceConnectorResponse:
+        """
+        :param retry: retry the request according to the retry policy, disable it if the caller retries itself
+        :param idempotent: whether the request may be repeated after server errors (by default it depends on the
+            method)
+        """
+        self._check_service_request_method(method)
         access_token = self.get_access_token(scopes)
-        headers = {"Authorization": "Bearer " + access_token, "Accept": accept}
+        headers = self._get_service_request_headers(access_token, method, content_type, accept)
+        cached_response = None
 
         if method == "GET":
-            r = self._requests_session.get(url, headers=headers)
-        elif method == "DELETE":
-            r = self._requests_session.delete(url, headers=headers)
-        else:
-            headers["Content-Type"] = content_type
-            request_data = data or None
-            if method == "PUT":
-                r = self._requests_session.put(url, data=request_data, headers=headers)
-            elif method == "POST":
-                r = self._requests_session.post(url, data=request_data, headers=headers)
-            else:
-                raise LtiException(
-                    f'Unsupported method: {method}. Available methods are: '
-                    '"GET", "PUT", "POST", "DELETE".'
-                )
+            cached_response = self._get_cached_response(scopes, url, accept)
+            headers.update(self._get_conditional_request_headers(cached_response))
+        r = self._send_request(
+            method,
+            url,
+            retry=retry,
+            idempotent=idempotent,
+            headers=headers,
+            data=(data or None) if method in ("PUT", "POST") else None,
+        )
+
+        self._trace_response_cache(method, cached_response, r.status_code)
+        if r.status_code == 304 and cached_response:
+            return self._get_response_from_cache(cached_response, case_insensitive_headers)
 
         if not r.ok:
             raise LtiServiceException("There was an error making a service request.", r)
 
-        next_page_url = None
-        link_header = r.headers.get("link", "")
-        if link_header:
-            match = re.search(
-                r'<([^>]*)>;\s*rel="next"',
-                link_header.replace("\n", " ").strip(),
-                re.IGNORECASE,
-            )
-            if match:
-                next_page_url = match.group(1)
+        next_page_url = self._get_next_page_url(r.headers.get("link", ""))
 
-        return {
+        response: TServiceConnectorResponse = {
             "headers": r.headers if case_insensitive_headers else dict(r.headers),
             "body": r.json() if r.content else None,
-            "next_page_url": next_page_url if next_page_url else None,
+            "next_page_url": next_page_url,
         }
+        if self._response_cache is not None:
+            if method == "GET":
+                self._cache_response(scopes, url, accept, response)
+            else:
+                self._invalidate_cached_responses(url)
+        return response
+
+    def _send_request(
+        self, method: str, url: str, idempotent: bool | None = None, retry: bool = True, **kwargs
+    ) -> requests.Response:
+        tracer = get_tracer()
+        attempt = 0
+        while True:
+            attempt += 1
+            rate_limiter = self._get_rate_limiter()
+            if rate_limiter:
+                rate_limiter.acquire()
+            with self._start_request_span(method, url, attempt) as span:
+                try:
+                    r: requests.Response | None = self._requests_session.request(method, url, **kwargs)
+                except requests.RequestException as e:
+                    if not retry or not self._should_retry(method, None, attempt, idempotent):
+                        raise
+                    span.set_attribute("error.type", type(e).__name__)
+                    r = None
+                else:
+                    span.set_attribute("http.response.status_code", r.status_code)
+                    if tracer.enabled:
+                        span.set_attribute("http.response.body.size", len(r.content))
+            if r is None:
+                time.sleep(self._get_retry_delay(attempt))
+                continue
+            if r.ok or not retry or not self._should_retry(method, r.status_code, attempt, idempotent):
+                return r
+            time.sleep(self._get_retry_delay(attempt, r.headers.get("Retry-After")))
 
     def get_paginated_data(
         self,
         scopes: t.Sequence[str],
         url: str | None,
         *args,
+        prefetch: bool = False,
         **kwargs,
     ) -> abc.Generator[TServiceConnectorResponse]:
-        while url:
-            response = self.make_service_request(scopes, url, *args, **kwargs)
-            yield response
-            url = response["next_page_url"]
+        """
+        Yields the pages one by one following the "next" links.
+
+        :param prefetch: request the next page in a background thread while the caller processes the current one
+        """
+        tracer = get_tracer()
+        if not prefetch:
+            while url:
+                response = self.make_service_request(scopes, url, *args, **kwargs)
+                tracer.add_counter("pylti1p3.service.pages")
+                yield response
+                url = response["next_page_url"]
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future = executor.submit(self.make_service_request, scopes, url, *args, **kwargs) if url else None
+            while future is not None:
+                response = future.result()
+                tracer.add_counter("pylti1p3.service.pages")
+                next_page_url = response["next_page_url"]
+                if next_page_url:
+                    future = executor.submit(self.make_service_request, scopes, next_page_url, *args, **kwargs)
+                else:
+                    future = None
+                yield response
+        finally:
+            # The caller may stop iterating early, the prefetched page is dropped then
+            executor.shutdown(wait=False, cancel_futures=True)
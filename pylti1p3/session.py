@@ -2,6 +2,8 @@
 
 import typing as t
 
+from .instrumentation import Span, get_tracer
+from .launch_data_codec import LaunchDataCodec
 from .launch_data_storage.session import SessionDataStorage
 from .request import Request
 from .launch_data_storage.base import LaunchDataStorage
@@ -13,12 +15,20 @@ if t.TYPE_CHECKING:
 TStateParams = dict[str, object]
 
 
+class TStateData(t.TypedDict):
+    params: TStateParams | None
+    id_token_hash: str | None
+
+
 class SessionService:
     """Stores nonce, state, and launch payload data in request-scoped storage."""
 
     data_storage: LaunchDataStorage[t.Any]
     _launch_data_lifetime = 86400
+    # The nonce is used once, between the OIDC login and the launch
+    _nonce_lifetime = 600
     _session_prefix = "lti1p3"
+    _launch_data_codec: LaunchDataCodec | None = None
 
     def __init__(self, request: Request):
         self.data_storage = SessionDataStorage()
@@ -27,24 +37,58 @@ class SessionService:
     def _get_key(self, key: str, nonce: str | None = None, add_prefix: bool = True):
         return ((self._session_prefix + "-") if add_prefix else "") + key + (("-" + nonce) if nonce else "")
 
+    def _start_storage_span(self, operation: str) -> Span:
+        tracer = get_tracer()
+        if not tracer.enabled:
+            return tracer.start_span("pylti1p3.storage." + operation)
+        return tracer.start_span("pylti1p3.storage." + operation, {"lti.storage": type(self.data_storage).__name__})
+
     def _set_value(self, key: str, value: object):
-        self.data_storage.set_value(key, value, exp=self._launch_data_lifetime)
+        with self._start_storage_span("set"):
+            self.data_storage.set_value(key, value, exp=self._launch_data_lifetime)
 
     def _get_value(self, key: str) -> t.Any:
-        return self.data_storage.get_value(key)
+        with self._start_storage_span("get") as span:
+            value = self.data_storage.get_value(key)
+            span.set_attribute("lti.storage.hit", value is not None)
+            return value
+
+    def _get_values(self, keys: list[str]) -> dict[str, t.Any]:
+        with self._start_storage_span("get_many") as span:
+            values = self.data_storage.get_many(keys)
+            span.set_attribute("lti.storage.hits", len(values))
+            return values
+
+    def _set_values(self, values: dict[str, object]):
+        with self._start_storage_span("set_many"):
+            self.data_storage.set_many(values, exp=self._launch_data_lifetime)
+
+    def _encode_launch_data(self, jwt_body: "TLaunchData") -> t.Any:
+        if self._launch_data_codec is None:
+            return jwt_body
+        return self._launch_data_codec.encode(jwt_body, binary=self.data_storage.can_store_bytes())
 
     def get_launch_data(self, key: str) -> "TLaunchData":
-        return self._get_value(self._get_key(key, add_prefix=False))
+        value = self._get_value(self._get_key(key, add_prefix=False))
+        # Launch data saved with a codec is decoded regardless of the current settings
+        if LaunchDataCodec.is_encoded(value):
+            return LaunchDataCodec.decode(value)
+        return value
 
     def save_launch_data(self, key: str, jwt_body: "TLaunchData"):
-        self._set_value(self._get_key(key, add_prefix=False), jwt_body)
+        self._set_value(self._get_key(key, add_prefix=False), self._encode_launch_data(jwt_body))
 
     def save_nonce(self, nonce: str):
-        self._set_value(self._get_key("nonce", nonce), True)
+        with self._start_storage_span("set"):
+            self.data_storage.set_value(self._get_key("nonce", nonce), True, exp=self._nonce_lifetime)
 
     def check_nonce(self, nonce: str) -> bool:
+        """
+        Check and remove the nonce, so the same id_token can't be replayed.
+        """
         nonce_key = self._get_key("nonce", nonce)
-        return self.data_storage.check_value(nonce_key)
+        with self._start_storage_span("check"):
+            return self.data_storage.consume_value(nonce_key)
 
     def save_state_params(self, state: str, params: TStateParams):
         self._set_value(self._get_key(state), params)
@@ -58,6 +102,26 @@ class SessionService:
     def check_state_is_valid(self, state: str, id_token_hash: str) -> bool:
         return self._get_value(self._get_key(state + "-id-token-hash")) == id_token_hash
 
+    def get_state(self, state: str) -> TStateData:
+        """
+        Read the id_token hash and the login params of the state in one storage round trip.
+        """
+        params_key = self._get_key(state)
+        id_token_hash_key = self._get_key(state + "-id-token-hash")
+        values = self._get_values([params_key, id_token_hash_key])
+        return {"params": values.get(params_key), "id_token_hash": values.get(id_token_hash_key)}
+
+    def save_launch(self, launch_id: str, jwt_body: "TLaunchData", state: str, id_token_hash: str):
+        """
+        Save the launch data and mark the state as valid in one storage round trip.
+        """
+        self._set_values(
+            {
+                self._get_key(launch_id, add_prefix=False): self._encode_launch_data(jwt_body),
+                self._get_key(state + "-id-token-hash"): id_token_hash,
+            }
+        )
+
     def set_data_storage(self, data_storage: LaunchDataStorage[t.Any]):
         self.data_storage = data_storage
 
@@ -69,3 +133,15 @@ class SessionService:
                 f"{self.data_storage.__class__.__name__} launch storage doesn't support "
                 f"manual change expiration of the keys"
             )
+
+    def set_launch_data_codec(self, codec: LaunchDataCodec | None):
+        self._launch_data_codec = codec
+
+    def set_nonce_lifetime(self, time_sec: int):
+        if self.data_storage.can_set_keys_expiration():
+            self._nonce_lifetime = time_sec
+        else:
+            raise Exception(
+                f"{self.data_storage.__class__.__name__} launch storage doesn't support "
+                f"manual change expiration of the keys"
+            )
@@ -0,0 +1,134 @@
+"""Process-wide pool of HTTP sessions, so requests to a platform reuse kept-alive connections."""
+
+import http.cookiejar
+import os
+import threading
+import urllib.parse
+import weakref
+
+import requests
+from requests.adapters import HTTPAdapter
+
+REQUESTS_USER_AGENT = "PyLTI1p3-client"
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter which applies a default timeout to requests sent without one."""
+
+    _timeout: float | tuple[float, float] | None
+
+    def __init__(self, *args, timeout: float | tuple[float, float] | None = None, **kwargs):
+        self._timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, *args, **kwargs):  # pylint: disable=signature-differs
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self._timeout
+        return super().send(request, *args, **kwargs)
+
+
+class SessionRegistry:
+    """
+    Keeps one ``requests.Session`` per platform origin (scheme and host of its issuer or URLs) for the whole
+    process. Sessions have connection pools sized for concurrent workers, default timeouts and don't store cookies,
+    as they are shared by all launches. Sessions are dropped in forked child processes (e.g. gunicorn with
+    ``--preload``), so workers never share sockets with the master process.
+    """
+
+    _pool_connections: int
+    _pool_maxsize: int
+    _timeout: float | tuple[float, float] | None
+    _sessions: dict[str, requests.Session]
+    _pid: int
+
+    def __init__(
+        self,
+        pool_connections: int = 16,
+        pool_maxsize: int = 32,
+        timeout: float | tuple[float, float] | None = (5.0, 30.0),
+    ):
+        """
+        :param pool_connections: number of hosts with kept-alive connections per session
+        :param pool_maxsize: max number of kept-alive connections per host
+        :param timeout: default (connect, read) timeout in seconds
+        """
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._timeout = timeout
+        self._sessions = {}
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        if hasattr(os, "register_at_fork"):
+            registry_ref = weakref.ref(self)
+
+            def after_fork_in_child():
+                registry = registry_ref()
+                if registry is not None:
+                    registry._after_fork()  # pylint: disable=protected-access
+
+            os.register_at_fork(after_in_child=after_fork_in_child)
+
+    def create_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers["User-Agent"] = REQUESTS_USER_AGENT
+        # Shared sessions must not send cookies set by one platform response along with other launches' requests
+        session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        adapter = TimeoutHTTPAdapter(
+            pool_connections=self._pool_connections, pool_maxsize=self._pool_maxsize, timeout=self._timeout
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def get_session(self, key: str | None = None) -> requests.Session:
+        """
+        Returns the session for the platform.
+
+        :param key: platform's issuer, URL of one of its endpoints or host (optional)
+        :return: requests.Session
+        """
+        key = self.get_key(key)
+        if self._pid != os.getpid():
+            self._after_fork()
+        session = self._sessions.get(key)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(key)
+                if session is None:
+                    session = self.create_session()
+                    self._sessions[key] = session
+        return session
+
+    @staticmethod
+    def get_key(key: str | None) -> str:
+        """
+        Returns the key of the session: the origin of URLs, so issuers and endpoints of a platform share a session.
+
+        :param key: platform's issuer, URL or host
+        :return: key
+        """
+        if not key:
+            return ""
+        url = urllib.parse.urlsplit(key)
+        if url.scheme and url.netloc:
+            return f"{url.scheme}://{url.netloc}".lower()
+        return key.lower()
+
+    def close(self) -> None:
+        """
+        Close all sessions and their connections.
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions = {}
+        for session in sessions:
+            session.close()
+
+    def _after_fork(self) -> None:
+        # Sockets are inherited from the parent process: forget them without closing
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._pid = os.getpid()
+
+
+default_session_registry = SessionRegistry()
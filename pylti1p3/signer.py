@@ -0,0 +1,134 @@
+"""Signers used by the tool to sign JWTs sent to the platform."""
+
+import base64
+import hashlib
+import json
+import typing as t
+from abc import ABC, abstractmethod
+from collections import abc
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+
+from .exception import LtiConfigurationException
+from .memory_cache import MemoryCache
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+class Signer(ABC):
+    """Signs JWT messages (client assertions, deep link responses) with the tool's private key."""
+
+    _algorithm: str = "RS256"
+    _kid: str | None = None
+
+    def get_algorithm(self) -> str:
+        return self._algorithm
+
+    def get_kid(self) -> str | None:
+        return self._kid
+
+    def _get_headers(self, headers: abc.Mapping[str, t.Any] | None) -> dict[str, t.Any]:
+        jwt_headers = dict(headers) if headers else {}
+        kid = self.get_kid()
+        if kid and "kid" not in jwt_headers:
+            jwt_headers["kid"] = kid
+        return jwt_headers
+
+    @abstractmethod
+    def encode_jwt(self, message: abc.Mapping[str, t.Any], headers: abc.Mapping[str, t.Any] | None = None) -> str:
+        """
+        Sign the message.
+
+        :param message: JWT claims
+        :param headers: additional JWT headers. The signer's "kid" is added automatically.
+        :return: encoded JWT
+        """
+        raise NotImplementedError
+
+
+class PrivateKeySigner(Signer):
+    """Loads the PEM private key once and reuses the parsed key object for every signature."""
+
+    # Parsed keys shared by all registrations: hash of the PEM (+ kid, alg) -> signer
+    _signers: "MemoryCache[tuple[str, str | None, str], PrivateKeySigner]" = MemoryCache(maxsize=128)
+
+    def __init__(self, private_key: str, kid: str | None = None, algorithm: str = "RS256"):
+        self._private_key = serialization.load_pem_private_key(private_key.encode("utf-8"), password=None)
+        self._kid = kid
+        self._algorithm = algorithm
+
+    @classmethod
+    def from_pem(cls, private_key: str, kid: str | None = None, algorithm: str = "RS256") -> "PrivateKeySigner":
+        """
+        Returns a signer for the PEM private key. Signers are cached, so each key is parsed only once per process.
+        """
+        cache_key = (hashlib.sha256(private_key.encode("utf-8")).hexdigest(), kid, algorithm)
+        signer = cls._signers.get(cache_key)
+        if signer is None:
+            signer = cls(private_key, kid, algorithm)
+            cls._signers.set(cache_key, signer)
+        return signer
+
+    def encode_jwt(self, message: abc.Mapping[str, t.Any], headers: abc.Mapping[str, t.Any] | None = None) -> str:
+        jwt_val = jwt.encode(
+            dict(message),
+            self._private_key,  # type: ignore
+            algorithm=self._algorithm,
+            headers=self._get_headers(headers) or None,
+        )
+        if isinstance(jwt_val, bytes):
+            return jwt_val.decode("utf-8")
+        return jwt_val
+
+
+class ExternalSigner(Signer):
+    """
+    Delegates the signature to an external service (KMS, HSM/PKCS#11 module) which never exposes the private key.
+    The callable receives the JWS signing input and must return the signature, e.g. the RSASSA-PKCS1-v1_5
+    SHA-256 signature for RS256. RSA (RS*, PS*) signatures are used as is. KMS/HSM return ECDSA (ES*) signatures
+    DER-encoded, they are converted to the fixed-size r||s value required by JWS (raw r||s is accepted too).
+    """
+
+    # Supported algorithms -> size (bytes) of each ECDSA integer in the JWS signature, None for RSA
+    _algorithms: dict[str, int | None] = {
+        "RS256": None,
+        "RS384": None,
+        "RS512": None,
+        "PS256": None,
+        "PS384": None,
+        "PS512": None,
+        "ES256": 32,
+        "ES384": 48,
+        "ES512": 66,
+    }
+
+    _sign: abc.Callable[[bytes], bytes]
+
+    def __init__(self, sign: abc.Callable[[bytes], bytes], kid: str | None = None, algorithm: str = "RS256"):
+        if algorithm not in self._algorithms:
+            raise LtiConfigurationException(f"Unsupported algorithm of the external signer: {algorithm}")
+        self._sign = sign
+        self._kid = kid
+        self._algorithm = algorithm
+
+    def _get_jws_signature(self, signature: bytes) -> bytes:
+        int_size = self._algorithms[self._algorithm]
+        if int_size is None or len(signature) == 2 * int_size:
+            return signature
+        r, s = decode_dss_signature(signature)
+        return r.to_bytes(int_size, "big") + s.to_bytes(int_size, "big")
+
+    def encode_jwt(self, message: abc.Mapping[str, t.Any], headers: abc.Mapping[str, t.Any] | None = None) -> str:
+        jwt_headers = {"alg": self._algorithm, "typ": "JWT"}
+        jwt_headers.update(self._get_headers(headers))
+        segments = [
+            _b64encode(json.dumps(jwt_headers, separators=(",", ":")).encode("utf-8")),
+            _b64encode(json.dumps(dict(message), separators=(",", ":")).encode("utf-8")),
+        ]
+        signing_input = ".".join(segments).encode("ascii")
+        segments.append(_b64encode(self._get_jws_signature(self._sign(signing_input))))
+        return ".".join(segments)
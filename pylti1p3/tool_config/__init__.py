@@ -1,6 +1,7 @@
 """Tool-configuration backends and abstract lookup helpers."""
 
 # flake8: noqa
+from .abstract import TJwksResponse as TJwksResponse
 from .abstract import ToolConfAbstract as ToolConfAbstract
 from .dict import ToolConfDict as ToolConfDict
 from .json_file import ToolConfJsonFile as ToolConfJsonFile
@@ -1,6 +1,8 @@
 """Abstract tool-configuration lookup helpers."""
 
 from enum import StrEnum
+import hashlib
+import json
 import typing as t
 import collections.abc
 from abc import ABC, abstractmethod
@@ -9,6 +11,7 @@ from ..actions import Action
 from ..request import Request
 from ..deployment import Deployment
 from ..exception import LtiConfigurationException
+from ..memory_cache import MemoryCache
 from ..registration import Registration
 
 
@@ -19,10 +22,29 @@ class IssuerToClientRelation(StrEnum):
     MANY_CLIENTS_IDS_PER_ISSUER = "one-issuer-many-client-ids"
 
 
+class TJwksResponse(t.TypedDict):
+    """Serialized JWKS with the headers of the JWKS endpoint."""
+
+    body: bytes
+    etag: str
+    cache_control: str
+
+
 class ToolConfAbstract(ABC):
     """Defines the lookup methods used to resolve registrations and deployments."""
 
     issuers_relation_types: collections.abc.MutableMapping[str, IssuerToClientRelation] = {}
+    # True if find_registration* depends only on iss and client_id (not on the request), so
+    # MessageLaunch.from_cache may reuse the registration found for a previous restored launch
+    static_registrations: bool = False
+    _registrations_version: int = 0
+    # Identifies the registrations of this tool config object in process-wide caches
+    _registrations_token: object | None = None
+    # Lifetime (sec) of the serialized JWKS, 0 disables the cache
+    jwks_cache_lifetime: int = 300
+    # max-age (sec) of the Cache-Control header of the JWKS endpoint
+    jwks_max_age: int = 600
+    _jwks_cache: MemoryCache[collections.abc.Hashable, TJwksResponse] | None = None
 
     def check_iss_has_one_client(self, iss: str) -> bool:
         """
@@ -139,3 +161,54 @@ class ToolConfAbstract(ABC):
                 raise LtiConfigurationException("Invalid issuer relation type")
             keys = reg.get_jwks()
         return {"keys": keys}
+
+    def get_registrations_version(self) -> collections.abc.Hashable:
+        """
+        Changes when the registrations or the tool keys are changed, the registrations cached by the launches
+        of the other versions aren't used.
+        """
+        return self._registrations_version
+
+    def get_registrations_cache_key(self) -> collections.abc.Hashable:
+        """
+        Key of the registrations of this tool config in process-wide caches (e.g. the registrations of restored
+        launches). Tool configs with the same key must find the same registrations. By default it is unique for
+        every tool config object and changes with get_registrations_version.
+        """
+        if self._registrations_token is None:
+            self._registrations_token = object()
+        return (self._registrations_token, self.get_registrations_version())
+
+    def _get_jwks_cache_key(self, iss: str | None, client_id: str | None) -> collections.abc.Hashable:
+        return (iss, client_id)
+
+    def get_jwks_response(self, iss: str | None = None, client_id: str | None = None) -> TJwksResponse:
+        """
+        Serialized output of get_jwks with a strong ETag. The body is built once and reused until the keys
+        are changed (see invalidate_jwks_cache) or jwks_cache_lifetime expires.
+
+        :param iss: issuer (all keys when not set)
+        :param client_id: client_id for the issuers with many clients
+        :return: TJwksResponse
+        """
+        if self._jwks_cache is None:
+            self._jwks_cache = MemoryCache(maxsize=256)
+        cache_key = self._get_jwks_cache_key(iss, client_id)
+        response = self._jwks_cache.get(cache_key) if self.jwks_cache_lifetime else None
+        if response is None:
+            body = json.dumps(self.get_jwks(iss, client_id), sort_keys=True, separators=(",", ":")).encode("utf-8")
+            response = {
+                "body": body,
+                "etag": '"' + hashlib.sha256(body).hexdigest() + '"',
+                "cache_control": f"public, max-age={self.jwks_max_age}",
+            }
+            if self.jwks_cache_lifetime:
+                self._jwks_cache.set(cache_key, response, self.jwks_cache_lifetime)
+        return response
+
+    def invalidate_jwks_cache(self) -> None:
+        """
+        Drop the serialized JWKS, should be called when the tool keys are changed.
+        """
+        if self._jwks_cache is not None:
+            self._jwks_cache.clear()
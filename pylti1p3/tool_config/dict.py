@@ -7,6 +7,7 @@ from collections import abc
 from ..deployment import Deployment
 from ..exception import LtiConfigurationException
 from ..registration import Registration, TKeySet
+from ..signer import Signer
 from .abstract import ToolConfAbstract
 
 
@@ -36,6 +37,8 @@ class ToolConfDict(ToolConfAbstract):
     _public_key_one_client: dict[str, str]
     _private_key_many_clients: dict[str, dict[str, str]]
     _public_key_many_clients: dict[str, dict[str, str]]
+    _signers: dict[tuple[str, str | None], Signer]
+    static_registrations = True
 
     def __init__(self, json_data: TJsonData):
         """
@@ -102,12 +105,11 @@ class ToolConfDict(ToolConfAbstract):
         self._private_key_many_clients = {}
         self._public_key_one_client = {}
         self._public_key_many_clients = {}
+        self._signers = {}
 
     def _validate_iss_config_item(self, iss: str, iss_conf: TIssConf):
         if not isinstance(iss_conf, dict):
-            raise LtiConfigurationException(
-                f"Invalid configuration {iss} for the {str(iss_conf)} issuer. Must be dict"
-            )
+            raise LtiConfigurationException(f"Invalid configuration {iss} for the {str(iss_conf)} issuer. Must be dict")
         required_keys = [
             "auth_login_url",
             "auth_token_url",
@@ -126,14 +128,17 @@ class ToolConfDict(ToolConfAbstract):
 
     def _get_registration(self, iss: str, iss_conf: TIssConf) -> Registration:
         reg = Registration()
+        signer = self.get_signer(iss, iss_conf["client_id"])
         tool_private_key = self.get_private_key(iss, iss_conf["client_id"])
-        if not tool_private_key:
+        if not tool_private_key and not signer:
             raise Exception(f"Private key not found for iss {iss} client_id {iss_conf['client_id']}")
         reg.set_auth_login_url(iss_conf["auth_login_url"]).set_auth_token_url(iss_conf["auth_token_url"]).set_client_id(
             iss_conf["client_id"]
-        ).set_key_set(iss_conf.get("key_set")).set_key_set_url(iss_conf.get("key_set_url")).set_issuer(
-            iss
-        ).set_tool_private_key(tool_private_key)
+        ).set_key_set(iss_conf.get("key_set")).set_key_set_url(iss_conf.get("key_set_url")).set_issuer(iss).set_signer(
+            signer
+        )
+        if tool_private_key:
+            reg.set_tool_private_key(tool_private_key)
         auth_audience = iss_conf.get("auth_audience")
         if auth_audience:
             reg.set_auth_audience(auth_audience)
@@ -171,6 +176,10 @@ class ToolConfDict(ToolConfAbstract):
         iss_conf = self.get_iss_config(iss, client_id)
         return self._get_deployment(iss_conf, deployment_id)
 
+    def _keys_changed(self):
+        self._registrations_version += 1
+        self.invalidate_jwks_cache()
+
     def set_public_key(self, iss: str, key_content: str, client_id: str | None = None):
         if self.check_iss_has_many_clients(iss):
             if not client_id:
@@ -180,6 +189,7 @@ class ToolConfDict(ToolConfAbstract):
             self._public_key_many_clients[iss][client_id] = key_content
         else:
             self._public_key_one_client[iss] = key_content
+        self._keys_changed()
 
     def get_public_key(self, iss: str, client_id: str | None = None):
         if self.check_iss_has_many_clients(iss):
@@ -200,6 +210,7 @@ class ToolConfDict(ToolConfAbstract):
             self._private_key_many_clients[iss][client_id] = key_content  # type: ignore
         else:
             self._private_key_one_client[iss] = key_content
+        self._keys_changed()
 
     def get_private_key(self, iss: str, client_id: str | None = None) -> str | None:
         if self.check_iss_has_many_clients(iss):
@@ -211,6 +222,25 @@ class ToolConfDict(ToolConfAbstract):
             return clients_dict.get(client_id)
         return self._private_key_one_client.get(iss)
 
+    def set_signer(self, iss: str, signer: Signer, client_id: str | None = None):
+        """
+        Sign JWTs with a custom signer (e.g. KMS/HSM) instead of the private key.
+        """
+        if self.check_iss_has_many_clients(iss):
+            if not client_id:
+                raise LtiConfigurationException("Can't set signer: missing client_id")
+            self._signers[(iss, client_id)] = signer
+        else:
+            self._signers[(iss, None)] = signer
+        self._keys_changed()
+
+    def get_signer(self, iss: str, client_id: str | None = None) -> Signer | None:
+        if self.check_iss_has_many_clients(iss):
+            if not client_id:
+                raise LtiConfigurationException("Can't get signer: missing client_id")
+            return self._signers.get((iss, client_id))
+        return self._signers.get((iss, None))
+
     def get_iss_config(self, iss: str, client_id: str | None = None):
         if not self._config:
             raise LtiConfigurationException("Config is not set")
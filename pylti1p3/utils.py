@@ -1,4 +1,4 @@
-"""Miscellaneous URL helpers."""
+"""Miscellaneous URL and HTTP helpers."""
 
 import urllib.parse as urlparse  # type: ignore
 from urllib.parse import urlencode  # type: ignore
@@ -12,3 +12,14 @@ def add_param_to_url(url: str, param_name: str, param_value: object) -> str:
     query[str(param_name)] = str(param_value)
     url_parts[4] = urlencode(query)
     return urlparse.urlunparse(url_parts)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check the ``If-None-Match`` request header against the ETag of the current response."""
+
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison
+    return etag.removeprefix("W/") in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
@@ -13,6 +13,15 @@ class Cache:
     def set(self, key, value, exp=None):  # pylint: disable=unused-argument
         self._data[key] = value
 
+    def add(self, key, value, exp=None):  # pylint: disable=unused-argument
+        if key in self._data:
+            return False
+        self._data[key] = value
+        return True
+
+    def delete(self, key):
+        self._data.pop(key, None)
+
 
 class FakeCacheDataStorage(CacheDataStorage):
     def __init__(self, *args, **kwargs):
@@ -0,0 +1,20 @@
+import unittest
+
+from benchmarks import launch, pagination, serialization
+
+
+class TestBenchmarks(unittest.TestCase):
+    def _check_results(self, results, names_count):
+        self.assertEqual(len(results), names_count)
+        for result in results:
+            self.assertEqual(result["number"], 1)
+            self.assertGreater(result["ops_per_second"], 0)
+
+    def test_launch(self):
+        self._check_results(launch.get_results(number=1, repeat=1), 10)
+
+    def test_serialization(self):
+        self._check_results(serialization.get_results(number=1, repeat=1), 3)
+
+    def test_pagination(self):
+        self._check_results(pagination.get_results(number=1, repeat=1, pages=2, page_size=2), 2)
@@ -0,0 +1,151 @@
+import json
+import sys
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+
+class FakeDjangoCache:
+    def __init__(self):
+        self.data = {}
+        self.get_calls = 0
+
+    def get(self, key):
+        self.get_calls += 1
+        return self.data.get(key)
+
+    def set(self, key, value, timeout):
+        self.data[key] = value
+
+    def add(self, key, value, timeout):
+        return self.data.setdefault(key, value) is value
+
+
+class TestDjangoDbToolConf(unittest.TestCase):
+    iss = "https://canvas.instructure.com"
+    client_id = "10000000000004"
+
+    def setUp(self):
+        # The Django tests patch django.shortcuts.redirect before importing pylti1p3.contrib.django,
+        # so the package is dropped from sys.modules after every test
+        self.enterContext(patch.dict(sys.modules))
+        # pylint: disable=import-outside-toplevel
+        from pylti1p3.contrib.django import lti1p3_tool_config
+
+        self.tool_conf_module = lti1p3_tool_config
+        lti1p3_tool_config.DjangoDbToolConf._cache.clear()
+        lti1p3_tool_config.DjangoDbToolConf._cache_versions.clear()
+        self.django_cache = FakeDjangoCache()
+        patcher = patch("django.core.cache.cache", self.django_cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.lti_tool = types.SimpleNamespace(
+            issuer=self.iss,
+            client_id=self.client_id,
+            auth_login_url="https://canvas.instructure.com/api/lti/authorize_redirect",
+            auth_token_url="https://canvas.instructure.com/login/oauth2/token",
+            auth_audience="",
+            key_set_url="https://canvas.instructure.com/api/lti/security/jwks",
+            key_set="",
+            deployment_ids=json.dumps(["1", "2"]),
+            tool_key=types.SimpleNamespace(private_key="private", public_key="public"),
+        )
+        self.tools_cls = MagicMock()
+        self.tools_cls.objects.select_related.return_value.get.return_value = self.lti_tool
+
+    def _get_tool_conf(self, cache_lifetime=None):
+        # The models need configured Django settings, the tool config gets fakes instead
+        tool_conf = self.tool_conf_module.DjangoDbToolConf.__new__(self.tool_conf_module.DjangoDbToolConf)
+        tool_conf._lti_tools = {}
+        tool_conf._tools_cls = self.tools_cls
+        if cache_lifetime is not None:
+            tool_conf._cache_lifetime = cache_lifetime
+        return tool_conf
+
+    def _get_queries_count(self):
+        return self.tools_cls.objects.select_related.return_value.get.call_count
+
+    def test_registration_is_cached_per_process(self):
+        registration = self._get_tool_conf().find_registration_by_params(self.iss, self.client_id)
+        self.assertEqual(registration.get_client_id(), self.client_id)
+        self.assertEqual(registration.get_tool_private_key(), "private")
+        self.tools_cls.objects.select_related.assert_called_with("tool_key")
+
+        tool_conf = self._get_tool_conf()
+        registration.set_key_set({"keys": []})
+        self.assertIsNone(tool_conf.find_registration_by_params(self.iss, self.client_id).get_key_set())
+        self.assertEqual(tool_conf.find_deployment_by_params(self.iss, "2", self.client_id).get_deployment_id(), "2")
+        self.assertIsNone(tool_conf.find_deployment_by_params(self.iss, "3", self.client_id))
+        self.assertEqual(self._get_queries_count(), 1)
+
+    def _get_version(self):
+        return self.django_cache.get(self.tool_conf_module.DjangoDbToolConf._cache_version_key)
+
+    def test_invalidation(self):
+        self._get_tool_conf().find_registration_by_params(self.iss, self.client_id)
+        version = self._get_version()
+        self.tool_conf_module.invalidate_tool_conf_cache(sender=None, instance=self.lti_tool)
+        self.assertNotIn(self._get_version(), (None, version))
+
+        self.lti_tool.deployment_ids = json.dumps(["3"])
+        tool_conf = self._get_tool_conf()
+        self.assertIsNotNone(tool_conf.find_deployment_by_params(self.iss, "3", self.client_id))
+        self.assertEqual(self._get_queries_count(), 2)
+
+    def test_invalidation_by_other_process(self):
+        self.enterContext(patch.object(self.tool_conf_module.DjangoDbToolConf, "_cache_version_check_interval", 0))
+        self._get_tool_conf().find_registration_by_params(self.iss, self.client_id)
+        # Another process replaced the version, the local entry is stale
+        self.django_cache.set(self.tool_conf_module.DjangoDbToolConf._cache_version_key, "other-version", None)
+
+        self._get_tool_conf().find_registration_by_params(self.iss, self.client_id)
+        self._get_tool_conf().find_registration_by_params(self.iss, self.client_id)
+        self.assertEqual(self._get_queries_count(), 2)
+
+    def test_evicted_version(self):
+        self.enterContext(patch.object(self.tool_conf_module.DjangoDbToolConf, "_cache_version_check_interval", 0))
+        self._get_tool_conf().find_registration_by_params(self.iss, self.client_id)
+        version = self._get_version()
+        self.tool_conf_module.DjangoDbToolConf.invalidate_cache()
+        self._get_tool_conf().find_registration_by_params(self.iss, self.client_id)
+        self.assertEqual(self._get_queries_count(), 2)
+
+        # The version key is evicted: a new version is added instead of one of the previous versions
+        del self.django_cache.data[self.tool_conf_module.DjangoDbToolConf._cache_version_key]
+        self._get_tool_conf().find_registration_by_params(self.iss, self.client_id)
+        self.assertNotIn(self._get_version(), (None, version))
+        self.assertEqual(self._get_queries_count(), 3)
+
+    def test_registrations_cache_key(self):
+        registrations_cache_key = self._get_tool_conf().get_registrations_cache_key()
+        self.assertEqual(self._get_tool_conf().get_registrations_cache_key(), registrations_cache_key)
+        self.tool_conf_module.DjangoDbToolConf.invalidate_cache()
+        self.assertNotEqual(self._get_tool_conf().get_registrations_cache_key(), registrations_cache_key)
+
+    def test_version_is_read_once_per_interval(self):
+        for _ in range(3):
+            tool_conf = self._get_tool_conf()
+            tool_conf.find_registration_by_params(self.iss, self.client_id)
+            tool_conf.find_deployment_by_params(self.iss, "1", self.client_id)
+        self.assertEqual(self.django_cache.get_calls, 2)
+        self.assertEqual(self._get_queries_count(), 1)
+
+    def test_disabled_cache(self):
+        self._get_tool_conf(cache_lifetime=0).find_registration_by_params(self.iss, self.client_id)
+        self._get_tool_conf(cache_lifetime=0).find_registration_by_params(self.iss, self.client_id)
+        self.assertEqual(self._get_queries_count(), 2)
+
+    def test_disabled_cache_of_restored_launches(self):
+        # pylint: disable=import-outside-toplevel
+        from pylti1p3.message_launch import MessageLaunch
+
+        self.assertTrue(self._get_tool_conf().static_registrations)
+        MessageLaunch._restored_registrations.clear()  # pylint: disable=protected-access
+        for _ in range(2):
+            launch = MagicMock(spec=MessageLaunch, _tool_config=self._get_tool_conf(cache_lifetime=0))
+            launch.get_iss.return_value = self.iss
+            launch.get_client_id.return_value = self.client_id
+            MessageLaunch.validate_restored_registration(launch)
+            launch.validate_registration.assert_called_once_with()
+        self.assertEqual(len(MessageLaunch._restored_registrations), 0)  # pylint: disable=protected-access
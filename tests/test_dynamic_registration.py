@@ -1,9 +1,13 @@
 import json
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+
+import requests
+import requests_mock
 
 from pylti1p3.dynamic_registration import DynamicRegistration, generate_key_pair
 from pylti1p3.exception import LtiException, LtiServiceException
+from pylti1p3.session_registry import SessionRegistry
 
 
 class FakeSession:
@@ -11,11 +15,13 @@ class FakeSession:
         self.get_response = get_response
         self.post_response = post_response
         self.post_calls = []
+        self.close_calls = 0
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc, tb):
+        self.close_calls += 1
         return False
 
     def get(self, _url):
@@ -107,6 +113,33 @@ class TestDynamicRegistrationFlow(unittest.TestCase):
         self.assertEqual(session.post_calls[0][0], "https://platform.example/register")
         self.assertEqual(session.post_calls[0][1]["Authorization"], "Bearer secret-token")
         self.assertEqual(session.post_calls[0][2]["client_name"], "Tool")
+        self.assertEqual(session.close_calls, 2)
+
+    def test_register_uses_shared_session_of_platform(self):
+        class SharedSessionRegistration(TestDynamicRegistration):
+            get_request_session = DynamicRegistration.get_request_session
+
+        registry = SessionRegistry()
+        registration = SharedSessionRegistration()
+        registration._session_registry = registry  # pylint: disable=protected-access
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://platform.example/openid",
+                json={
+                    "registration_endpoint": "https://platform.example/register",
+                    "https://purl.imsglobal.org/spec/lti-platform-configuration": {},
+                },
+            )
+            m.post(
+                "https://platform.example/register",
+                json={"client_id": "client-123", "https://purl.imsglobal.org/spec/lti-tool-configuration": {}},
+            )
+            with patch.object(requests.Session, "close") as close:
+                result = registration.register()
+
+        self.assertEqual(result, {"saved": True, "client_id": "client-123"})
+        close.assert_not_called()
+        self.assertEqual(list(registry._sessions), ["https://platform.example"])  # pylint: disable=protected-access
 
     def test_register_requires_openid_configuration_endpoint(self):
         registration = TestDynamicRegistration(openid_configuration_endpoint="")
@@ -0,0 +1,202 @@
+import asyncio
+import json
+import threading
+import unittest
+from urllib.parse import parse_qs
+
+import httpx
+
+from pylti1p3.contrib.fastapi.async_assignments_grades import AsyncAssignmentsGradesService
+from pylti1p3.contrib.fastapi.async_course_groups import AsyncCourseGroupsService
+from pylti1p3.contrib.fastapi.async_names_roles import AsyncNamesRolesProvisioningService
+from pylti1p3.contrib.fastapi.async_service_connector import AsyncServiceConnector
+from pylti1p3.exception import LtiServiceException
+from pylti1p3.grade import Grade
+
+from .cache import Cache, FakeCacheDataStorage
+from .tool_config import get_test_tool_conf
+
+
+class ThreadRecordingCache(Cache):
+    def __init__(self):
+        super().__init__()
+        self.threads = set()
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        return super().get(key)
+
+    def set(self, key, value, exp=None):
+        self.threads.add(threading.get_ident())
+        super().set(key, value, exp)
+
+    def add(self, key, value, exp=None):
+        self.threads.add(threading.get_ident())
+        return super().add(key, value, exp)
+
+    def delete(self, key):
+        self.threads.add(threading.get_ident())
+        super().delete(key)
+
+
+class StubPlatform:
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests: list[httpx.Request] = []
+        self.token_requests = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        url = str(request.url)
+        if url == "http://canvas.docker/login/oauth2/token":
+            self.token_requests += 1
+            # Give concurrent callers a chance to pile up behind the lock
+            await asyncio.sleep(0.01)
+            scope = parse_qs(request.content.decode())["scope"][0]
+            return httpx.Response(200, json={"access_token": "token-" + scope, "expires_in": 3600})
+        status, body, headers = self.routes[(request.method, url)]
+        return httpx.Response(status, json=body, headers=headers)
+
+    def connector(self) -> AsyncServiceConnector:
+        registration = get_test_tool_conf().find_registration("https://canvas.instructure.com")
+        assert registration is not None
+        return AsyncServiceConnector(registration, httpx.AsyncClient(transport=httpx.MockTransport(self.handler)))
+
+
+class TestAsyncServiceConnector(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_requests_fetch_token_once(self):
+        platform = StubPlatform({("GET", "http://lms.example/members"): (200, {"members": []}, {})})
+        connector = platform.connector()
+
+        responses = await asyncio.gather(
+            *[connector.make_service_request(["scope-a"], "http://lms.example/members") for _ in range(10)]
+        )
+
+        self.assertEqual(platform.token_requests, 1)
+        self.assertEqual(len(responses), 10)
+        self.assertEqual(platform.requests[-1].headers["Authorization"], "Bearer token-scope-a")
+
+    async def test_failed_request_raises_service_exception(self):
+        platform = StubPlatform({("GET", "http://lms.example/members"): (500, {}, {})})
+        connector = platform.connector()
+
+        with self.assertRaises(LtiServiceException) as ctx:
+            await connector.make_service_request(["scope-a"], "http://lms.example/members")
+        self.assertEqual(ctx.exception.response.status_code, 500)
+
+    async def test_paginated_data(self):
+        platform = StubPlatform(
+            {
+                ("GET", "http://lms.example/members"): (
+                    200,
+                    {"members": [{"user_id": "1"}]},
+                    {"Link": '<http://lms.example/members?page=2>; rel="next"'},
+                ),
+                ("GET", "http://lms.example/members?page=2"): (200, {"members": [{"user_id": "2"}]}, {}),
+            }
+        )
+        nrps = AsyncNamesRolesProvisioningService(
+            platform.connector(), {"context_memberships_url": "http://lms.example/members"}
+        )
+
+        members = await nrps.get_members()
+
+        self.assertEqual([m["user_id"] for m in members], ["1", "2"])
+
+    async def test_iter_members_prefetch(self):
+        platform = StubPlatform(
+            {
+                ("GET", "http://lms.example/members"): (
+                    200,
+                    {"members": [{"user_id": "1"}]},
+                    {"Link": '<http://lms.example/members?page=2>; rel="next"'},
+                ),
+                ("GET", "http://lms.example/members?page=2"): (200, {"members": [{"user_id": "2"}]}, {}),
+            }
+        )
+        nrps = AsyncNamesRolesProvisioningService(
+            platform.connector(), {"context_memberships_url": "http://lms.example/members"}
+        )
+        members = nrps.iter_members(prefetch=True)
+
+        self.assertEqual((await anext(members))["user_id"], "1")
+        await asyncio.sleep(0.05)
+        # The second page is requested while the first one is still being processed
+        self.assertEqual(str(platform.requests[-1].url), "http://lms.example/members?page=2")
+        self.assertEqual([m["user_id"] async for m in members], ["2"])
+
+    async def test_response_caching(self):
+        platform = StubPlatform({("GET", "http://lms.example/context"): (200, {"id": "1"}, {"ETag": '"v1"'})})
+        connector = platform.connector().set_response_caching(FakeCacheDataStorage())
+
+        await connector.make_service_request(["scope-a"], "http://lms.example/context")
+        platform.routes[("GET", "http://lms.example/context")] = (304, None, {})
+        response = await connector.make_service_request(["scope-a"], "http://lms.example/context")
+
+        self.assertEqual(platform.requests[-1].headers["If-None-Match"], '"v1"')
+        self.assertEqual(response["body"], {"id": "1"})
+
+    async def test_storages_are_used_outside_event_loop(self):
+        platform = StubPlatform(
+            {
+                ("GET", "http://lms.example/context"): (200, {"id": "1"}, {"ETag": '"v1"'}),
+                ("POST", "http://lms.example/context"): (200, {"id": "1"}, {}),
+            }
+        )
+        data_storage = FakeCacheDataStorage()
+        data_storage._cache = ThreadRecordingCache()  # pylint: disable=protected-access
+        connector = (
+            platform.connector()
+            .set_access_token_caching(data_storage, distributed_lock=True)
+            .set_response_caching(data_storage)
+        )
+
+        await connector.make_service_request(["scope-a"], "http://lms.example/context")
+        await connector.make_service_request(["scope-a"], "http://lms.example/context", method="POST", data="{}")
+
+        self.assertTrue(data_storage._cache.threads)  # pylint: disable=protected-access
+        self.assertNotIn(threading.get_ident(), data_storage._cache.threads)  # pylint: disable=protected-access
+
+
+class TestAsyncServices(unittest.IsolatedAsyncioTestCase):
+    async def test_put_grade(self):
+        platform = StubPlatform({("POST", "http://lms.example/lineitems/1/scores"): (200, {}, {})})
+        ags = AsyncAssignmentsGradesService(
+            platform.connector(),
+            {
+                "scope": ["https://purl.imsglobal.org/spec/lti-ags/scope/score"],
+                "lineitem": "http://lms.example/lineitems/1",
+            },
+        )
+        grade = Grade().set_score_given(5).set_score_maximum(10).set_user_id("1")
+
+        await ags.put_grade(grade)
+
+        score_request = platform.requests[-1]
+        self.assertEqual(score_request.headers["Content-Type"], "application/vnd.ims.lis.v1.score+json")
+        self.assertEqual(json.loads(score_request.content)["scoreGiven"], 5)
+
+    async def test_get_sets_with_groups(self):
+        platform = StubPlatform(
+            {
+                ("GET", "http://lms.example/sets"): (200, {"sets": [{"id": "s1", "name": "Set"}]}, {}),
+                ("GET", "http://lms.example/groups"): (
+                    200,
+                    {"groups": [{"id": "g1", "name": "Group", "set_id": "s1"}]},
+                    {},
+                ),
+            }
+        )
+        cgs = AsyncCourseGroupsService(
+            platform.connector(),
+            {
+                "context_groups_url": "http://lms.example/groups",
+                "context_group_sets_url": "http://lms.example/sets",
+                "scope": ["https://purl.imsglobal.org/spec/lti-gs/scope/contextgroup.readonly"],
+                "service_versions": ["1.0"],
+            },
+        )
+
+        sets = await cgs.get_sets(include_groups=True)
+
+        self.assertEqual(sets[0]["groups"][0]["id"], "g1")
@@ -0,0 +1,99 @@
+import json
+import unittest
+from unittest.mock import patch
+
+import httpx
+import starlette.datastructures
+import requests_mock
+import starlette.requests
+from jwcrypto.jwk import JWK
+
+from pylti1p3.contrib.fastapi import FastAPIMessageLaunch, FastAPIRequest
+from pylti1p3.exception import LtiException
+from pylti1p3.jwks_manager import JwksManager
+
+from . import test_resource_link
+from .cache import FakeCacheDataStorage
+from .tool_config import TOOL_CONFIG, get_test_tool_conf
+
+
+class TestFastAPIMessageLaunchAsync(unittest.IsolatedAsyncioTestCase):
+    resource_link = test_resource_link.ResourceLinkBase
+    key_set_url = TOOL_CONFIG["https://canvas.instructure.com"]["key_set_url"]
+
+    def setUp(self):
+        FastAPIMessageLaunch._public_key_objects.clear()  # pylint: disable=protected-access
+        self.key_set_requests = 0
+        self.key_set_response = json.dumps(self.resource_link.jwt_canvas_keys)
+
+    def _handler(self, request: httpx.Request) -> httpx.Response:
+        assert str(request.url) == self.key_set_url
+        self.key_set_requests += 1
+        return httpx.Response(200, text=self.key_set_response)
+
+    def _get_launch(self, tool_conf, post_data=None):
+        state = self.resource_link.post_launch_data["state"]
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "scheme": "http",
+            "server": ("lti.django.test", 80),
+            "path": "/launch/",
+            "query_string": b"",
+            "headers": [(b"cookie", f"lti1p3-{state}={state}".encode())],
+            "session": {"lti1p3-nonce-test-uuid-1234": True},
+        }
+        form_data = starlette.datastructures.FormData(post_data or self.resource_link.post_launch_data)
+        request = FastAPIRequest(starlette.requests.Request(scope), form_data)
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(self._handler))
+        launch = FastAPIMessageLaunch(request, tool_conf, http_client=http_client)
+        return launch.set_jwt_verify_options({"verify_aud": False, "verify_exp": False})
+
+    async def test_validate_async(self):
+        launch = await self._get_launch(get_test_tool_conf()).validate_async()
+
+        self.assertDictEqual(launch.get_launch_data(), self.resource_link.expected_message_launch_data)
+        self.assertEqual(self.key_set_requests, 1)
+
+    async def test_validate_async_uses_public_key_cache(self):
+        cache = FakeCacheDataStorage()
+
+        for _ in range(2):
+            launch = self._get_launch(get_test_tool_conf())
+            launch.set_public_key_caching(cache)
+            await launch.validate_async()
+
+        self.assertEqual(self.key_set_requests, 1)
+
+    async def test_validate_async_parses_public_key_once(self):
+        with patch.object(JWK, "get_op_key", autospec=True, side_effect=JWK.get_op_key) as get_op_key:
+            for _ in range(2):
+                await self._get_launch(get_test_tool_conf()).validate_async()
+
+        self.assertEqual(get_op_key.call_count, 1)
+
+    async def test_validate_async_with_jwks_manager(self):
+        manager = JwksManager(background_refresh=False)
+        with requests_mock.Mocker() as m:
+            m.get(self.key_set_url, text=self.key_set_response)
+            for _ in range(2):
+                launch = self._get_launch(get_test_tool_conf()).set_jwks_manager(manager)
+                await launch.validate_async()
+            self.assertEqual(m.call_count, 1)
+        self.assertEqual(self.key_set_requests, 0)
+
+    async def test_validate_async_invalid_public_key(self):
+        self.key_set_response = "invalid_key_set"
+        launch = self._get_launch(get_test_tool_conf())
+
+        with self.assertRaisesRegex(LtiException, "Invalid response"):
+            await launch.validate_async()
+
+    async def test_validate_async_keeps_validation_order(self):
+        post_data = dict(self.resource_link.post_launch_data)
+        post_data["state"] = "unknown-state"
+        launch = self._get_launch(get_test_tool_conf(), post_data=post_data)
+
+        with self.assertRaisesRegex(LtiException, "State not found"):
+            await launch.validate_async()
+        self.assertEqual(self.key_set_requests, 0)
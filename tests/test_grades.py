@@ -3,8 +3,11 @@ import json
 from unittest.mock import patch
 import requests_mock
 from parameterized import parameterized
+from pylti1p3.assignments_grades import AssignmentsGradesService
 from pylti1p3.grade import Grade
 from pylti1p3.lineitem import LineItem
+from pylti1p3.retry_policy import RetryPolicy
+from pylti1p3.service_connector import ServiceConnector
 from .request import FakeRequest
 from .tool_config import get_test_tool_conf
 from .base import TestServicesBase
@@ -144,6 +147,28 @@ class TestGrades(TestServicesBase):
                     resp = ags.put_grade(sc, sc_line_item)
                     self.assertEqual(expected_result, resp["body"])
 
+    @parameterized.expand([["throttled", 429], ["bad_gateway", 502]])
+    def test_send_score_retries(self, name, status_code):  # pylint: disable=unused-argument
+        registration = get_test_tool_conf().find_registration("https://canvas.instructure.com")
+        assert registration is not None
+        connector = ServiceConnector(registration).set_retry_policy(RetryPolicy(max_retries=2, backoff=0))
+        lineitem_url = "http://canvas.docker/api/lti/courses/1/line_items/1"
+        ags = AssignmentsGradesService(
+            connector, {"scope": ["https://purl.imsglobal.org/spec/lti-ags/scope/score"], "lineitem": lineitem_url}
+        )
+        expected_result = {"resultUrl": lineitem_url + "/results/4"}
+
+        with requests_mock.Mocker() as m:
+            m.post(self._get_auth_token_url(), text=json.dumps(self._get_auth_token_response()))
+            m.post(
+                lineitem_url + "/scores",
+                [{"status_code": status_code, "text": "{}"}, {"text": json.dumps(expected_result)}],
+            )
+            resp = ags.put_grade(Grade().set_score_given(5).set_score_maximum(100).set_user_id("1"))
+
+            self.assertEqual(len([r for r in m.request_history if r.url.endswith("/scores")]), 2)
+        self.assertEqual(expected_result, resp["body"])
+
     def test_delete_lineitem(self):
         from pylti1p3.contrib.django import DjangoMessageLaunch
 
@@ -0,0 +1,152 @@
+import json
+import unittest
+import uuid
+from unittest.mock import PropertyMock, patch
+
+import requests
+import requests_mock
+import starlette.datastructures
+import starlette.requests
+
+from pylti1p3.contrib.fastapi import FastAPIMessageLaunch, FastAPIRequest
+from pylti1p3.instrumentation import CallbackTracer, OpenTelemetryTracer, Tracer, get_tracer, set_tracer
+from pylti1p3.service_connector import ServiceConnector
+
+from . import test_resource_link
+from .tool_config import TOOL_CONFIG, get_test_tool_conf
+
+
+class FakeOpenTelemetrySpan:
+    def __init__(self, attributes):
+        self.attributes = dict(attributes or {})
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+class FakeOpenTelemetryTracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_as_current_span(self, name, attributes=None):
+        span = FakeOpenTelemetrySpan(attributes)
+        self.spans.append((name, span))
+        return span
+
+
+class TestInstrumentation(unittest.TestCase):
+    iss = "https://canvas.instructure.com"
+    url = "http://canvas.docker/api/lti/courses/1/names_and_roles"
+
+    def setUp(self):
+        self.spans = []
+        self.counters = []
+        set_tracer(CallbackTracer(self.spans.append, lambda *args: self.counters.append(args)))
+
+    def tearDown(self):
+        set_tracer(None)
+
+    def _span_names(self):
+        return [span["name"] for span in self.spans]
+
+    def test_default_tracer_is_noop(self):
+        set_tracer(None)
+        tracer = get_tracer()
+
+        self.assertFalse(tracer.enabled)
+        self.assertIs(tracer.start_span("a"), Tracer().start_span("b"))
+
+    def test_launch_validation_steps(self):
+        resource_link = test_resource_link.ResourceLinkBase
+        state = resource_link.post_launch_data["state"]
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/launch/",
+            "query_string": b"",
+            "headers": [(b"cookie", f"lti1p3-{state}={state}".encode())],
+            "session": {"lti1p3-nonce-test-uuid-1234": True},
+        }
+        request = FastAPIRequest(
+            starlette.requests.Request(scope), starlette.datastructures.FormData(resource_link.post_launch_data)
+        )
+        launch = FastAPIMessageLaunch(request, get_test_tool_conf())
+        launch.set_jwt_verify_options({"verify_aud": False, "verify_exp": False})
+
+        with requests_mock.Mocker() as m:
+            m.get(TOOL_CONFIG[self.iss]["key_set_url"], text=json.dumps(resource_link.jwt_canvas_keys))
+            launch.validate()
+
+        names = self._span_names()
+        self.assertEqual(names[-1], "pylti1p3.launch.validate")
+        for step in ("validate_state", "validate_nonce", "validate_jwt_signature", "save_launch_data"):
+            self.assertIn("pylti1p3.launch." + step, names)
+        http_span = self.spans[names.index("pylti1p3.http.request")]
+        self.assertEqual(http_span["attributes"]["http.response.status_code"], 200)
+        self.assertIn("pylti1p3.storage.get_many", names)
+        self.assertIn("pylti1p3.storage.set_many", names)
+
+    def test_service_requests(self):
+        registration = get_test_tool_conf().find_registration(self.iss)
+        assert registration is not None
+        scopes = ["scope-" + str(uuid.uuid4())]
+        connector = ServiceConnector(registration)
+
+        with requests_mock.Mocker() as m:
+            m.post(TOOL_CONFIG[self.iss]["auth_token_url"], text=json.dumps({"access_token": "token"}))
+            m.get(self.url, text='{"members": []}', headers={"Link": f'<{self.url}?page=2>; rel="next"'})
+            m.get(self.url + "?page=2", text='{"members": []}')
+            pages = list(connector.get_paginated_data(scopes, self.url))
+
+        self.assertEqual(len(pages), 2)
+        self.assertEqual(self._span_names().count("pylti1p3.access_token.fetch"), 1)
+        http_spans = [span for span in self.spans if span["name"] == "pylti1p3.http.request"]
+        self.assertEqual([span["attributes"]["http.request.method"] for span in http_spans], ["POST", "GET", "GET"])
+        self.assertEqual(http_spans[1]["attributes"]["http.response.body.size"], len('{"members": []}'))
+        self.assertIn(("pylti1p3.access_token.cache", 1, {"result": "miss"}), self.counters)
+        self.assertIn(("pylti1p3.access_token.cache", 1, {"result": "hit"}), self.counters)
+        self.assertEqual(self.counters.count(("pylti1p3.service.pages", 1, {})), 2)
+
+    def test_body_size_is_read_only_when_enabled(self):
+        registration = get_test_tool_conf().find_registration(self.iss)
+        assert registration is not None
+        connector = ServiceConnector(registration)
+
+        def count_content_reads():
+            with requests_mock.Mocker() as m:
+                m.get(self.url, text='{"members": []}')
+                with patch.object(requests.Response, "content", new_callable=PropertyMock) as content:
+                    content.return_value = b'{"members": []}'
+                    connector._send_request("GET", self.url)  # pylint: disable=protected-access
+            return content.call_count
+
+        enabled_reads = count_content_reads()
+        set_tracer(None)
+        # requests itself reads the body once
+        self.assertEqual(count_content_reads(), enabled_reads - 1)
+
+    def test_span_records_error(self):
+        with self.assertRaises(ValueError):
+            with get_tracer().start_span("failing"):
+                raise ValueError("error")
+
+        self.assertIsInstance(self.spans[0]["error"], ValueError)
+        self.assertGreaterEqual(self.spans[0]["duration"], 0)
+
+    def test_opentelemetry_tracer(self):
+        otel_tracer = FakeOpenTelemetryTracer()
+        set_tracer(OpenTelemetryTracer(otel_tracer))
+
+        with get_tracer().start_span("span", {"a": 1, "b": None}) as span:
+            span.set_attribute("c", None)
+            span.set_attribute("d", "value")
+
+        name, otel_span = otel_tracer.spans[0]
+        self.assertEqual(name, "span")
+        self.assertEqual(otel_span.attributes, {"a": 1, "d": "value"})
@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import patch
+
+import requests_mock
+
+from pylti1p3.exception import LtiException
+from pylti1p3.jwks_manager import JwksManager
+
+KEY_SET_URL = "http://canvas.docker/api/lti/security/jwks"
+OLD_KEY_SET = {"keys": [{"kid": "old", "kty": "RSA"}]}
+NEW_KEY_SET = {"keys": [{"kid": "old", "kty": "RSA"}, {"kid": "new", "kty": "RSA"}]}
+
+
+class TestJwksManager(unittest.TestCase):
+    def setUp(self):
+        self.manager = JwksManager(background_refresh=False, kid_miss_interval=30)
+
+    def test_key_set_is_fetched_once(self):
+        with requests_mock.Mocker() as m:
+            m.get(KEY_SET_URL, json=OLD_KEY_SET)
+            for _ in range(3):
+                self.assertEqual(self.manager.get_key_set(KEY_SET_URL), OLD_KEY_SET)
+            self.assertEqual(m.call_count, 1)
+
+    def test_cache_control_and_conditional_get(self):
+        with requests_mock.Mocker() as m:
+            m.get(KEY_SET_URL, json=OLD_KEY_SET, headers={"Cache-Control": "max-age=300", "ETag": '"v1"'})
+            with patch("pylti1p3.jwks_manager.time.time", return_value=1000):
+                self.manager.get_key_set(KEY_SET_URL)
+            with patch("pylti1p3.jwks_manager.time.time", return_value=1299):
+                self.assertEqual(self.manager.get_cached_key_set(KEY_SET_URL), OLD_KEY_SET)
+            self.assertEqual(m.call_count, 1)
+
+            m.get(KEY_SET_URL, status_code=304)
+            with patch("pylti1p3.jwks_manager.time.time", return_value=1300):
+                self.assertIsNone(self.manager.get_cached_key_set(KEY_SET_URL))
+                self.assertEqual(self.manager.get_key_set(KEY_SET_URL), OLD_KEY_SET)
+            self.assertEqual(m.call_count, 2)
+            self.assertEqual(m.last_request.headers["If-None-Match"], '"v1"')
+
+    def test_kid_miss_triggers_rate_limited_refetch(self):
+        with requests_mock.Mocker() as m:
+            m.get(KEY_SET_URL, json=OLD_KEY_SET)
+            with patch("pylti1p3.jwks_manager.time.time", return_value=1000):
+                self.manager.get_key_set(KEY_SET_URL)
+
+            m.get(KEY_SET_URL, json=NEW_KEY_SET)
+            with patch("pylti1p3.jwks_manager.time.time", return_value=1010):
+                # Fetched less than kid_miss_interval seconds ago
+                self.assertEqual(self.manager.get_key_set(KEY_SET_URL, "new"), OLD_KEY_SET)
+            with patch("pylti1p3.jwks_manager.time.time", return_value=1040):
+                self.assertEqual(self.manager.get_key_set(KEY_SET_URL, "new"), NEW_KEY_SET)
+                self.assertEqual(self.manager.get_key_set(KEY_SET_URL, "unknown"), NEW_KEY_SET)
+            self.assertEqual(m.call_count, 2)
+
+    def test_stale_key_set_is_used_when_platform_is_down(self):
+        with requests_mock.Mocker() as m:
+            m.get(KEY_SET_URL, json=OLD_KEY_SET)
+            with patch("pylti1p3.jwks_manager.time.time", return_value=1000):
+                self.manager.get_key_set(KEY_SET_URL)
+
+            m.get(KEY_SET_URL, status_code=500)
+            with patch("pylti1p3.jwks_manager.time.time", return_value=100000):
+                self.assertEqual(self.manager.get_key_set(KEY_SET_URL), OLD_KEY_SET)
+            with self.assertRaisesRegex(LtiException, "HTTP 500"):
+                self.manager.refresh(KEY_SET_URL)
+
+    def test_refresh_is_scheduled_before_expiry(self):
+        manager = JwksManager(refresh_margin=0.1)
+        self.addCleanup(manager.close)
+        with requests_mock.Mocker() as m:
+            m.get(KEY_SET_URL, json=OLD_KEY_SET, headers={"Cache-Control": "public, max-age=100"})
+            with patch.object(manager, "_schedule_refresh") as schedule_refresh:
+                manager.get_key_set(KEY_SET_URL)
+            schedule_refresh.assert_called_once_with(KEY_SET_URL, 90)
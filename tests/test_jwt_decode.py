@@ -0,0 +1,149 @@
+import base64
+import json
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import jwt
+import jwt.utils
+import requests_mock
+import starlette.datastructures
+import starlette.requests
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from pylti1p3.contrib.fastapi import FastAPIMessageLaunch, FastAPIRequest
+from pylti1p3.exception import LtiException
+from pylti1p3.message_launch import MessageLaunch
+
+from . import test_resource_link
+from .tool_config import TOOL_CONFIG, get_test_tool_conf
+
+
+class TestJwtDecode(unittest.TestCase):
+    iss = "https://canvas.instructure.com"
+    resource_link = test_resource_link.ResourceLinkBase
+
+    def _validate(self, id_token=None, verify_options=None):
+        state = self.resource_link.post_launch_data["state"]
+        post_data = dict(self.resource_link.post_launch_data)
+        if id_token is not None:
+            post_data["id_token"] = id_token
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/launch/",
+            "query_string": b"",
+            "headers": [(b"cookie", f"lti1p3-{state}={state}".encode())],
+            "session": {"lti1p3-nonce-test-uuid-1234": True},
+        }
+        request = FastAPIRequest(starlette.requests.Request(scope), starlette.datastructures.FormData(post_data))
+        launch = FastAPIMessageLaunch(request, get_test_tool_conf())
+        launch.set_jwt_verify_options(verify_options or {"verify_aud": False, "verify_exp": False})
+        with requests_mock.Mocker() as m:
+            m.get(TOOL_CONFIG[self.iss]["key_set_url"], text=json.dumps(self.resource_link.jwt_canvas_keys))
+            return launch.validate()
+
+    def test_short_key_is_verified_by_jwt_decode(self):
+        # The platform key of the fixtures has 512 bits: jwt.decode warns about it and its payload is the launch data
+        payloads = []
+        jwt_decode = jwt.decode
+
+        def decode(*args, **kwargs):
+            payloads.append(jwt_decode(*args, **kwargs))
+            return payloads[-1]
+
+        with patch("jwt.decode", side_effect=decode):
+            launch = self._validate()
+
+        self.assertEqual(len(payloads), 1)
+        self.assertIs(launch.get_launch_data(), payloads[0])
+        self.assertEqual(launch.get_launch_data(), self.resource_link.expected_message_launch_data)
+
+    def test_tampered_body(self):
+        header, body, signature = self.resource_link.post_launch_data["id_token"].split(".")
+        jwt_body = dict(self.resource_link.expected_message_launch_data, sub="another-user")
+        tampered_body = base64.urlsafe_b64encode(json.dumps(jwt_body).encode()).decode().rstrip("=")
+
+        with self.assertRaisesRegex(LtiException, "Can't decode id_token: Signature verification failed"):
+            self._validate(f"{header}.{tampered_body}.{signature}")
+
+    def test_claims_are_verified(self):
+        with self.assertRaisesRegex(LtiException, "Can't decode id_token: Signature has expired"):
+            self._validate(verify_options={"verify_aud": False})
+
+
+class TokenMessageLaunch(MessageLaunch):
+    id_token = ""
+
+    def _get_request_param(self, key):
+        return self.id_token if key == "id_token" else None
+
+
+class TestSinglePassDecode(unittest.TestCase):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwt_body = dict(test_resource_link.ResourceLinkBase.expected_message_launch_data, exp=int(time.time()) + 60)
+
+    def _verify(self, id_token, verify_options=None):
+        launch = TokenMessageLaunch(MagicMock(), MagicMock(), MagicMock(), MagicMock())
+        launch.id_token = id_token
+        launch.set_auto_validation(enable=False)
+        launch.set_jwt_verify_options({"verify_aud": False} if verify_options is None else verify_options)
+        verify_signature = launch.validate_jwt_format()._verify_jwt_signature  # pylint: disable=protected-access
+        return verify_signature(id_token, self.private_key.public_key(), "RS256")
+
+    def _encode(self, body=None, headers=None):
+        return jwt.encode(body or self.jwt_body, self.private_key, algorithm="RS256", headers=headers)
+
+    def test_token_is_parsed_once(self):
+        id_token = self._encode()
+        base64url_decode = jwt.utils.base64url_decode
+
+        with patch("jwt.utils.base64url_decode", side_effect=base64url_decode) as decode:
+            with patch("jwt.decode") as jwt_decode:
+                launch = self._verify(id_token)
+
+        jwt_decode.assert_not_called()
+        decoded_segments = [call.args[0] for call in decode.call_args_list]
+        self.assertEqual(sorted(decoded_segments), sorted(id_token.split(".")))
+        self.assertEqual(launch.get_launch_data(), self.jwt_body)
+
+    def test_tampered_body(self):
+        header, _, signature = self._encode().split(".")
+        tampered_body = jwt.utils.base64url_encode(json.dumps(dict(self.jwt_body, sub="another")).encode()).decode()
+
+        with self.assertRaisesRegex(LtiException, "Can't decode id_token: Signature verification failed"):
+            self._verify(f"{header}.{tampered_body}.{signature}")
+
+    def test_claims_are_verified(self):
+        now = int(time.time())
+        cases = [
+            ({"exp": now - 1}, {"verify_aud": False}, "Signature has expired"),
+            ({"nbf": now + 60}, {"verify_aud": False}, "The token is not yet valid"),
+            ({"iat": "now"}, {"verify_aud": False}, "Issued At claim"),
+            ({}, {}, "Invalid audience"),
+            ({}, {"verify_aud": False, "require": ["jti"]}, 'Token is missing the "jti" claim'),
+        ]
+        for claims, verify_options, error in cases:
+            with self.subTest(error=error):
+                id_token = self._encode(dict(self.jwt_body, **claims))
+                with self.assertRaisesRegex(LtiException, "Can't decode id_token: " + error):
+                    self._verify(id_token, verify_options)
+                # jwt.decode gives the same result
+                with self.assertRaisesRegex(jwt.InvalidTokenError, error):
+                    jwt.decode(id_token, self.private_key.public_key(), algorithms=["RS256"], options=verify_options)
+
+    def test_other_tokens_are_verified_by_jwt_decode(self):
+        for id_token, verify_options in (
+            (self._encode(headers={"crit": ["exp"]}), None),
+            (self._encode(), {"verify_signature": False}),
+        ):
+            with self.subTest(verify_options=verify_options):
+                with patch("jwt.decode", return_value=self.jwt_body) as jwt_decode:
+                    self._verify(id_token, verify_options)
+                jwt_decode.assert_called_once()
+
+    def test_algorithm_mismatch(self):
+        id_token = jwt.encode(self.jwt_body, "secret" * 8, algorithm="HS256")
+
+        with self.assertRaisesRegex(LtiException, "The specified alg value is not allowed"):
+            self._verify(id_token)
@@ -0,0 +1,70 @@
+import json
+import unittest
+
+import requests_mock
+import starlette.datastructures
+import starlette.requests
+
+from pylti1p3.contrib.fastapi import FastAPIMessageLaunch, FastAPIRequest
+from pylti1p3.launch_data_codec import LaunchDataCodec
+
+from . import test_resource_link
+from .tool_config import TOOL_CONFIG, get_test_tool_conf
+
+
+class TestLaunchDataCodec(unittest.TestCase):
+    iss = "https://canvas.instructure.com"
+    jwt_body = test_resource_link.ResourceLinkBase.expected_message_launch_data
+
+    def test_encode(self):
+        codec = LaunchDataCodec()
+        value = codec.encode(self.jwt_body)
+        self.assertIsInstance(value, bytes)
+        self.assertLess(len(value), len(json.dumps(self.jwt_body)))
+        self.assertEqual(LaunchDataCodec.decode(value), self.jwt_body)
+
+        text_value = codec.encode(self.jwt_body, binary=False)
+        self.assertTrue(LaunchDataCodec.is_encoded(text_value))
+        self.assertEqual(LaunchDataCodec.decode(text_value), self.jwt_body)
+
+        uncompressed_value = LaunchDataCodec(compress_level=0).encode(self.jwt_body)
+        self.assertEqual(LaunchDataCodec.decode(uncompressed_value), self.jwt_body)
+        self.assertFalse(LaunchDataCodec.is_encoded(dict(self.jwt_body)))
+
+    def test_projection(self):
+        roles_claim = "https://purl.imsglobal.org/spec/lti/claim/roles"
+        data = LaunchDataCodec.decode(LaunchDataCodec([roles_claim]).encode(self.jwt_body))
+
+        self.assertEqual(set(data), (LaunchDataCodec.required_claims | {roles_claim}) & set(self.jwt_body))
+        self.assertEqual(data[roles_claim], self.jwt_body[roles_claim])
+
+    def test_from_cache(self):
+        resource_link = test_resource_link.ResourceLinkBase
+        state = resource_link.post_launch_data["state"]
+        session = {"lti1p3-nonce-test-uuid-1234": True}
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/launch/",
+            "query_string": b"",
+            "headers": [(b"cookie", f"lti1p3-{state}={state}".encode())],
+            "session": session,
+        }
+        request = FastAPIRequest(
+            starlette.requests.Request(scope), starlette.datastructures.FormData(resource_link.post_launch_data)
+        )
+        tool_conf = get_test_tool_conf()
+        launch = FastAPIMessageLaunch(request, tool_conf)
+        launch.set_jwt_verify_options({"verify_aud": False, "verify_exp": False}).set_launch_data_compaction([])
+
+        with requests_mock.Mocker() as m:
+            m.get(TOOL_CONFIG[self.iss]["key_set_url"], text=json.dumps(resource_link.jwt_canvas_keys))
+            launch.validate()
+
+        stored_value = session[launch.get_launch_id()]
+        self.assertTrue(stored_value.startswith("lti1p3-launch:"))
+
+        restored_launch = FastAPIMessageLaunch.from_cache(launch.get_launch_id(), request, tool_conf)
+        self.assertTrue(restored_launch.is_resource_launch())
+        self.assertEqual(restored_launch.get_launch_data()["iss"], self.iss)
+        self.assertNotIn("https://purl.imsglobal.org/spec/lti/claim/roles", restored_launch.get_launch_data())
@@ -0,0 +1,90 @@
+import unittest
+from unittest.mock import MagicMock
+
+from pylti1p3.contrib.flask import FlaskCacheDataStorage
+from pylti1p3.session import SessionService
+
+from .cache import Cache, FakeCacheDataStorage
+
+
+class BatchCache(Cache):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def get(self, key):
+        self.calls.append("get")
+        return super().get(key)
+
+    def set(self, key, value, exp=None):
+        self.calls.append("set")
+        super().set(key, value, exp)
+
+    def get_many(self, keys):
+        self.calls.append("get_many")
+        return {key: self._data[key] for key in keys if key in self._data}
+
+    def set_many(self, data, exp=None):  # pylint: disable=unused-argument
+        self.calls.append("set_many")
+        self._data.update(data)
+
+    def delete_many(self, keys):
+        self.calls.append("delete_many")
+        for key in keys:
+            self._data.pop(key, None)
+
+
+class FlaskBatchCache(BatchCache):
+    def get_many(self, *keys):
+        self.calls.append("get_many")
+        return [self._data.get(key) for key in keys]
+
+    def delete_many(self, *keys):
+        super().delete_many(keys)
+
+
+class TestLaunchDataStorage(unittest.TestCase):
+    def _get_data_storage(self, data_storage, cache):
+        data_storage._cache = cache
+        request = MagicMock()
+        request.is_secure.return_value = True
+        data_storage.set_request(request)
+        data_storage.set_session_id("session")
+        return data_storage
+
+    def _check_batch_operations(self, data_storage):
+        data_storage.set_many({"a": 1, "b": 2}, exp=60)
+        self.assertEqual(set(data_storage._cache._data), {"lti1p3-session-a", "lti1p3-session-b"})
+        self.assertEqual(data_storage.get_many(["a", "b", "c"]), {"a": 1, "b": 2})
+        data_storage.delete_many(["a", "c"])
+        self.assertEqual(data_storage.get_many(["a", "b"]), {"b": 2})
+        self.assertEqual(data_storage._cache.calls, ["set_many", "get_many", "delete_many", "get_many"])
+
+    def test_cache_backend(self):
+        self._check_batch_operations(self._get_data_storage(FakeCacheDataStorage(), BatchCache()))
+
+    def test_flask_cache_backend(self):
+        cache = FlaskBatchCache()
+        self._check_batch_operations(self._get_data_storage(FlaskCacheDataStorage(cache), cache))
+
+    def test_fallback(self):
+        data_storage = self._get_data_storage(FakeCacheDataStorage(), Cache())
+        data_storage.set_many({"a": 1, "b": 2})
+        self.assertEqual(data_storage.get_many(["a", "b", "c"]), {"a": 1, "b": 2})
+        data_storage.delete_many(["a"])
+        self.assertEqual(data_storage.get_many(["a", "b"]), {"b": 2})
+
+    def test_launch_round_trips(self):
+        data_storage = self._get_data_storage(FakeCacheDataStorage(), BatchCache())
+        session_service = SessionService(MagicMock())
+        session_service.set_data_storage(data_storage)
+
+        session_service.save_state_params("state-1", {"a": 1})
+        data_storage._cache.calls.clear()
+
+        self.assertEqual(session_service.get_state("state-1"), {"params": {"a": 1}, "id_token_hash": None})
+        session_service.save_launch("launch-1", {"iss": "iss"}, "state-1", "hash")
+        self.assertEqual(data_storage._cache.calls, ["get_many", "set_many"])
+
+        self.assertEqual(session_service.get_launch_data("launch-1"), {"iss": "iss"})
+        self.assertTrue(session_service.check_state_is_valid("state-1", "hash"))
@@ -0,0 +1,82 @@
+import json
+import unittest
+
+import requests_mock
+
+from pylti1p3.assignments_grades import AssignmentsGradesService
+from pylti1p3.lineitem import LineItem
+from pylti1p3.service_connector import ServiceConnector
+
+from .cache import FakeCacheDataStorage
+from .tool_config import TOOL_CONFIG, get_test_tool_conf
+
+
+class TestLineItemIndex(unittest.TestCase):
+    iss = "https://canvas.instructure.com"
+    lineitems_url = "http://canvas.docker/api/lti/courses/1/line_items"
+    lineitems = [
+        {"id": lineitems_url + "/1", "tag": "quiz", "resourceId": "r1", "label": "Quiz", "scoreMaximum": 10},
+        {"id": lineitems_url + "/2", "tag": "exam", "resourceLinkId": "rl2", "label": "Exam", "scoreMaximum": 100},
+    ]
+
+    def setUp(self):
+        AssignmentsGradesService._lineitem_index_memory_cache.clear()  # pylint: disable=protected-access
+
+    def _get_ags(self):
+        registration = get_test_tool_conf().find_registration(self.iss)
+        assert registration is not None
+        return AssignmentsGradesService(
+            ServiceConnector(registration),
+            {"scope": ["https://purl.imsglobal.org/spec/lti-ags/scope/lineitem"], "lineitems": self.lineitems_url},
+        )
+
+    def _mock(self, m):
+        m.post(TOOL_CONFIG[self.iss]["auth_token_url"], text=json.dumps({"access_token": "token"}))
+        m.get(self.lineitems_url, text=json.dumps(self.lineitems))
+
+    def _list_requests(self, m):
+        return [r for r in m.request_history if r.method == "GET"]
+
+    def test_lookups_use_index(self):
+        with requests_mock.Mocker() as m:
+            self._mock(m)
+            for _ in range(2):
+                ags = self._get_ags().set_lineitem_index_caching()
+                self.assertEqual(ags.find_lineitem_by_tag("exam").get_id(), self.lineitems_url + "/2")
+                self.assertEqual(ags.find_lineitem_by_resource_id("r1").get_id(), self.lineitems_url + "/1")
+                self.assertEqual(ags.find_lineitem_by_resource_link_id("rl2").get_id(), self.lineitems_url + "/2")
+                self.assertEqual(ags.find_lineitem_by_id(self.lineitems_url + "/1").get_tag(), "quiz")
+                self.assertIsNone(ags.find_lineitem_by_tag("missing"))
+
+            self.assertEqual(len(self._list_requests(m)), 1)
+
+    def test_index_is_updated_by_writes(self):
+        ags = self._get_ags().set_lineitem_index_caching(FakeCacheDataStorage())
+        created = {"id": self.lineitems_url + "/3", "tag": "essay", "label": "Essay", "scoreMaximum": 5}
+        updated = dict(self.lineitems[0], tag="quiz-1")
+
+        with requests_mock.Mocker() as m:
+            self._mock(m)
+            m.post(self.lineitems_url, text=json.dumps(created))
+            m.put(self.lineitems_url + "/1", text=json.dumps(updated))
+            m.delete(self.lineitems_url + "/2", text="")
+
+            new_lineitem = LineItem().set_tag("essay").set_label("Essay").set_score_maximum(5)
+            self.assertEqual(ags.find_or_create_lineitem(new_lineitem).get_id(), created["id"])
+            ags.update_lineitem(LineItem(updated))
+            ags.delete_lineitem(self.lineitems_url + "/2")
+
+            self.assertEqual(ags.find_lineitem_by_tag("essay").get_id(), created["id"])
+            self.assertEqual(ags.find_lineitem_by_tag("quiz-1").get_id(), self.lineitems_url + "/1")
+            self.assertIsNone(ags.find_lineitem_by_tag("quiz"))
+            self.assertIsNone(ags.find_lineitem_by_tag("exam"))
+            self.assertEqual(len(self._list_requests(m)), 1)
+
+    def test_filters_are_passed_to_platform_without_index(self):
+        ags = self._get_ags()
+        with requests_mock.Mocker() as m:
+            self._mock(m)
+            lineitem = ags.find_lineitem_by_resource_link_id("rl2")
+
+            self.assertEqual(m.request_history[-1].qs, {"resource_link_id": ["rl2"]})
+        self.assertEqual(lineitem.get_id(), self.lineitems_url + "/2")
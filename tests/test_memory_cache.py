@@ -0,0 +1,27 @@
+import unittest
+from unittest.mock import patch
+
+from pylti1p3.memory_cache import MemoryCache
+
+
+class TestMemoryCache(unittest.TestCase):
+    def test_least_recently_used_key_is_evicted(self):
+        cache: MemoryCache[str, int] = MemoryCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(len(cache), 2)
+
+    def test_keys_expire(self):
+        cache: MemoryCache[str, int] = MemoryCache(ttl=10)
+        with patch("pylti1p3.memory_cache.time.monotonic", return_value=100):
+            cache.set("default", 1)
+            cache.set("custom", 2, exp=100)
+        with patch("pylti1p3.memory_cache.time.monotonic", return_value=111):
+            self.assertIsNone(cache.get("default"))
+            self.assertEqual(cache.get("custom"), 2)
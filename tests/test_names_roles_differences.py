@@ -0,0 +1,92 @@
+import json
+import unittest
+
+import requests_mock
+
+from pylti1p3.names_roles import NamesRolesProvisioningService
+from pylti1p3.service_connector import ServiceConnector
+
+from .cache import FakeCacheDataStorage
+from .tool_config import TOOL_CONFIG, get_test_tool_conf
+
+
+class TestNamesRolesDifferences(unittest.TestCase):
+    iss = "https://canvas.instructure.com"
+    members_url = "http://canvas.docker/api/lti/courses/1/names_and_roles"
+    differences_url = "http://canvas.docker/api/lti/courses/1/names_and_roles?since=1"
+
+    def setUp(self):
+        self.storage = FakeCacheDataStorage()
+
+    def _get_nrps(self):
+        # A new service per sync: the differences URL must survive in the storage only
+        return NamesRolesProvisioningService(
+            ServiceConnector(get_test_tool_conf().find_registration(self.iss)),
+            {"context_memberships_url": self.members_url},
+        ).set_differences_data_storage(self.storage)
+
+    def _mock_token(self, m):
+        m.post(TOOL_CONFIG[self.iss]["auth_token_url"], text=json.dumps({"access_token": "token"}))
+
+    def test_sync_members_uses_differences_url(self):
+        with requests_mock.Mocker() as m:
+            self._mock_token(m)
+            m.get(
+                self.members_url,
+                text=json.dumps({"members": [{"user_id": "1"}, {"user_id": "2"}]}),
+                headers={"Link": f'<{self.members_url}?page=2>; rel="next"'},
+            )
+            m.get(
+                self.members_url + "?page=2",
+                text=json.dumps({"members": [{"user_id": "3"}]}),
+                headers={"Link": f'<{self.differences_url}>; rel="differences"'},
+            )
+            m.get(
+                self.differences_url,
+                text=json.dumps({"members": [{"user_id": "2", "status": "Deleted"}]}),
+                headers={"Link": f'<{self.differences_url}2>; rel="differences"'},
+            )
+            m.get(self.differences_url + "2", text=json.dumps({"members": []}))
+
+            full = self._get_nrps().sync_members()
+            delta = self._get_nrps().sync_members()
+            self._get_nrps().sync_members()
+
+            self.assertEqual(m.request_history[-1].url, self.differences_url + "2")
+
+        self.assertFalse(full["delta"])
+        self.assertEqual([member["user_id"] for member in full["members"]], ["1", "2", "3"])
+        self.assertTrue(delta["delta"])
+        self.assertEqual(delta["members"], [{"user_id": "2", "status": "Deleted"}])
+
+    def test_sync_members_falls_back_to_full_roster(self):
+        with requests_mock.Mocker() as m:
+            self._mock_token(m)
+            m.get(
+                self.members_url,
+                text=json.dumps({"members": [{"user_id": "1"}]}),
+                headers={"Link": f'<{self.differences_url}>; rel="differences"'},
+            )
+            m.get(self.differences_url, status_code=410)
+
+            self._get_nrps().sync_members()
+            result = self._get_nrps().sync_members()
+
+        self.assertFalse(result["delta"])
+        self.assertEqual(result["members"], [{"user_id": "1"}])
+
+    def test_sync_members_without_storage(self):
+        nrps = NamesRolesProvisioningService(
+            ServiceConnector(get_test_tool_conf().find_registration(self.iss)),
+            {"context_memberships_url": self.members_url},
+        )
+        with requests_mock.Mocker() as m:
+            self._mock_token(m)
+            m.get(
+                self.members_url,
+                text=json.dumps({"members": [{"user_id": "1"}]}),
+                headers={"Link": f'<{self.differences_url}>; rel="differences"'},
+            )
+
+            self.assertFalse(nrps.sync_members()["delta"])
+            self.assertFalse(nrps.sync_members()["delta"])
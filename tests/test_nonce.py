@@ -0,0 +1,139 @@
+import base64
+import json
+import unittest
+from unittest.mock import MagicMock
+
+import requests_mock
+import starlette.datastructures
+import starlette.requests
+
+from pylti1p3.contrib.fastapi import FastAPIMessageLaunch, FastAPIRequest
+from pylti1p3.exception import LtiException
+from pylti1p3.launch_data_storage.session import SessionDataStorage
+from pylti1p3.session import SessionService
+
+from . import test_resource_link
+from .cache import Cache, FakeCacheDataStorage
+from .tool_config import TOOL_CONFIG, get_test_tool_conf
+
+
+class RedisCache(Cache):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def set(self, key, value, exp=None):
+        self.calls.append(("set", key, exp))
+        super().set(key, value, exp)
+
+    def getdel(self, key):
+        self.calls.append(("getdel", key))
+        return self._data.pop(key, None)
+
+
+class DeleteResultCache(Cache):
+    def delete(self, key):
+        return self._data.pop(key, None) is not None
+
+
+class TestNonce(unittest.TestCase):
+    def _get_session_service(self, data_storage):
+        request = MagicMock()
+        request.session = {}
+        request.is_secure.return_value = True
+        data_storage.set_request(request)
+        session_service = SessionService(request)
+        session_service.set_data_storage(data_storage)
+        return session_service
+
+    def _check_nonce_is_used_once(self, session_service):
+        session_service.save_nonce("nonce-1")
+        self.assertTrue(session_service.check_nonce("nonce-1"))
+        self.assertFalse(session_service.check_nonce("nonce-1"))
+        self.assertFalse(session_service.check_nonce("nonce-2"))
+
+    def test_redis_getdel(self):
+        data_storage = FakeCacheDataStorage()
+        data_storage._cache = RedisCache()
+        session_service = self._get_session_service(data_storage)
+
+        self._check_nonce_is_used_once(session_service)
+        self.assertEqual(
+            data_storage._cache.calls,
+            [
+                ("set", "lti1p3-nonce-nonce-1", 600),
+                ("getdel", "lti1p3-nonce-nonce-1"),
+                ("getdel", "lti1p3-nonce-nonce-1"),
+                ("getdel", "lti1p3-nonce-nonce-2"),
+            ],
+        )
+
+    def test_delete_result(self):
+        data_storage = FakeCacheDataStorage()
+        data_storage._cache = DeleteResultCache()
+        data_storage._delete_returns_result = True
+        self._check_nonce_is_used_once(self._get_session_service(data_storage))
+
+    def test_fallback(self):
+        self._check_nonce_is_used_once(self._get_session_service(FakeCacheDataStorage()))
+
+    def test_session_storage(self):
+        data_storage = SessionDataStorage()
+        session_service = self._get_session_service(data_storage)
+        self._check_nonce_is_used_once(session_service)
+        with self.assertRaises(Exception):
+            session_service.set_nonce_lifetime(60)
+
+    def test_nonce_lifetime(self):
+        data_storage = FakeCacheDataStorage()
+        data_storage._cache = RedisCache()
+        session_service = self._get_session_service(data_storage)
+        session_service.set_nonce_lifetime(60)
+        session_service.save_nonce("nonce-1")
+        self.assertEqual(data_storage._cache.calls, [("set", "lti1p3-nonce-nonce-1", 60)])
+
+
+class TestLaunchNonce(unittest.TestCase):
+    iss = "https://canvas.instructure.com"
+    resource_link = test_resource_link.ResourceLinkBase
+
+    def setUp(self):
+        self.session = {"lti1p3-nonce-test-uuid-1234": True}
+        self.tool_conf = get_test_tool_conf()
+
+    def _validate(self, id_token=None, state_cookie=True):
+        state = self.resource_link.post_launch_data["state"]
+        post_data = dict(self.resource_link.post_launch_data)
+        if id_token is not None:
+            post_data["id_token"] = id_token
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/launch/",
+            "query_string": b"",
+            "headers": [(b"cookie", f"lti1p3-{state}={state}".encode())] if state_cookie else [],
+            "session": self.session,
+        }
+        request = FastAPIRequest(starlette.requests.Request(scope), starlette.datastructures.FormData(post_data))
+        launch = FastAPIMessageLaunch(request, self.tool_conf)
+        launch.set_jwt_verify_options({"verify_aud": False, "verify_exp": False})
+        with requests_mock.Mocker() as m:
+            m.get(TOOL_CONFIG[self.iss]["key_set_url"], text=json.dumps(self.resource_link.jwt_canvas_keys))
+            return launch.validate()
+
+    def test_same_id_token_is_validated_again(self):
+        self._validate()
+        self.assertNotIn("lti1p3-nonce-test-uuid-1234", self.session)
+
+        # Re-posted id_token: the state is valid for its hash, the cookie and the nonce are gone
+        self._validate(state_cookie=False)
+
+    def test_forged_id_token_does_not_consume_nonce(self):
+        header, _, signature = self.resource_link.post_launch_data["id_token"].split(".")
+        jwt_body = dict(self.resource_link.expected_message_launch_data, sub="another-user")
+        forged_body = base64.urlsafe_b64encode(json.dumps(jwt_body).encode()).decode().rstrip("=")
+
+        with self.assertRaisesRegex(LtiException, "Can't decode id_token"):
+            self._validate(f"{header}.{forged_body}.{signature}")
+        self.assertIn("lti1p3-nonce-test-uuid-1234", self.session)
+        self._validate()
@@ -0,0 +1,111 @@
+import json
+import threading
+import unittest
+
+import requests_mock
+
+from pylti1p3.assignments_grades import AssignmentsGradesService
+from pylti1p3.course_groups import CourseGroupsService
+from pylti1p3.names_roles import NamesRolesProvisioningService
+from pylti1p3.service_connector import ServiceConnector
+
+from .tool_config import TOOL_CONFIG, get_test_tool_conf
+
+
+class TestPaginatedIterators(unittest.TestCase):
+    iss = "https://canvas.instructure.com"
+    members_url = "http://canvas.docker/api/lti/courses/1/names_and_roles"
+
+    def setUp(self):
+        registration = get_test_tool_conf().find_registration(self.iss)
+        assert registration is not None
+        self.connector = ServiceConnector(registration)
+
+    def _mock_pages(self, m, url, data_key, pages):
+        m.post(TOOL_CONFIG[self.iss]["auth_token_url"], text=json.dumps({"access_token": "token", "expires_in": 3600}))
+        for i, items in enumerate(pages):
+            headers = {"Link": f'<{url}?page={i + 2}>; rel="next"'} if i + 1 < len(pages) else {}
+            m.get(url if i == 0 else f"{url}?page={i + 1}", text=json.dumps({data_key: items}), headers=headers)
+
+    def _page_requests(self, m):
+        return [r for r in m.request_history if r.method == "GET"]
+
+    def test_iter_members_is_lazy(self):
+        nrps = NamesRolesProvisioningService(self.connector, {"context_memberships_url": self.members_url})
+
+        with requests_mock.Mocker() as m:
+            self._mock_pages(m, self.members_url, "members", [[{"user_id": "1"}, {"user_id": "2"}], [{"user_id": "3"}]])
+            members = nrps.iter_members()
+
+            self.assertEqual(next(members)["user_id"], "1")
+            self.assertEqual(len(self._page_requests(m)), 1)
+            self.assertEqual([member["user_id"] for member in members], ["2", "3"])
+            self.assertEqual(len(self._page_requests(m)), 2)
+
+    def test_iter_members_prefetches_next_page(self):
+        nrps = NamesRolesProvisioningService(self.connector, {"context_memberships_url": self.members_url})
+        second_page_requested = threading.Event()
+
+        def second_page(request, context):  # pylint: disable=unused-argument
+            second_page_requested.set()
+            return json.dumps({"members": [{"user_id": "3"}]})
+
+        with requests_mock.Mocker() as m:
+            self._mock_pages(m, self.members_url, "members", [[{"user_id": "1"}, {"user_id": "2"}], []])
+            m.get(self.members_url + "?page=2", text=second_page)
+            members = nrps.iter_members(prefetch=True)
+
+            self.assertEqual(next(members)["user_id"], "1")
+            # The second page is requested while the first one is still being processed
+            self.assertTrue(second_page_requested.wait(5))
+            self.assertEqual([member["user_id"] for member in members], ["2", "3"])
+
+    def test_get_members_reads_all_pages(self):
+        nrps = NamesRolesProvisioningService(self.connector, {"context_memberships_url": self.members_url})
+
+        with requests_mock.Mocker() as m:
+            self._mock_pages(m, self.members_url, "members", [[{"user_id": "1"}], [{"user_id": "2"}], []])
+            members = nrps.get_members()
+
+        self.assertEqual([member["user_id"] for member in members], ["1", "2"])
+
+    def test_find_lineitem_stops_at_first_match(self):
+        lineitems_url = "http://canvas.docker/api/lti/courses/1/line_items"
+        ags = AssignmentsGradesService(
+            self.connector,
+            {"scope": ["https://purl.imsglobal.org/spec/lti-ags/scope/lineitem"], "lineitems": lineitems_url},
+        )
+
+        with requests_mock.Mocker() as m:
+            m.post(TOOL_CONFIG[self.iss]["auth_token_url"], text=json.dumps({"access_token": "token"}))
+            m.get(
+                lineitems_url,
+                text=json.dumps([{"id": lineitems_url + "/1", "tag": "quiz"}]),
+                headers={"Link": f'<{lineitems_url}?page=2>; rel="next"'},
+            )
+            m.get(lineitems_url + "?page=2", text=json.dumps([{"id": lineitems_url + "/2", "tag": "exam"}]))
+            lineitem = ags.find_lineitem_by_tag("quiz")
+
+            self.assertEqual(len(self._page_requests(m)), 1)
+        assert lineitem is not None
+        self.assertEqual(lineitem.get_id(), lineitems_url + "/1")
+
+    def test_iter_groups_and_sets(self):
+        groups_url = "https://www.myuniv.example.com/2344/groups"
+        sets_url = "https://www.myuniv.example.com/2344/groups/sets"
+        cgs = CourseGroupsService(
+            self.connector,
+            {
+                "scope": ["https://purl.imsglobal.org/spec/lti-gs/scope/contextgroup.readonly"],
+                "context_groups_url": groups_url,
+                "context_group_sets_url": sets_url,
+                "service_versions": ["1.0"],
+            },
+        )
+
+        with requests_mock.Mocker() as m:
+            self._mock_pages(m, groups_url, "groups", [[{"id": 1, "name": "A"}], [{"id": 2, "name": "B"}]])
+            m.get(sets_url, text=json.dumps({"sets": [{"id": 10, "name": "Set"}]}))
+
+            self.assertEqual([group["id"] for group in cgs.iter_groups(prefetch=True)], [1, 2])
+            self.assertEqual([group_set["id"] for group_set in cgs.iter_sets()], [10])
@@ -0,0 +1,141 @@
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+import requests_mock
+
+from pylti1p3.assignments_grades import AssignmentsGradesService
+from pylti1p3.exception import LtiServiceException
+from pylti1p3.grade import Grade
+from pylti1p3.lineitem import LineItem
+from pylti1p3.retry_policy import RetryPolicy
+from pylti1p3.service_connector import ServiceConnector
+
+from .tool_config import TOOL_CONFIG, get_test_tool_conf
+
+
+class TestPutGrades(unittest.TestCase):
+    iss = "https://canvas.instructure.com"
+    lineitems_url = "http://canvas.docker/api/lti/courses/1/line_items"
+    lineitem_url = "http://canvas.docker/api/lti/courses/1/line_items/1"
+
+    def setUp(self):
+        registration = get_test_tool_conf().find_registration(self.iss)
+        assert registration is not None
+        self.ags = AssignmentsGradesService(
+            ServiceConnector(registration),
+            {
+                "scope": [
+                    "https://purl.imsglobal.org/spec/lti-ags/scope/score",
+                    "https://purl.imsglobal.org/spec/lti-ags/scope/lineitem",
+                ],
+                "lineitems": self.lineitems_url,
+                "lineitem": self.lineitem_url,
+            },
+        )
+
+    def _mock_token(self, m):
+        m.post(TOOL_CONFIG[self.iss]["auth_token_url"], text=json.dumps({"access_token": "token", "expires_in": 3600}))
+
+    @staticmethod
+    def _grade(user_id):
+        return Grade().set_score_given(5).set_score_maximum(10).set_user_id(user_id)
+
+    def test_put_grades(self):
+        with requests_mock.Mocker() as m:
+            self._mock_token(m)
+            m.post(self.lineitem_url + "/scores", text="{}")
+            response = self.ags.put_grades([(self._grade(str(i)), None) for i in range(20)], max_workers=4)
+
+            token_requests = [r for r in m.request_history if r.url == TOOL_CONFIG[self.iss]["auth_token_url"]]
+            self.assertEqual(len(token_requests), 1)
+            self.assertEqual(m.call_count, 21)
+
+        self.assertEqual(response["stats"]["total"], 20)
+        self.assertEqual(response["stats"]["succeeded"], 20)
+        self.assertEqual(response["stats"]["failed"], 0)
+        self.assertEqual([result["grade"].get_user_id() for result in response["results"]], list(map(str, range(20))))
+        self.assertTrue(all(result["error"] is None for result in response["results"]))
+
+    def test_put_grades_resolves_lineitem_once(self):
+        lineitem = LineItem().set_tag("quiz").set_score_maximum(10).set_label("Quiz")
+        lock = threading.Lock()
+        created = []
+
+        def create_lineitem(request, context):  # pylint: disable=unused-argument
+            with lock:
+                created.append(request.json())
+            return {"id": self.lineitems_url + "/2", "tag": "quiz", "scoreMaximum": 10, "label": "Quiz"}
+
+        with requests_mock.Mocker() as m:
+            self._mock_token(m)
+            m.get(self.lineitems_url, text="[]")
+            m.post(self.lineitems_url, json=create_lineitem)
+            m.post(self.lineitems_url + "/2/scores", text="{}")
+            response = self.ags.put_grades([(self._grade(str(i)), lineitem) for i in range(5)])
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(response["stats"]["succeeded"], 5)
+        self.assertEqual(response["results"][0]["lineitem"].get_id(), self.lineitems_url + "/2")
+
+    def test_put_grades_retries_and_reports_errors(self):
+        attempts = {"1": 0, "2": 0}
+
+        def score(request, context):
+            user_id = request.json()["userId"]
+            attempts[user_id] += 1
+            if user_id == "1" and attempts[user_id] == 1:
+                context.status_code = 429
+                context.headers["Retry-After"] = "1"
+            elif user_id == "2":
+                context.status_code = 400
+            return "{}"
+
+        with patch("time.sleep") as sleep:
+            with requests_mock.Mocker() as m:
+                self._mock_token(m)
+                m.post(self.lineitem_url + "/scores", text=score)
+                response = self.ags.put_grades([(self._grade("1"), None), (self._grade("2"), None)])
+
+        sleep.assert_called_once_with(1.0)
+        self.assertEqual(attempts, {"1": 2, "2": 1})
+        self.assertEqual(response["stats"]["succeeded"], 1)
+        self.assertEqual(response["stats"]["failed"], 1)
+        self.assertEqual(response["stats"]["retries"], 1)
+        self.assertIsNone(response["results"][0]["error"])
+        self.assertIsInstance(response["results"][1]["error"], LtiServiceException)
+
+    def test_put_grades_gives_up_after_max_retries(self):
+        with patch("time.sleep") as sleep:
+            with requests_mock.Mocker() as m:
+                self._mock_token(m)
+                m.post(self.lineitem_url + "/scores", status_code=503)
+                response = self.ags.put_grades([(self._grade("1"), None)], max_retries=2)
+
+        self.assertEqual(sleep.call_count, 2)
+        self.assertEqual(response["results"][0]["attempts"], 3)
+        self.assertEqual(response["stats"]["failed"], 1)
+
+    def test_put_grades_uses_connector_retry_policy(self):
+        self.ags._service_connector.set_retry_policy(RetryPolicy(max_retries=1))  # pylint: disable=protected-access
+        with patch("time.sleep") as sleep:
+            with requests_mock.Mocker() as m:
+                self._mock_token(m)
+                m.post(self.lineitem_url + "/scores", status_code=503)
+                response = self.ags.put_grades([(self._grade("1"), None)], max_retries=5)
+
+        # The connector doesn't retry the scores on its own, so the retries aren't multiplied
+        self.assertEqual(sleep.call_count, 1)
+        self.assertEqual(response["results"][0]["attempts"], 2)
+        self.assertEqual(len([r for r in m.request_history if r.url.endswith("/scores")]), 2)
+
+    def test_put_grades_reports_access_token_error(self):
+        with requests_mock.Mocker() as m:
+            m.post(TOOL_CONFIG[self.iss]["auth_token_url"], status_code=401, text="{}")
+            response = self.ags.put_grades([(self._grade("1"), None), (self._grade("2"), None)])
+
+            self.assertFalse([r for r in m.request_history if r.url.endswith("/scores")])
+        self.assertEqual(response["stats"]["failed"], 2)
+        self.assertTrue(all(isinstance(result["error"], LtiServiceException) for result in response["results"]))
+        self.assertTrue(all(result["attempts"] == 0 for result in response["results"]))
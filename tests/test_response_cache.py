@@ -0,0 +1,81 @@
+import json
+import unittest
+
+import requests_mock
+
+from pylti1p3.service_connector import ServiceConnector
+
+from .cache import FakeCacheDataStorage
+from .tool_config import TOOL_CONFIG, get_test_tool_conf
+
+
+class TestResponseCache(unittest.TestCase):
+    iss = "https://canvas.instructure.com"
+    scopes = ["https://purl.imsglobal.org/spec/lti-ags/scope/lineitem"]
+    lineitem_url = "http://canvas.docker/api/lti/courses/1/line_items/1"
+    lineitem = {"id": lineitem_url, "label": "Score", "scoreMaximum": 100}
+
+    def setUp(self):
+        ServiceConnector._response_memory_cache.clear()  # pylint: disable=protected-access
+        self.not_modified_responses = 0
+
+    def _get_connector(self):
+        registration = get_test_tool_conf().find_registration(self.iss)
+        assert registration is not None
+        return ServiceConnector(registration)
+
+    def _not_modified_unless_changed(self, request, context):
+        if request.headers.get("If-None-Match") == '"v1"':
+            context.status_code = 304
+            self.not_modified_responses += 1
+            return ""
+        context.headers["ETag"] = '"v1"'
+        return json.dumps(self.lineitem)
+
+    def _mock(self, m):
+        m.post(TOOL_CONFIG[self.iss]["auth_token_url"], text=json.dumps({"access_token": "token"}))
+        m.get(self.lineitem_url, text=self._not_modified_unless_changed)
+        m.put(self.lineitem_url, text=json.dumps(self.lineitem))
+
+    def test_not_modified_response_is_served_from_cache(self):
+        with requests_mock.Mocker() as m:
+            self._mock(m)
+            first = self._get_connector().set_response_caching().make_service_request(self.scopes, self.lineitem_url)
+            second = self._get_connector().set_response_caching().make_service_request(self.scopes, self.lineitem_url)
+
+            self.assertEqual(m.request_history[-1].headers["If-None-Match"], '"v1"')
+            self.assertEqual(self.not_modified_responses, 1)
+
+        self.assertEqual(first["body"], self.lineitem)
+        self.assertEqual(second["body"], self.lineitem)
+        self.assertEqual(second["headers"]["ETag"], '"v1"')
+
+    def test_variants_are_cached_separately(self):
+        connector = self._get_connector().set_response_caching()
+        with requests_mock.Mocker() as m:
+            self._mock(m)
+            connector.make_service_request(self.scopes, self.lineitem_url)
+            connector.make_service_request(
+                self.scopes, self.lineitem_url, accept="application/vnd.ims.lis.v2.lineitem+json"
+            )
+
+            self.assertNotIn("If-None-Match", m.request_history[-1].headers)
+
+    def test_write_invalidates_cached_response(self):
+        connector = self._get_connector().set_response_caching(FakeCacheDataStorage())
+        with requests_mock.Mocker() as m:
+            self._mock(m)
+            connector.make_service_request(self.scopes, self.lineitem_url)
+            connector.make_service_request(self.scopes, self.lineitem_url, method="PUT", data=json.dumps(self.lineitem))
+            connector.make_service_request(self.scopes, self.lineitem_url)
+
+            self.assertNotIn("If-None-Match", m.request_history[-1].headers)
+
+    def test_caching_is_disabled_by_default(self):
+        connector = self._get_connector()
+        with requests_mock.Mocker() as m:
+            self._mock(m)
+            connector.make_service_request(self.scopes, self.lineitem_url)
+            connector.make_service_request(self.scopes, self.lineitem_url)
+
+            self.assertNotIn("If-None-Match", m.request_history[-1].headers)
@@ -0,0 +1,78 @@
+import json
+import unittest
+from unittest.mock import patch
+
+import requests_mock
+import starlette.datastructures
+import starlette.requests
+
+from pylti1p3.contrib.fastapi import FastAPIMessageLaunch, FastAPIRequest
+
+from . import test_resource_link
+from .tool_config import TOOL_CONFIG, get_test_tool_conf
+
+
+class TestRestoredLaunch(unittest.TestCase):
+    iss = "https://canvas.instructure.com"
+
+    def setUp(self):
+        FastAPIMessageLaunch._restored_registrations.clear()
+        resource_link = test_resource_link.ResourceLinkBase
+        state = resource_link.post_launch_data["state"]
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/launch/",
+            "query_string": b"",
+            "headers": [(b"cookie", f"lti1p3-{state}={state}".encode())],
+            "session": {"lti1p3-nonce-test-uuid-1234": True},
+        }
+        self.request = FastAPIRequest(
+            starlette.requests.Request(scope), starlette.datastructures.FormData(resource_link.post_launch_data)
+        )
+        self.tool_conf = get_test_tool_conf()
+        launch = FastAPIMessageLaunch(self.request, self.tool_conf)
+        launch.set_jwt_verify_options({"verify_aud": False, "verify_exp": False})
+        with requests_mock.Mocker() as m:
+            m.get(TOOL_CONFIG[self.iss]["key_set_url"], text=json.dumps(resource_link.jwt_canvas_keys))
+            launch.validate()
+        self.launch_id = launch.get_launch_id()
+
+    def _restore(self):
+        return FastAPIMessageLaunch.from_cache(self.launch_id, self.request, self.tool_conf)
+
+    def _count_lookups(self, tool_conf):
+        return patch.object(tool_conf, "find_registration_by_issuer", wraps=tool_conf.find_registration_by_issuer)
+
+    def test_registration_is_reused(self):
+        with self._count_lookups(self.tool_conf) as find:
+            first_launch = self._restore()
+            second_launch = self._restore()
+            self.assertEqual(find.call_count, 1)
+            self.assertIsNot(first_launch._registration, second_launch._registration)
+            self.assertEqual(vars(first_launch._registration), vars(second_launch._registration))
+
+            # A launch changing its registration doesn't change the registration of the next launches
+            second_launch._registration.set_auth_token_url("https://example.com/token")
+            self.assertEqual(
+                self._restore()._registration.get_auth_token_url(), first_launch._registration.get_auth_token_url()
+            )
+            self.assertEqual(find.call_count, 1)
+
+            # Changed keys invalidate the reused registration
+            self.tool_conf.set_private_key(self.iss, self.tool_conf.get_private_key(self.iss))
+            self._restore()
+            self.assertEqual(find.call_count, 2)
+
+        # Another tool config object never gets the registration of this one
+        other_tool_conf = get_test_tool_conf()
+        with self._count_lookups(other_tool_conf) as find:
+            FastAPIMessageLaunch.from_cache(self.launch_id, self.request, other_tool_conf)
+            self.assertEqual(find.call_count, 1)
+
+    def test_registrations_depending_on_request(self):
+        self.tool_conf.static_registrations = False
+        with self._count_lookups(self.tool_conf) as find:
+            self._restore()
+            self._restore()
+            self.assertEqual(find.call_count, 2)
@@ -0,0 +1,133 @@
+import json
+import time
+import unittest
+from email.utils import formatdate
+from unittest.mock import patch
+
+import requests_mock
+
+from pylti1p3.exception import LtiServiceException
+from pylti1p3.rate_limiter import RateLimiter
+from pylti1p3.retry_policy import RetryPolicy
+from pylti1p3.service_connector import ServiceConnector
+
+from .tool_config import TOOL_CONFIG, get_test_tool_conf
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_should_retry(self):
+        policy = RetryPolicy(max_retries=2)
+
+        self.assertTrue(policy.should_retry("GET", 503, 1))
+        self.assertTrue(policy.should_retry("GET", None, 2))
+        self.assertFalse(policy.should_retry("GET", 503, 3))
+        self.assertFalse(policy.should_retry("GET", 400, 1))
+        self.assertFalse(policy.should_retry("POST", 503, 1))
+        self.assertTrue(policy.should_retry("POST", 503, 1, idempotent=True))
+        self.assertTrue(policy.should_retry("POST", 429, 1))
+
+    def test_get_delay(self):
+        policy = RetryPolicy(backoff=1, max_backoff=10)
+
+        self.assertTrue(0.5 <= policy.get_delay(1) <= 1)
+        self.assertTrue(2 <= policy.get_delay(3) <= 4)
+        self.assertEqual(policy.get_delay(10), 10)
+        self.assertEqual(policy.get_delay(1, "7"), 7)
+        self.assertEqual(policy.get_delay(1, "120"), 120)
+        self.assertEqual(policy.get_delay(1, "3600"), 300)
+        self.assertEqual(RetryPolicy(max_backoff=10, max_retry_after=60).get_delay(1, "120"), 60)
+        self.assertEqual(policy.get_delay(1, formatdate(time.time() - 5, usegmt=True)), 0)
+        self.assertTrue(4 <= policy.get_delay(1, formatdate(time.time() + 5, usegmt=True)) <= 5)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_reserve(self):
+        with patch("pylti1p3.rate_limiter.time.monotonic", return_value=100.0):
+            limiter = RateLimiter(rate=2, burst=2)
+            delays = [limiter.reserve() for _ in range(4)]
+
+        self.assertEqual(delays, [0.0, 0.0, 0.5, 1.0])
+
+    def test_tokens_are_refilled(self):
+        with patch("pylti1p3.rate_limiter.time.monotonic", return_value=100.0):
+            limiter = RateLimiter(rate=2, burst=2)
+            limiter.reserve()
+            limiter.reserve()
+        with patch("pylti1p3.rate_limiter.time.monotonic", return_value=101.0):
+            self.assertEqual(limiter.reserve(), 0.0)
+
+
+class TestServiceConnectorRetries(unittest.TestCase):
+    iss = "https://canvas.instructure.com"
+    url = "http://canvas.docker/api/lti/courses/1/line_items"
+
+    def setUp(self):
+        registration = get_test_tool_conf().find_registration(self.iss)
+        assert registration is not None
+        self.connector = ServiceConnector(registration).set_retry_policy(RetryPolicy(max_retries=2))
+
+    def tearDown(self):
+        ServiceConnector.remove_rate_limit(self.iss)
+
+    def _mock_token(self, m, responses=None):
+        m.post(
+            TOOL_CONFIG[self.iss]["auth_token_url"],
+            responses or [{"text": json.dumps({"access_token": "token"})}],
+        )
+
+    def test_get_is_retried(self):
+        with patch("pylti1p3.service_connector.time.sleep") as sleep:
+            with requests_mock.Mocker() as m:
+                self._mock_token(m)
+                m.get(self.url, [{"status_code": 503, "headers": {"Retry-After": "2"}}, {"text": "[]"}])
+                response = self.connector.make_service_request(["scope"], self.url)
+
+        self.assertEqual(response["body"], [])
+        sleep.assert_called_once_with(2.0)
+
+    def test_post_is_not_retried_after_server_error(self):
+        with patch("pylti1p3.service_connector.time.sleep") as sleep:
+            with requests_mock.Mocker() as m:
+                self._mock_token(m)
+                m.post(self.url, [{"status_code": 503}, {"text": "{}"}])
+                with self.assertRaises(LtiServiceException):
+                    self.connector.make_service_request(["scope"], self.url, method="POST", data="{}")
+
+        sleep.assert_not_called()
+
+    def test_throttled_post_is_retried(self):
+        with patch("pylti1p3.service_connector.time.sleep"):
+            with requests_mock.Mocker() as m:
+                self._mock_token(m)
+                m.post(self.url, [{"status_code": 429}, {"text": "{}"}])
+                response = self.connector.make_service_request(["scope"], self.url, method="POST", data="{}")
+
+        self.assertEqual(response["body"], {})
+
+    def test_access_token_request_is_retried(self):
+        with patch("pylti1p3.service_connector.time.sleep"):
+            with requests_mock.Mocker() as m:
+                self._mock_token(m, [{"status_code": 502}, {"text": json.dumps({"access_token": "token"})}])
+                self.assertEqual(self.connector.get_access_token(["scope"]), "token")
+
+    def test_gives_up_after_max_retries(self):
+        with patch("pylti1p3.service_connector.time.sleep") as sleep:
+            with requests_mock.Mocker() as m:
+                self._mock_token(m)
+                m.get(self.url, status_code=500)
+                with self.assertRaises(LtiServiceException):
+                    self.connector.make_service_request(["scope"], self.url)
+
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_rate_limit(self):
+        ServiceConnector.set_rate_limit(self.iss, rate=1, burst=1)
+        with patch("pylti1p3.rate_limiter.time.sleep") as sleep:
+            with requests_mock.Mocker() as m:
+                self._mock_token(m)
+                m.get(self.url, text="[]")
+                self.connector.make_service_request(["scope"], self.url)
+                self.connector.make_service_request(["scope"], self.url)
+
+        # Token request + 2 requests in a bucket of 1 request per second
+        self.assertEqual(sleep.call_count, 2)
@@ -1,6 +1,6 @@
 import unittest
 
-from pylti1p3.roles import StudentRole, TeacherRole
+from pylti1p3.roles import BUILTIN_ROLE_CLASSES, AbstractRole, RoleIndex, StudentRole, TeacherRole
 
 
 class TestRoles(unittest.TestCase):
@@ -23,3 +23,30 @@ class TestRoles(unittest.TestCase):
         }
 
         self.assertTrue(TeacherRole(jwt_body).check())
+
+    def test_role_index_matches_role_checks(self):
+        role_strs = [
+            "http://purl.imsglobal.org/vocab/lis/v2/institution/person#Instructor",
+            "http://purl.imsglobal.org/vocab/lis/v2/system/person#SysAdmin",
+            "http://purl.imsglobal.org/vocab/lis/v2/membership#Learner",
+            "http://purl.imsglobal.org/vocab/lis/v2/membership/Instructor#TeachingAssistant",
+            "http://purl.imsglobal.org/vocab/lis/v2/unknown/person#Mentor",
+            "Instructor",
+            "Transient",
+        ]
+        role_sets = [[role_str] for role_str in role_strs] + [role_strs[:2], role_strs[:3], []]
+
+        for jwt_roles in role_sets:
+            role_index = RoleIndex(jwt_roles)
+            jwt_body = {"https://purl.imsglobal.org/spec/lti/claim/roles": jwt_roles}
+            for role_cls in BUILTIN_ROLE_CLASSES:
+                with self.subTest(roles=jwt_roles, role=role_cls.__name__):
+                    self.assertEqual(role_index.check(role_cls), role_cls(jwt_body).check())
+
+    def test_role_index_custom_role(self):
+        class LibrarianRole(AbstractRole):
+            _institution_roles = ("Librarian",)
+
+        role_index = RoleIndex(["http://purl.imsglobal.org/vocab/lis/v2/institution/person#Librarian"])
+        self.assertTrue(role_index.check(LibrarianRole))
+        self.assertFalse(role_index.check(StudentRole))
@@ -1,12 +1,18 @@
 import importlib.util
+import json
 import pathlib
 import sys
+import threading
+import time
 import types
 import unittest
-from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import requests_mock
 
 from pylti1p3.service_connector import ServiceConnector
 
+from .cache import Cache, FakeCacheDataStorage
 from .tool_config import get_test_tool_conf
 
 
@@ -52,7 +58,7 @@ class TestServiceConnectorCache(unittest.TestCase):
         )
         connector_cls = module.FlaskServiceConnector
         connector_cls.access_tokens = {
-            "scope": ("token", datetime.now() + timedelta(seconds=60)),
+            "scope": {"access_token": "token", "expires_at": time.time() + 60},
         }
         tool_conf = get_test_tool_conf()
         registration = tool_conf.find_registration("https://canvas.instructure.com")
@@ -68,7 +74,7 @@ class TestServiceConnectorCache(unittest.TestCase):
         )
         connector_cls = module.FastAPIServiceConnector
         connector_cls.access_tokens = {
-            "scope": ("token", datetime.now() - timedelta(seconds=1)),
+            "scope": {"access_token": "token", "expires_at": time.time() - 1},
         }
         tool_conf = get_test_tool_conf()
         registration = tool_conf.find_registration("https://canvas.instructure.com")
@@ -76,3 +82,240 @@ class TestServiceConnectorCache(unittest.TestCase):
         connector = connector_cls(registration)
 
         self.assertIsNone(connector._get_cached_access_token("scope"))  # pylint: disable=protected-access
+
+    def test_framework_connectors_use_data_storage(self):
+        module = load_module(
+            "pylti1p3.contrib.flask.service_connector",
+            "pylti1p3/contrib/flask/service_connector.py",
+        )
+        connector_cls = module.FlaskServiceConnector
+        connector_cls.access_tokens = {}
+        tool_conf = get_test_tool_conf()
+        registration = tool_conf.find_registration("https://canvas.instructure.com")
+        assert registration is not None
+        data_storage = FakeCacheDataStorage()
+        connector = connector_cls(registration).set_access_token_caching(data_storage)
+
+        with patch("pylti1p3.service_connector.time.time", return_value=1000.0):
+            connector._cache_access_token("scope", "token", 60)  # pylint: disable=protected-access
+
+        self.assertEqual(connector_cls.access_tokens, {})
+        token_data = data_storage.get_value("access-token-scope")
+        self.assertEqual(token_data, {"access_token": "token", "expires_at": 1050.0})
+
+    def test_django_connector_falls_back_to_django_cache(self):
+        self.enterContext(patch.dict(sys.modules))
+        module = load_module(
+            "pylti1p3.contrib.django.service_connector",
+            "pylti1p3/contrib/django/service_connector.py",
+        )
+        django_cache = Cache()
+        self.enterContext(patch.object(module, "cache", django_cache))
+        tool_conf = get_test_tool_conf()
+        registration = tool_conf.find_registration("https://canvas.instructure.com")
+        assert registration is not None
+
+        module.DjangoServiceConnector(registration)._cache_access_token("scope", "token", 60)  # pylint: disable=protected-access
+
+        other_connector = module.DjangoServiceConnector(registration)
+        self.assertEqual(other_connector._get_cached_access_token("scope"), "token")  # pylint: disable=protected-access
+        self.assertEqual(django_cache.get("lti1p3-access-token-scope")["access_token"], "token")
+
+    def test_base_connector_ignores_expired_tokens(self):
+        tool_conf = get_test_tool_conf()
+        registration = tool_conf.find_registration("https://canvas.instructure.com")
+        assert registration is not None
+        connector = ServiceConnector(registration)
+
+        with patch("pylti1p3.service_connector.time.time", return_value=1000.0):
+            connector._cache_access_token("scope", "token", 60)  # pylint: disable=protected-access
+        with patch("pylti1p3.service_connector.time.time", return_value=1049.0):
+            self.assertEqual(connector._get_cached_access_token("scope"), "token")  # pylint: disable=protected-access
+        with patch("pylti1p3.service_connector.time.time", return_value=1051.0):
+            self.assertIsNone(connector._get_cached_access_token("scope"))  # pylint: disable=protected-access
+
+    def test_connectors_share_tokens_through_data_storage(self):
+        tool_conf = get_test_tool_conf()
+        registration = tool_conf.find_registration("https://canvas.instructure.com")
+        assert registration is not None
+        data_storage = FakeCacheDataStorage()
+        scopes = ["https://purl.imsglobal.org/spec/lti-ags/scope/lineitem.readonly"]
+
+        with requests_mock.Mocker() as m:
+            m.post(
+                "http://canvas.docker/login/oauth2/token",
+                text=json.dumps({"access_token": "shared-token", "expires_in": 3600}),
+            )
+            first = ServiceConnector(registration).set_access_token_caching(data_storage)
+            second = ServiceConnector(registration).set_access_token_caching(data_storage)
+
+            self.assertEqual(first.get_access_token(scopes), "shared-token")
+            self.assertEqual(second.get_access_token(scopes), "shared-token")
+            self.assertEqual(m.call_count, 1)
+
+    def test_framework_launches_use_framework_connectors(self):
+        # pylint: disable=import-outside-toplevel
+        from pylti1p3.contrib.flask import FlaskMessageLaunch
+
+        tool_conf = get_test_tool_conf()
+        registration = tool_conf.find_registration("https://canvas.instructure.com")
+        launch = FlaskMessageLaunch.__new__(FlaskMessageLaunch)
+        launch._registration = registration  # pylint: disable=protected-access
+        launch._requests_session = None  # pylint: disable=protected-access
+        launch._service_connector = None  # pylint: disable=protected-access
+
+        # Compare by name: other tests load the contrib connector modules on their own
+        self.assertEqual(type(launch.get_service_connector()).__name__, "FlaskServiceConnector")
+
+
+class TestServiceConnectorSingleFlight(unittest.TestCase):
+    scopes = ["https://purl.imsglobal.org/spec/lti-ags/scope/score"]
+    auth_token_url = "http://canvas.docker/login/oauth2/token"
+
+    def _get_registration(self):
+        tool_conf = get_test_tool_conf()
+        registration = tool_conf.find_registration("https://canvas.instructure.com")
+        assert registration is not None
+        return registration
+
+    def test_concurrent_requests_fetch_token_once(self):
+        registration = self._get_registration()
+        data_storage = FakeCacheDataStorage()
+
+        def token_response(request, context):  # pylint: disable=unused-argument
+            time.sleep(0.2)
+            return json.dumps({"access_token": "token", "expires_in": 3600})
+
+        with requests_mock.Mocker() as m:
+            m.post(self.auth_token_url, text=token_response)
+            results = []
+
+            def worker():
+                connector = ServiceConnector(registration).set_access_token_caching(data_storage)
+                results.append(connector.get_access_token(self.scopes))
+
+            threads = [threading.Thread(target=worker) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(results, ["token"] * 5)
+            self.assertEqual(m.call_count, 1)
+
+    def test_distributed_lock_waits_for_token_from_another_node(self):
+        registration = self._get_registration()
+        data_storage = FakeCacheDataStorage()
+        connector = ServiceConnector(registration).set_access_token_caching(
+            data_storage, distributed_lock=True, lock_timeout=5
+        )
+        connector._access_token_lock_poll_interval = 0.01  # pylint: disable=protected-access
+        scope_key = connector._scope_key(self.scopes)  # pylint: disable=protected-access
+        other_node = ServiceConnector(registration).set_access_token_caching(data_storage)
+        data_storage.set_value("access-token-" + scope_key + "-lock", True)
+        timer = threading.Timer(
+            0.1,
+            other_node._cache_access_token,  # pylint: disable=protected-access
+            args=(scope_key, "token-from-another-node", 3600),
+        )
+
+        with requests_mock.Mocker() as m:
+            m.post(self.auth_token_url, text=json.dumps({"access_token": "token", "expires_in": 3600}))
+            timer.start()
+            self.assertEqual(connector.get_access_token(self.scopes), "token-from-another-node")
+            self.assertEqual(m.call_count, 0)
+
+    def test_distributed_lock_with_framework_connector(self):
+        module = load_module(
+            "pylti1p3.contrib.flask.service_connector",
+            "pylti1p3/contrib/flask/service_connector.py",
+        )
+        registration = self._get_registration()
+        data_storage = FakeCacheDataStorage()
+        connector = module.FlaskServiceConnector(registration).set_access_token_caching(
+            data_storage, distributed_lock=True, lock_timeout=5
+        )
+        connector._access_token_lock_poll_interval = 0.01  # pylint: disable=protected-access
+        scope_key = connector._scope_key(self.scopes)  # pylint: disable=protected-access
+        other_node = module.FlaskServiceConnector(registration).set_access_token_caching(data_storage)
+        data_storage.set_value("access-token-" + scope_key + "-lock", True)
+        timer = threading.Timer(
+            0.1,
+            other_node._cache_access_token,  # pylint: disable=protected-access
+            args=(scope_key, "token-from-another-node", 3600),
+        )
+
+        with requests_mock.Mocker() as m:
+            m.post(self.auth_token_url, text=json.dumps({"access_token": "token", "expires_in": 3600}))
+            started_at = time.time()
+            timer.start()
+            self.assertEqual(connector.get_access_token(self.scopes), "token-from-another-node")
+            self.assertLess(time.time() - started_at, 1)
+            self.assertEqual(m.call_count, 0)
+
+    def test_distributed_lock_with_overridden_token_cache(self):
+        tokens = {}
+
+        class CustomServiceConnector(ServiceConnector):
+            def _get_cached_access_token(self, scope_key):
+                return tokens.get(scope_key)
+
+            def _cache_access_token(self, scope_key, access_token, expires_in):
+                tokens[scope_key] = access_token
+
+        registration = self._get_registration()
+        data_storage = FakeCacheDataStorage()
+        connector = CustomServiceConnector(registration).set_access_token_caching(
+            data_storage, distributed_lock=True, lock_timeout=5
+        )
+        connector._access_token_lock_poll_interval = 0.01  # pylint: disable=protected-access
+        scope_key = connector._scope_key(self.scopes)  # pylint: disable=protected-access
+        data_storage.set_value("access-token-" + scope_key + "-lock", True)
+        timer = threading.Timer(0.1, tokens.__setitem__, args=(scope_key, "token-from-another-node"))
+
+        with requests_mock.Mocker() as m:
+            m.post(self.auth_token_url, text=json.dumps({"access_token": "token", "expires_in": 3600}))
+            started_at = time.time()
+            timer.start()
+            self.assertEqual(connector.get_access_token(self.scopes), "token-from-another-node")
+            self.assertLess(time.time() - started_at, 1)
+            self.assertEqual(m.call_count, 0)
+
+    def test_refresh_ahead_returns_current_token_and_refreshes_in_background(self):
+        registration = self._get_registration()
+        data_storage = FakeCacheDataStorage()
+        connector = (
+            ServiceConnector(registration).set_access_token_caching(data_storage).set_access_token_refresh_ahead(60)
+        )
+        scope_key = connector._scope_key(self.scopes)  # pylint: disable=protected-access
+        connector._cache_access_token(scope_key, "old-token", 30)  # pylint: disable=protected-access
+
+        with requests_mock.Mocker() as m:
+            m.post(self.auth_token_url, text=json.dumps({"access_token": "new-token", "expires_in": 3600}))
+            self.assertEqual(connector.get_access_token(self.scopes), "old-token")
+            for _ in range(100):
+                if connector._get_cached_access_token(scope_key) == "new-token":  # pylint: disable=protected-access
+                    break
+                time.sleep(0.01)
+            self.assertEqual(connector.get_access_token(self.scopes), "new-token")
+            self.assertEqual(m.call_count, 1)
+
+    def test_refresh_ahead_with_framework_connector(self):
+        module = load_module(
+            "pylti1p3.contrib.fastapi.service_connector",
+            "pylti1p3/contrib/fastapi/service_connector.py",
+        )
+        module.FastAPIServiceConnector.access_tokens = {}
+        connector = module.FastAPIServiceConnector(self._get_registration()).set_access_token_refresh_ahead(60)
+        scope_key = connector._scope_key(self.scopes)  # pylint: disable=protected-access
+        connector._cache_access_token(scope_key, "old-token", 30)  # pylint: disable=protected-access
+
+        with requests_mock.Mocker() as m:
+            m.post(self.auth_token_url, text=json.dumps({"access_token": "new-token", "expires_in": 3600}))
+            self.assertEqual(connector.get_access_token(self.scopes), "old-token")
+            for _ in range(100):
+                if connector._get_cached_access_token(scope_key) == "new-token":  # pylint: disable=protected-access
+                    break
+                time.sleep(0.01)
+            self.assertEqual(connector.get_access_token(self.scopes), "new-token")
+            self.assertEqual(m.call_count, 1)
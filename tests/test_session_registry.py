@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import patch
+
+import requests
+import requests_mock
+
+from pylti1p3.jwks_manager import JwksManager
+from pylti1p3.service_connector import REQUESTS_USER_AGENT, ServiceConnector
+from pylti1p3.session_registry import SessionRegistry, default_session_registry
+
+from .tool_config import get_test_tool_conf
+
+
+class TestSessionRegistry(unittest.TestCase):
+    def test_sessions_are_shared_per_key(self):
+        registry = SessionRegistry()
+
+        session = registry.get_session("https://canvas.instructure.com")
+        self.assertIs(registry.get_session("https://canvas.instructure.com"), session)
+        self.assertIs(registry.get_session("https://Canvas.instructure.com/api/lti/security/jwks"), session)
+        self.assertIsNot(registry.get_session("https://moodle.example.com"), session)
+        self.assertIsNot(registry.get_session("http://canvas.instructure.com"), session)
+        self.assertEqual(session.headers["User-Agent"], REQUESTS_USER_AGENT)
+
+    def test_adapter_settings(self):
+        registry = SessionRegistry(pool_connections=4, pool_maxsize=64, timeout=(1.0, 2.0))
+        adapter = registry.get_session().get_adapter("https://canvas.instructure.com")
+
+        self.assertEqual(adapter._pool_maxsize, 64)  # pylint: disable=protected-access
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 64)
+        request = requests.Request("GET", "https://canvas.instructure.com/api").prepare()
+        with patch("requests.adapters.HTTPAdapter.send") as send:
+            adapter.send(request)
+            adapter.send(request, timeout=10)
+
+        self.assertEqual(send.call_args_list[0].kwargs["timeout"], (1.0, 2.0))
+        self.assertEqual(send.call_args_list[1].kwargs["timeout"], 10)
+
+    def test_cookies_are_not_stored(self):
+        session = SessionRegistry().get_session()
+        with requests_mock.Mocker() as m:
+            m.get("https://canvas.instructure.com/api", text="{}", headers={"Set-Cookie": "sid=1; Path=/"})
+            session.get("https://canvas.instructure.com/api")
+
+        self.assertEqual(len(session.cookies), 0)
+
+    def test_sessions_are_dropped_after_fork(self):
+        registry = SessionRegistry()
+        session = registry.get_session()
+
+        with patch("pylti1p3.session_registry.os.getpid", return_value=-1):
+            self.assertIsNot(registry.get_session(), session)
+
+    def test_services_use_registry_by_default(self):
+        iss = "https://canvas.instructure.com"
+        registration = get_test_tool_conf().find_registration(iss)
+        assert registration is not None
+
+        session = default_session_registry.get_session(iss)
+        # pylint: disable=protected-access
+        self.assertIs(ServiceConnector(registration)._requests_session, session)
+        self.assertIs(JwksManager()._get_requests_session("https://canvas.instructure.com/jwks"), session)
@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import patch
+
+import jwt
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, padding
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+
+from pylti1p3.deep_link import DeepLink
+from pylti1p3.exception import LtiConfigurationException
+from pylti1p3.registration import Registration
+from pylti1p3.service_connector import ServiceConnector
+from pylti1p3.signer import ExternalSigner, PrivateKeySigner
+
+from .tool_config import PRIVATE_KEY, PUBLIC_KEY, get_test_tool_conf
+
+
+def kms_sign(signing_input: bytes) -> bytes:
+    private_key = serialization.load_pem_private_key(PRIVATE_KEY.encode("utf-8"), password=None)
+    return private_key.sign(signing_input, padding.PKCS1v15(), hashes.SHA256())  # type: ignore
+
+
+class TestSigner(unittest.TestCase):
+    def test_private_key_is_parsed_once(self):
+        signer = PrivateKeySigner.from_pem(PRIVATE_KEY, kid="kid-1")
+
+        self.assertIs(PrivateKeySigner.from_pem(PRIVATE_KEY, kid="kid-1"), signer)
+        token = signer.encode_jwt({"sub": "1"})
+        self.assertEqual(jwt.get_unverified_header(token)["kid"], "kid-1")
+        self.assertEqual(jwt.decode(token, PUBLIC_KEY, algorithms=["RS256"]), {"sub": "1"})
+
+    def test_external_signer(self):
+        token = ExternalSigner(kms_sign, kid="kms-key").encode_jwt({"sub": "1"}, {"typ": "JWT"})
+
+        self.assertEqual(jwt.get_unverified_header(token), {"alg": "RS256", "typ": "JWT", "kid": "kms-key"})
+        self.assertEqual(jwt.decode(token, PUBLIC_KEY, algorithms=["RS256"]), {"sub": "1"})
+
+    def test_external_ecdsa_signer(self):
+        private_key = ec.generate_private_key(ec.SECP384R1())
+
+        def kms_sign_der(signing_input: bytes) -> bytes:
+            return private_key.sign(signing_input, ec.ECDSA(hashes.SHA384()))
+
+        def kms_sign_raw(signing_input: bytes) -> bytes:
+            r, s = decode_dss_signature(kms_sign_der(signing_input))
+            return r.to_bytes(48, "big") + s.to_bytes(48, "big")
+
+        for sign in (kms_sign_der, kms_sign_raw):
+            token = ExternalSigner(sign, algorithm="ES384").encode_jwt({"sub": "1"})
+            self.assertEqual(jwt.decode(token, private_key.public_key(), algorithms=["ES384"]), {"sub": "1"})
+
+    def test_external_signer_rejects_unsupported_algorithm(self):
+        with self.assertRaisesRegex(LtiConfigurationException, "Unsupported algorithm"):
+            ExternalSigner(kms_sign, algorithm="HS256")
+
+    def test_missing_kid_is_cached(self):
+        registration = Registration().set_tool_public_key(PUBLIC_KEY)
+        Registration._kids.clear()  # pylint: disable=protected-access
+        with patch.object(Registration, "get_jwk", return_value={}) as get_jwk:
+            self.assertIsNone(registration.get_kid())
+            self.assertIsNone(registration.get_kid())
+        get_jwk.assert_called_once()
+        Registration._kids.clear()  # pylint: disable=protected-access
+
+    def test_registration_uses_custom_signer(self):
+        tool_conf = get_test_tool_conf()
+        tool_conf.set_signer("https://canvas.instructure.com", ExternalSigner(kms_sign, kid="kms-key"))
+        registration = tool_conf.find_registration("https://canvas.instructure.com")
+        assert registration is not None
+
+        assertion = ServiceConnector(registration).encode_jwt({"sub": "1"})
+        deep_link_jwt = DeepLink(registration, "deployment", {}).encode_jwt({"sub": "1"})  # type: ignore
+
+        for token in (assertion, deep_link_jwt):
+            self.assertEqual(jwt.get_unverified_header(token)["kid"], "kms-key")
+            self.assertEqual(jwt.decode(token, PUBLIC_KEY, algorithms=["RS256"]), {"sub": "1"})
+
+    def test_default_signer_adds_registration_kid(self):
+        registration = get_test_tool_conf().find_registration("https://canvas.instructure.com")
+        assert registration is not None
+
+        token = ServiceConnector(registration).encode_jwt({"sub": "1"})
+
+        self.assertEqual(jwt.get_unverified_header(token)["kid"], registration.get_kid())
@@ -1,3 +1,12 @@
+import json
+from unittest.mock import patch
+
+import starlette.requests
+
+from pylti1p3.contrib.fastapi import jwks_view_response
+from pylti1p3.registration import Registration
+from pylti1p3.utils import etag_matches
+
 from .base import TestServicesBase
 from .tool_config import get_test_tool_conf
 
@@ -31,3 +40,34 @@ class TestToolConf(TestServicesBase):
         tc_extended = get_test_tool_conf(tool_conf_extended=True)
         jwks = tc_extended.get_jwks("https://canvas.instructure.com", client_id="10000000000004")
         self.assertEqual(jwks, expected_jwks)
+
+    def test_get_jwks_response(self):
+        tc = get_test_tool_conf()
+        iss = "https://canvas.instructure.com"
+        response = tc.get_jwks_response(iss)
+        self.assertEqual(json.loads(response["body"]), tc.get_jwks(iss))
+        self.assertEqual(response["cache_control"], "public, max-age=600")
+        self.assertTrue(etag_matches(f'W/"other", {response["etag"]}', response["etag"]))
+        self.assertFalse(etag_matches('"other"', response["etag"]))
+
+        with patch.object(Registration, "get_jwk", side_effect=AssertionError("JWKS is rebuilt")):
+            self.assertIs(tc.get_jwks_response(iss), response)
+
+        tc.set_public_key(iss, tc.get_public_key(iss))
+        self.assertIsNot(tc.get_jwks_response(iss), response)
+        self.assertEqual(tc.get_jwks_response(iss)["etag"], response["etag"])
+
+    def test_jwks_view_response(self):
+        tc = get_test_tool_conf()
+
+        def get_request(headers):
+            return starlette.requests.Request({"type": "http", "method": "GET", "path": "/jwks", "headers": headers})
+
+        response = jwks_view_response(get_request([]), tc)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.body), tc.get_jwks())
+        self.assertEqual(response.headers["cache-control"], "public, max-age=600")
+
+        response = jwks_view_response(get_request([(b"if-none-match", response.headers["etag"].encode())]), tc)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.body, b"")
@@ -0,0 +1,114 @@
+import unittest
+from unittest.mock import MagicMock
+
+from pylti1p3.exception import LtiException
+from pylti1p3.message_launch import MessageLaunch
+from pylti1p3.message_validators import (
+    MessageValidatorAbstract,
+    ResourceMessageValidator,
+    ValidatorRegistry,
+    default_validator_registry,
+    get_validators,
+)
+
+from . import test_resource_link
+
+
+class StartProctoringValidator(MessageValidatorAbstract):
+    message_type = "LtiStartProctoring"
+
+    def validate(self, jwt_body) -> bool:
+        self.run_common_validators(jwt_body)
+        if "https://purl.imsglobal.org/spec/lti-ap/claim/session_data" not in jwt_body:
+            raise LtiException("Missing session data")
+        return True
+
+
+class StartProctoringFallbackValidator(StartProctoringValidator):
+    message_type = None
+
+    def can_validate(self, jwt_body) -> bool:
+        return jwt_body.get("https://purl.imsglobal.org/spec/lti/claim/message_type") in (
+            "LtiStartProctoring",
+            "LtiEndAssessment",
+        )
+
+
+class FakeMessageLaunch(MessageLaunch):
+    def _get_request_param(self, key):
+        return None
+
+
+class ProctoringMessageLaunch(FakeMessageLaunch):
+    _validator_registry = ValidatorRegistry(get_validators() + [StartProctoringValidator()])
+
+
+class TestValidatorRegistry(unittest.TestCase):
+    jwt_body = test_resource_link.ResourceLinkBase.expected_message_launch_data
+
+    def _get_launch(self, launch_cls, jwt_body):
+        launch = launch_cls(MagicMock(), MagicMock(), MagicMock(), MagicMock())
+        return launch.set_auto_validation(enable=False).set_jwt({"body": jwt_body})
+
+    def test_dispatch(self):
+        validator = default_validator_registry.get_validator("LtiResourceLinkRequest")
+        self.assertIsInstance(validator, ResourceMessageValidator)
+        self.assertIs(default_validator_registry.get_validator("LtiResourceLinkRequest"), validator)
+        self.assertIsNone(default_validator_registry.get_validator("LtiStartProctoring"))
+        self.assertIsNone(default_validator_registry.get_validator(None))
+
+    def test_register(self):
+        registry = ValidatorRegistry([ResourceMessageValidator()])
+        with self.assertRaisesRegex(LtiException, "Validator conflict"):
+            registry.register(ResourceMessageValidator())
+
+        validator = registry.register(ResourceMessageValidator(), replace=True)
+        self.assertIs(registry.get_validator("LtiResourceLinkRequest"), validator)
+        fallback_validator = registry.register(StartProctoringFallbackValidator())
+        self.assertEqual(registry.get_validators(), [validator, fallback_validator])
+        registry.unregister("LtiResourceLinkRequest")
+        registry.unregister_validator(fallback_validator)
+        self.assertEqual(registry.get_validators(), [])
+
+    def test_can_validate_fallback(self):
+        jwt_body = dict(
+            self.jwt_body,
+            **{
+                "https://purl.imsglobal.org/spec/lti/claim/message_type": "LtiStartProctoring",
+                "https://purl.imsglobal.org/spec/lti-ap/claim/session_data": "session-data",
+            },
+        )
+        registry = ValidatorRegistry(get_validators())
+        self.assertIsNone(registry.find_validator(jwt_body))
+        fallback_validator = registry.register(StartProctoringFallbackValidator())
+        self.assertIs(registry.find_validator(jwt_body), fallback_validator)
+        self.assertIs(registry.find_validator(self.jwt_body), registry.get_validator("LtiResourceLinkRequest"))
+
+        class FallbackMessageLaunch(FakeMessageLaunch):
+            _validator_registry = registry
+
+        launch = self._get_launch(FallbackMessageLaunch, jwt_body)
+        self.assertIs(launch.validate_message(), launch)
+
+    def test_custom_message_type(self):
+        jwt_body = dict(
+            self.jwt_body,
+            **{
+                "https://purl.imsglobal.org/spec/lti/claim/message_type": "LtiStartProctoring",
+                "https://purl.imsglobal.org/spec/lti-ap/claim/session_data": "session-data",
+            },
+        )
+        with self.assertRaisesRegex(LtiException, "Unrecognized message type"):
+            self._get_launch(FakeMessageLaunch, jwt_body).validate_message()
+
+        launch = self._get_launch(ProctoringMessageLaunch, jwt_body)
+        launch.validate_message()
+        self.assertFalse(launch.is_resource_launch())
+
+        del jwt_body["https://purl.imsglobal.org/spec/lti-ap/claim/session_data"]
+        with self.assertRaisesRegex(LtiException, "Missing session data"):
+            self._get_launch(ProctoringMessageLaunch, jwt_body).validate_message()
+
+        resource_launch = self._get_launch(ProctoringMessageLaunch, self.jwt_body)
+        self.assertIs(resource_launch.validate_message(), resource_launch)
+        self.assertTrue(resource_launch.is_resource_launch())